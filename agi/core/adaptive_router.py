@@ -0,0 +1,114 @@
+# agi/core/adaptive_router.py
+"""Latency-aware model routing (v0.1d).
+Keeps rolling latency / error / in-flight figures per model key, fed from model receipts, and picks
+among policy-allowed alternatives the key with the lowest expected latency. The router only ranks
+the candidates it is given: routing policy (task table, high-sensitivity overrides) is applied by
+the caller before it gets here.
+
+expected latency = mean successful latency * (1 + in-flight calls) + error rate * error_penalty_ms
+
+A key needs `min_samples` recent samples (younger than `max_age_s`) to be ranked. Until the static
+key has them the static route is kept, so a key that was routed away from is sampled again once
+its old figures age out.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+@dataclass
+class KeyStats:
+    samples: Deque[Tuple[float, float, bool]] = field(default_factory=deque)  # (at, latency_ms, ok)
+    in_flight: int = 0
+
+class AdaptiveRouter:
+    def __init__(
+        self,
+        window: int = 50,
+        min_samples: int = 5,
+        max_age_s: float = 300.0,
+        error_penalty_ms: float = 5000.0,
+    ):
+        self.window = window
+        self.min_samples = min_samples
+        self.max_age_s = max_age_s
+        self.error_penalty_ms = error_penalty_ms
+        self._lock = threading.Lock()
+        self._stats: Dict[str, KeyStats] = {}
+
+    def _key_stats(self, key: str) -> KeyStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = KeyStats(samples=deque(maxlen=self.window))
+        return stats
+
+    # ---- feeding ----
+
+    def begin(self, key: str) -> None:
+        with self._lock:
+            self._key_stats(key).in_flight += 1
+
+    def end(self, key: str, latency_ms: Optional[float] = None, ok: bool = True) -> None:
+        """Finish an in-flight call; `latency_ms=None` (e.g. a cache hit) records no sample."""
+        with self._lock:
+            stats = self._key_stats(key)
+            stats.in_flight = max(0, stats.in_flight - 1)
+            if latency_ms is not None:
+                stats.samples.append((time.time(), float(latency_ms), ok))
+
+    def record(self, key: str, receipt: Any) -> None:
+        """Add a finished ModelReceipt that was not tracked with begin()."""
+        if getattr(receipt, "cache_hit", False):
+            return
+        with self._lock:
+            self._key_stats(key).samples.append((time.time(), float(receipt.latency_ms), receipt.status == "success"))
+
+    # ---- ranking ----
+
+    def estimate(self, key: str) -> Dict[str, Any]:
+        with self._lock:
+            stats = self._key_stats(key)
+            cutoff = time.time() - self.max_age_s
+            recent = [(lat, ok) for at, lat, ok in stats.samples if at >= cutoff]
+            in_flight = stats.in_flight
+        ok_latencies = [lat for lat, ok in recent if ok]
+        error_rate = (len(recent) - len(ok_latencies)) / len(recent) if recent else 0.0
+        row: Dict[str, Any] = {
+            "samples": len(recent),
+            "in_flight": in_flight,
+            "error_rate": round(error_rate, 3),
+            "mean_latency_ms": round(sum(ok_latencies) / len(ok_latencies), 1) if ok_latencies else None,
+            "expected_ms": None,
+        }
+        if len(recent) >= self.min_samples:
+            base = row["mean_latency_ms"] if row["mean_latency_ms"] is not None else self.error_penalty_ms
+            row["expected_ms"] = round(base * (1 + in_flight) + error_rate * self.error_penalty_ms, 1)
+        return row
+
+    def choose(self, static_key: str, candidates: List[str]) -> Tuple[str, Dict[str, Any]]:
+        """Pick from `candidates` (which must include `static_key`); returns (key, explanation)."""
+        estimates = {key: self.estimate(key) for key in candidates}
+        decision: Dict[str, Any] = {"static_key": static_key, "chosen_key": static_key, "candidates": estimates}
+        if estimates[static_key]["expected_ms"] is None:
+            decision["reason"] = f"static route kept: '{static_key}' has fewer than {self.min_samples} recent samples"
+            return static_key, decision
+        ranked = sorted(
+            (row["expected_ms"], key != static_key, key) for key, row in estimates.items() if row["expected_ms"] is not None
+        )
+        best_ms, _, best = ranked[0]
+        decision["chosen_key"] = best
+        if best == static_key:
+            decision["reason"] = f"static route kept: '{static_key}' has the lowest expected latency ({best_ms} ms)"
+        else:
+            decision["reason"] = (
+                f"rerouted to '{best}': expected {best_ms} ms vs {estimates[static_key]['expected_ms']} ms on '{static_key}'"
+            )
+        return best, decision
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            keys = list(self._stats)
+        return {key: self.estimate(key) for key in keys}
@@ -9,10 +9,7 @@ try:
 except ImportError:  # minimal fallback
     yaml = None
 
-try:
-    import requests  # type: ignore
-except ImportError:
-    requests = None
+from .provider_clients import CLIENTS, requests
 
 DEFAULT_MODEL = os.getenv("TRIAD_MODEL_NAME", "llama3.2:3b")
 DEFAULT_ENDPOINT = os.getenv("TRIAD_ENDPOINT", "http://localhost:11434")
@@ -81,9 +78,10 @@ def call_model(prompt: str, model: Optional[str] = None, endpoint: Optional[str]
         # Fallback deterministic stub
         return "[]"
     try:
-        resp = requests.post(f"{endpoint}/api/generate", json={"model": model, "prompt": prompt, "stream": False}, timeout=timeout)
-        resp.raise_for_status()
-        data = resp.json()
+        payload = {"model": model, "prompt": prompt, "stream": False}
+        with CLIENTS.post("ollama", endpoint, "/api/generate", json=payload, timeout=timeout) as (resp, _):
+            resp.raise_for_status()
+            data = resp.json()
         return data.get("response", "")
     except Exception as e:
         return json.dumps({"error": f"model_call_failed: {e}"})
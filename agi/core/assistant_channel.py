@@ -1,9 +1,9 @@
 # agi/core/assistant_channel.py
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 import sqlite3
 from .receipt import store_assistant_message, DB_PATH
-from .model_runner import run_model_for_task
+from .model_runner import generate_stream, run_model_for_task
 
 ASSISTANT_SYSTEM_PROMPT = (
     "You are the Sovereign assistant channel.\n"
@@ -51,3 +51,12 @@ def generate_assistant_reply(answer_id: str, receipt_id: str, sovereign_answer:
     reply = run_model_for_task(task_type="discussion", prompt=prompt)
     append_assistant_message(answer_id, receipt_id, reply)
     return reply
+
+def stream_assistant_reply(answer_id: str, receipt_id: str, sovereign_answer: str, new_user_message: str) -> Iterator[str]:
+    """Like generate_assistant_reply, but yields the reply as it is generated; it is stored once complete."""
+    thread = list_thread_messages(answer_id)
+    prompt = build_assistant_prompt(get_assistant_system_prompt(), sovereign_answer, thread, new_user_message)
+    stream = generate_stream(task_type="discussion", prompt=prompt)
+    yield from stream
+    if stream.receipt is not None and stream.receipt.status == "success":
+        append_assistant_message(answer_id, receipt_id, stream.receipt.raw_output)
@@ -1,13 +1,24 @@
 # agi/core/model_runner.py
 """Unified model runner with receipt enrichment (v0.1c).
 Provides forensic metadata (latency, token estimates, cost) for every model invocation.
+Provider calls go through the pooled client registry (provider_clients.CLIENTS), so
+connections are kept alive across generate() calls and threads.
+generate_stream() yields text as the provider produces it and records time-to-first-token;
+generate() is the same call, drained. generate_many() runs a batch concurrently under
+per-provider caps. With `routing_rules.adaptive` enabled, calls may be routed to a
+policy-allowed alternative model with lower expected latency (see route_model_key).
 """
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Literal, Tuple, Optional
-import requests, yaml, time, os
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, List, Literal, Sequence, Tuple, Optional, Union
+import json, yaml, time, os, sqlite3, threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+
+from .adaptive_router import AdaptiveRouter
+from .provider_clients import CLIENTS, ProviderClients
+from .response_cache import ResponseCache, cache_key
 
 # Optional Anthrop ic import (remote provider)
 try:
@@ -18,6 +29,12 @@ except Exception:  # pragma: no cover
 ROOT_DIR = Path(__file__).resolve().parent
 STACK_PATH = ROOT_DIR / "model_stack.yaml"
 _StackCache: Dict[str, Any] | None = None
+_ClientsConfigured = False
+_ResponseCache: ResponseCache | None = None
+_Router: AdaptiveRouter | None = None
+_InitLock = threading.Lock()  # guards first construction of the lazy globals above
+DEFAULT_TIMEOUT_S = 120.0
+DEFAULT_OLLAMA_ENDPOINT = "http://localhost:11434"
 
 Sensitivity = Literal["normal", "high"]
 Provider = Literal["ollama", "cloud-llm", "anthropic"]
@@ -34,6 +51,14 @@ class ModelReceipt:
     status: str  # success|error
     raw_output: str
     error_msg: Optional[str] = None
+    connection_reused: Optional[bool] = None  # None when the provider client cannot tell
+    connection_stats: Optional[Dict[str, Any]] = None  # provider pool totals after this call
+    cache_hit: bool = False
+    original_latency_ms: Optional[int] = None  # latency of the call that produced a cached answer
+    ttft_ms: Optional[int] = None  # time to first token
+    tokens_per_sec: Optional[float] = None  # output tokens/sec after the first token
+    model_key: Optional[str] = None
+    routing: Optional[Dict[str, Any]] = None  # adaptive routing decision and its inputs
 
 PRICING_PER_MILLION = {
     # Example pricing (update as needed)
@@ -54,6 +79,19 @@ def load_model_stack() -> Dict[str, Any]:
             _StackCache = yaml.safe_load(f) or {}
     return _StackCache
 
+def provider_clients() -> ProviderClients:
+    """Shared client registry, with limits from the model stack's `providers:` block applied once."""
+    global _ClientsConfigured
+    if not _ClientsConfigured:
+        with _InitLock:
+            if not _ClientsConfigured:
+                CLIENTS.configure(load_model_stack().get("providers", {}))
+                _ClientsConfigured = True
+    return CLIENTS
+
+def _provider_cfg(provider: str) -> Dict[str, Any]:
+    return load_model_stack().get("providers", {}).get(provider) or {}
+
 def resolve_model_key(task_type: str, sensitivity: Sensitivity) -> Tuple[str, Dict[str, Any]]:
     stack = load_model_stack()
     routing = stack.get("routing_rules", {})
@@ -69,6 +107,58 @@ def resolve_model_key(task_type: str, sensitivity: Sensitivity) -> Tuple[str, Di
         raise ModelRunnerError(f"Model key '{key}' not defined for task '{task_type}'")
     return key, cfg
 
+def adaptive_router() -> Optional[AdaptiveRouter]:
+    """The adaptive router, if `routing_rules.adaptive.enabled` is set in the model stack."""
+    global _Router
+    cfg = load_model_stack().get("routing_rules", {}).get("adaptive") or {}
+    if not cfg.get("enabled"):
+        return None
+    if _Router is None:
+        with _InitLock:
+            if _Router is None:
+                _Router = AdaptiveRouter(
+                    window=cfg.get("window", 50),
+                    min_samples=cfg.get("min_samples", 5),
+                    max_age_s=cfg.get("max_age_s", 300.0),
+                    error_penalty_ms=cfg.get("error_penalty_ms", 5000.0),
+                )
+    return _Router
+
+def _policy_exclusion(key: str, sensitivity: Sensitivity) -> Optional[str]:
+    """Why routing policy forbids `key` as an alternative route (None if allowed)."""
+    stack = load_model_stack()
+    cfg = stack.get("models", {}).get(key)
+    if not cfg:
+        return "model key not defined"
+    if sensitivity == "high":
+        ov = stack.get("routing_rules", {}).get("overrides", {}).get("high_sensitivity", {})
+        if not ov.get("allow_remote", True) and (key == "remote_tier" or cfg.get("provider", "ollama") != "ollama"):
+            return "remote model not allowed under high sensitivity"
+    return None
+
+def route_model_key(task_type: str, sensitivity: Sensitivity) -> Tuple[str, Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Static route from resolve_model_key, then (if enabled) the adaptive choice among the
+    alternatives listed for it under `routing_rules.adaptive.alternatives`.
+    Returns (key, model cfg, decision); the decision is None when adaptive routing is off."""
+    key, cfg = resolve_model_key(task_type, sensitivity)
+    router = adaptive_router()
+    if router is None:
+        return key, cfg, None
+    alternatives = (load_model_stack()["routing_rules"]["adaptive"].get("alternatives") or {}).get(key, [])
+    candidates, excluded = [key], {}
+    for alt in alternatives:
+        reason = _policy_exclusion(alt, sensitivity)
+        if reason:
+            excluded[alt] = reason
+        elif alt not in candidates:
+            candidates.append(alt)
+    chosen, decision = router.choose(key, candidates)
+    decision["task_type"] = task_type
+    decision["sensitivity"] = sensitivity
+    if excluded:
+        decision["excluded"] = excluded
+    return chosen, load_model_stack()["models"][chosen], decision
+
 def _estimate_tokens(text: str) -> int:
     # Rough heuristic: 1 token ? 4 chars or split by spaces; choose smaller for safety
     if not text:
@@ -82,15 +172,18 @@ def _calc_cost(model_id: str, input_toks: int, output_toks: int) -> float:
     cost = (input_toks / 1_000_000 * pricing["input"]) + (output_toks / 1_000_000 * pricing["output"])
     return round(cost, 6)
 
-def call_ollama(model_id: str, prompt: str, **kwargs: Any) -> str:
-    url = "http://localhost:11434/api/generate"
+def _ollama_request(model_id: str, prompt: str, **kwargs: Any) -> Tuple[str, Dict[str, Any]]:
+    endpoint = _provider_cfg("ollama").get("endpoint") or DEFAULT_OLLAMA_ENDPOINT
     payload = {"model": model_id, "prompt": prompt, "stream": False}
     payload.update(kwargs)
-    resp = requests.post(url, json=payload, timeout=120)
-    if resp.status_code != 200:
-        raise ModelRunnerError(f"Ollama HTTP {resp.status_code}: {resp.text}")
-    data = resp.json()
-    return (data.get("response") or data.get("output") or "").strip()
+    with provider_clients().post("ollama", endpoint, "/api/generate", json=payload, timeout=DEFAULT_TIMEOUT_S) as (resp, conn):
+        if resp.status_code != 200:
+            raise ModelRunnerError(f"Ollama HTTP {resp.status_code}: {resp.text}")
+        data = resp.json()
+    return (data.get("response") or data.get("output") or "").strip(), conn
+
+def call_ollama(model_id: str, prompt: str, **kwargs: Any) -> str:
+    return _ollama_request(model_id, prompt, **kwargs)[0]
 
 def call_anthropic(model_id: str, prompt: str, system: str, max_tokens: int = 1024, temperature: float = 0.0) -> Dict[str, Any]:
     if anthropic is None:
@@ -98,78 +191,488 @@ def call_anthropic(model_id: str, prompt: str, system: str, max_tokens: int = 10
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
         raise ModelRunnerError("ANTHROPIC_API_KEY missing from environment")
-    client = anthropic.Anthropic(api_key=api_key)
-    resp = client.messages.create(
-        model=model_id,
-        max_tokens=max_tokens,
-        temperature=temperature,
-        system=system,
-        messages=[{"role": "user", "content": prompt}],
-    )
+    with provider_clients().anthropic_call(api_key, _provider_cfg("anthropic").get("base_url")) as (client, conn):
+        resp = client.messages.create(
+            model=model_id,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=[{"role": "user", "content": prompt}],
+        )
     return {
         "text": resp.content[0].text if resp.content else "",
         "input_tokens": getattr(resp.usage, "input_tokens", 0),
         "output_tokens": getattr(resp.usage, "output_tokens", 0),
+        "connection_reused": conn["connection_reused"],
     }
 
-def generate(
-    task_type: str,
+def _connection_stats(provider: str) -> Optional[Dict[str, Any]]:
+    if provider not in ("ollama", "anthropic"):
+        return None
+    return CLIENTS.stats(provider)
+
+def response_cache() -> ResponseCache:
+    """The response cache configured by the stack's `response_cache:` block (opened on first use)."""
+    global _ResponseCache
+    if _ResponseCache is None:
+        with _InitLock:
+            if _ResponseCache is None:
+                cfg = load_model_stack().get("response_cache") or {}
+                path = Path(cfg.get("path") or "response_cache.sqlite")
+                _ResponseCache = ResponseCache(
+                    path if path.is_absolute() else ROOT_DIR / path,
+                    ttl_seconds=cfg.get("ttl_seconds"),
+                    max_entries=cfg.get("max_entries", 10_000),
+                    max_bytes=cfg.get("max_bytes", 64 * 1024 * 1024),
+                )
+    return _ResponseCache
+
+def _cache_for(cache: Optional[bool], sensitivity: Sensitivity, temperature: float) -> Optional[ResponseCache]:
+    """cache=False bypasses, cache=True opts in, None follows the stack config. Only temperature 0 calls are cached."""
+    if cache is False or temperature != 0.0:
+        return None
+    if cache is None:
+        cfg = load_model_stack().get("response_cache") or {}
+        if not cfg.get("enabled"):
+            return None
+        if sensitivity == "high" and cfg.get("bypass_high_sensitivity", True):
+            return None
+    return response_cache()
+
+def _ollama_stream(model_id: str, prompt: str, usage: Dict[str, Any], timeout: float = DEFAULT_TIMEOUT_S) -> Iterator[str]:
+    endpoint = _provider_cfg("ollama").get("endpoint") or DEFAULT_OLLAMA_ENDPOINT
+    payload = {"model": model_id, "prompt": prompt, "stream": True}
+    with provider_clients().post("ollama", endpoint, "/api/generate", json=payload, timeout=timeout, stream=True) as (resp, conn):
+        usage["connection_reused"] = conn["connection_reused"]
+        if resp.status_code != 200:
+            raise ModelRunnerError(f"Ollama HTTP {resp.status_code}: {resp.text}")
+        for line in resp.iter_lines(chunk_size=None):
+            if not line:
+                continue
+            data = json.loads(line)
+            if data.get("error"):
+                raise ModelRunnerError(f"Ollama error: {data['error']}")
+            if data.get("response"):
+                yield data["response"]
+            if data.get("done"):
+                usage["input_tokens"] = data.get("prompt_eval_count")
+                usage["output_tokens"] = data.get("eval_count")
+
+def _anthropic_stream(
+    model_id: str,
     prompt: str,
-    sensitivity: Sensitivity = "normal",
-    system_prompt: Optional[str] = None,
-    max_tokens: int = 1024,
-    temperature: float = 0.0,
-) -> ModelReceipt:
-    start = time.time()
-    key, cfg = resolve_model_key(task_type, sensitivity)
-    provider: Provider = cfg.get("provider", "ollama")  # type: ignore
-    model_id = cfg.get("id")
-    try:
-        if provider == "ollama":
-            output = call_ollama(model_id=model_id, prompt=prompt)
-            in_toks = _estimate_tokens(prompt)
-            out_toks = _estimate_tokens(output)
-        elif provider == "cloud-llm":
-            # Placeholder remote stub
-            output = f"[REMOTE_STUB:{model_id}] {prompt[:180]}"
-            in_toks = _estimate_tokens(prompt)
-            out_toks = _estimate_tokens(output)
-        elif provider == "anthropic":
-            system = system_prompt or "You are a helpful assistant."  # required for anthropic
-            data = call_anthropic(model_id=model_id, prompt=prompt, system=system, max_tokens=max_tokens, temperature=temperature)
-            output = data["text"]
-            in_toks = data["input_tokens"]
-            out_toks = data["output_tokens"]
-        else:
-            raise ModelRunnerError(f"Unsupported provider '{provider}'")
-        latency_ms = int((time.time() - start) * 1000)
-        cost = _calc_cost(model_id, in_toks, out_toks)
-        return ModelReceipt(
+    system: str,
+    max_tokens: int,
+    temperature: float,
+    usage: Dict[str, Any],
+    timeout: float = DEFAULT_TIMEOUT_S,
+) -> Iterator[str]:
+    if anthropic is None:
+        raise ModelRunnerError("Anthropic library not available")
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise ModelRunnerError("ANTHROPIC_API_KEY missing from environment")
+    with provider_clients().anthropic_call(api_key, _provider_cfg("anthropic").get("base_url")) as (client, conn):
+        usage["connection_reused"] = conn["connection_reused"]
+        with client.messages.stream(
+            model=model_id,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=[{"role": "user", "content": prompt}],
+            timeout=timeout,
+        ) as stream:
+            yield from stream.text_stream
+            final = stream.get_final_message()
+    usage["input_tokens"] = getattr(final.usage, "input_tokens", None)
+    usage["output_tokens"] = getattr(final.usage, "output_tokens", None)
+
+def _provider_stream(
+    provider: str,
+    model_id: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    max_tokens: int,
+    temperature: float,
+    usage: Dict[str, Any],
+    timeout: float = DEFAULT_TIMEOUT_S,
+) -> Iterator[str]:
+    """Text chunks from the provider; fills `usage` (token counts, connection reuse) as they become known."""
+    if provider == "ollama":
+        yield from _ollama_stream(model_id, prompt, usage, timeout)
+    elif provider == "cloud-llm":
+        # Placeholder remote stub
+        yield f"[REMOTE_STUB:{model_id}] {prompt[:180]}"
+    elif provider == "anthropic":
+        system = system_prompt or "You are a helpful assistant."  # required for anthropic
+        yield from _anthropic_stream(model_id, prompt, system, max_tokens, temperature, usage, timeout)
+    else:
+        raise ModelRunnerError(f"Unsupported provider '{provider}'")
+
+class GenerationStream:
+    """One generation as an iterator of text chunks, yielded as they arrive.
+    `receipt` is set when iteration ends - also on failure (status "error", nothing raised)
+    or when the caller closes the stream early. `timeout` bounds the whole generation: it is the
+    provider's connect/read timeout and the deadline checked as chunks arrive.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        model_id: str,
+        prompt: str,
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        store: Optional[ResponseCache] = None,
+        ckey: Optional[str] = None,
+        start: Optional[float] = None,
+        timeout: Optional[float] = None,
+        model_key: Optional[str] = None,
+        routing: Optional[Dict[str, Any]] = None,
+        router: Optional[AdaptiveRouter] = None,
+        in_flight: bool = False,
+    ):
+        self.provider = provider
+        self.model_id = model_id
+        self.prompt = prompt
+        self.system_prompt = system_prompt
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+        self.store = store
+        self.ckey = ckey
+        self.start = start if start is not None else time.time()
+        self.timeout = timeout if timeout is not None else DEFAULT_TIMEOUT_S
+        self.model_key = model_key
+        self.routing = routing
+        self._router = router if model_key is not None else None
+        # The caller already counted this call with router.begin (generate_many does, at routing time).
+        self._begun = in_flight
+        self._closed_early = False
+        self.receipt: Optional[ModelReceipt] = None
+        self._parts: List[str] = []
+        self._chunks = self._run()
+
+    def __iter__(self) -> "GenerationStream":
+        return self
+
+    def __next__(self) -> str:
+        return next(self._chunks)
+
+    def close(self) -> None:
+        self._chunks.close()
+        if self.receipt is None:  # closed before the first chunk was requested
+            self._closed_early = True
+            self.receipt = self._failed("stream closed before completion", {}, None)
+            if self._begun:
+                self._settle()  # counted in flight at routing time: finish it, without a sample
+            else:
+                self._router = None  # never started, so never counted as in flight
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def consume(self) -> ModelReceipt:
+        """Drain the stream and return its receipt."""
+        for _ in self._chunks:
+            pass
+        return self.receipt  # type: ignore[return-value]
+
+    def _receipt(self, **fields: Any) -> ModelReceipt:
+        defaults: Dict[str, Any] = dict(
             timestamp=time.time(),
-            model_id=model_id,
-            provider=provider,
+            model_id=self.model_id,
+            provider=self.provider,
+            input_tokens=0,
+            output_tokens=0,
+            latency_ms=int((time.time() - self.start) * 1000),
+            cost_usd=0.0,
+            status="success",
+            raw_output="",
+            model_key=self.model_key,
+            routing=self.routing,
+        )
+        defaults.update(fields)
+        return ModelReceipt(**defaults)
+
+    def _settle(self) -> None:
+        """Report the finished call to the adaptive router (once; no latency sample for cache hits or early close)."""
+        router, self._router = self._router, None
+        if router is None:
+            return
+        r = self.receipt
+        sample = r is not None and not r.cache_hit and not self._closed_early
+        router.end(self.model_key, r.latency_ms if sample else None, r is not None and r.status == "success")  # type: ignore[arg-type]
+
+    def _run(self) -> Iterator[str]:
+        # Runs on the first __next__: a stream dropped before iteration is never in flight.
+        if self._router is not None and not self._begun:
+            self._router.begin(self.model_key)  # type: ignore[arg-type]
+        try:
+            yield from self._generate()
+        finally:
+            self._settle()
+
+    def _generate(self) -> Iterator[str]:
+        if self.store is not None and self.ckey is not None:
+            try:
+                hit = self.store.get(self.ckey)
+            except sqlite3.Error:  # the cache is best-effort: an unreadable store is a miss
+                hit = None
+            if hit is not None:
+                self.receipt = self._receipt(
+                    input_tokens=hit["input_tokens"],
+                    output_tokens=hit["output_tokens"],
+                    raw_output=hit["output"],
+                    cache_hit=True,
+                    original_latency_ms=hit["latency_ms"],
+                )
+                self.receipt.ttft_ms = self.receipt.latency_ms
+                self._parts.append(hit["output"])
+                yield hit["output"]
+                return
+
+        usage: Dict[str, Any] = {}
+        chunks = _provider_stream(
+            self.provider, self.model_id, self.prompt, self.system_prompt, self.max_tokens, self.temperature, usage, self.timeout
+        )
+        deadline = self.start + self.timeout
+        first_at: Optional[float] = None
+        try:
+            for chunk in chunks:
+                if first_at is None:
+                    first_at = time.time()
+                if time.time() > deadline:
+                    raise ModelRunnerError(f"generation exceeded timeout of {self.timeout}s")
+                self._parts.append(chunk)
+                yield chunk
+        except GeneratorExit:
+            self._closed_early = True
+            self.receipt = self._failed("stream closed before completion", usage, first_at)
+            raise
+        except Exception as e:  # Capture failure receipt
+            self.receipt = self._failed(str(e), usage, first_at)
+            return
+        finally:
+            chunks.close()
+
+        end = time.time()
+        output = self.text.strip()
+        in_toks = usage.get("input_tokens") or _estimate_tokens(self.prompt)
+        out_toks = usage.get("output_tokens") or _estimate_tokens(output)
+        latency_ms = int((end - self.start) * 1000)
+        cost = _calc_cost(self.model_id, in_toks, out_toks)
+        # Decode rate: from the first token on, unless everything arrived in one chunk.
+        window = end - (first_at if first_at is not None and len(self._parts) > 1 else self.start)
+        if self.store is not None and self.ckey is not None:
+            try:
+                self.store.put(self.ckey, output, input_tokens=in_toks, output_tokens=out_toks, latency_ms=latency_ms, cost_usd=cost)
+            except sqlite3.Error:  # a failed write only costs a future miss; the answer stands
+                pass
+        self.receipt = self._receipt(
             input_tokens=in_toks,
             output_tokens=out_toks,
             latency_ms=latency_ms,
             cost_usd=cost,
-            status="success",
             raw_output=output,
+            connection_reused=usage.get("connection_reused"),
+            connection_stats=_connection_stats(self.provider),
+            ttft_ms=int((first_at - self.start) * 1000) if first_at is not None else None,
+            tokens_per_sec=round(out_toks / window, 2) if window > 0 and out_toks else None,
         )
-    except Exception as e:  # Capture failure receipt
-        latency_ms = int((time.time() - start) * 1000)
-        return ModelReceipt(
-            timestamp=time.time(),
-            model_id=model_id,
-            provider=provider,
-            input_tokens=0,
-            output_tokens=0,
-            latency_ms=latency_ms,
-            cost_usd=0.0,
+
+    def _failed(self, error: str, usage: Dict[str, Any], first_at: Optional[float]) -> ModelReceipt:
+        return self._receipt(
             status="error",
-            raw_output="",
-            error_msg=str(e),
+            error_msg=error,
+            connection_reused=usage.get("connection_reused"),
+            connection_stats=_connection_stats(self.provider),
+            ttft_ms=int((first_at - self.start) * 1000) if first_at is not None else None,
         )
 
+def generate_stream(
+    task_type: str,
+    prompt: str,
+    sensitivity: Sensitivity = "normal",
+    system_prompt: Optional[str] = None,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    cache: Optional[bool] = None,
+    timeout: Optional[float] = None,
+) -> GenerationStream:
+    """Start a generation; iterate the result for text chunks, then read `.receipt`."""
+    start = time.time()
+    key, cfg, routing = route_model_key(task_type, sensitivity)
+    return _open_stream(key, cfg, routing, prompt, sensitivity, system_prompt, max_tokens, temperature, cache, timeout, start)
+
+def _open_stream(
+    key: str,
+    cfg: Dict[str, Any],
+    routing: Optional[Dict[str, Any]],
+    prompt: str,
+    sensitivity: Sensitivity,
+    system_prompt: Optional[str],
+    max_tokens: int,
+    temperature: float,
+    cache: Optional[bool],
+    timeout: Optional[float],
+    start: float,
+    in_flight: bool = False,
+) -> GenerationStream:
+    """GenerationStream for an already routed model key (see route_model_key).
+    `in_flight`: the route was already counted with router.begin; the stream ends it."""
+    provider: Provider = cfg.get("provider", "ollama")  # type: ignore
+    model_id = cfg.get("id")
+    store = _cache_for(cache, sensitivity, temperature)
+    ckey = None
+    if store is not None:
+        params = {"max_tokens": max_tokens, "temperature": temperature}
+        ckey = cache_key(model_id, provider, prompt, system_prompt, params, load_model_stack().get("policy_version"))
+    return GenerationStream(
+        provider, model_id, prompt, system_prompt, max_tokens, temperature, store, ckey, start, timeout,
+        model_key=key, routing=routing, router=adaptive_router() if routing is not None else None, in_flight=in_flight,
+    )
+
+def generate(
+    task_type: str,
+    prompt: str,
+    sensitivity: Sensitivity = "normal",
+    system_prompt: Optional[str] = None,
+    max_tokens: int = 1024,
+    temperature: float = 0.0,
+    cache: Optional[bool] = None,
+    timeout: Optional[float] = None,
+) -> ModelReceipt:
+    return generate_stream(task_type, prompt, sensitivity, system_prompt, max_tokens, temperature, cache, timeout).consume()
+
+@dataclass
+class GenerationRequest:
+    task_type: str
+    prompt: str
+    sensitivity: Sensitivity = "normal"
+    system_prompt: Optional[str] = None
+    max_tokens: int = 1024
+    temperature: float = 0.0
+    cache: Optional[bool] = None
+    timeout: Optional[float] = None
+
+@dataclass
+class GenerationBatch:
+    receipts: List[ModelReceipt]  # one per request, in input order
+    summary: Dict[str, Any] = field(default_factory=dict)
+
+def _batch_error_receipt(error: str, model_id: str = "", provider: str = "") -> ModelReceipt:
+    return ModelReceipt(
+        timestamp=time.time(),
+        model_id=model_id,
+        provider=provider,
+        input_tokens=0,
+        output_tokens=0,
+        latency_ms=0,
+        cost_usd=0.0,
+        status="error",
+        raw_output="",
+        error_msg=error,
+    )
+
+def _batch_summary(receipts: List[ModelReceipt], caps: Dict[str, int], wall_s: float) -> Dict[str, Any]:
+    per_provider: Dict[str, Dict[str, Any]] = {}
+    for receipt in receipts:
+        provider = receipt.provider
+        row = per_provider.setdefault(provider, {"requests": 0, "errors": 0, "max_concurrency": caps.get(provider)})
+        row["requests"] += 1
+        row["errors"] += receipt.status != "success"
+    output_tokens = sum(r.output_tokens for r in receipts)
+    return {
+        "requests": len(receipts),
+        "succeeded": sum(r.status == "success" for r in receipts),
+        "errors": sum(r.status != "success" for r in receipts),
+        "cache_hits": sum(r.cache_hit for r in receipts),
+        "wall_seconds": round(wall_s, 3),
+        "requests_per_sec": round(len(receipts) / wall_s, 2) if wall_s > 0 else None,
+        "output_tokens_per_sec": round(output_tokens / wall_s, 2) if wall_s > 0 else None,
+        "summed_latency_ms": sum(r.latency_ms for r in receipts),
+        "providers": per_provider,
+    }
+
+def generate_many(
+    requests: Sequence[Union[GenerationRequest, Dict[str, Any]]],
+    max_concurrency_per_provider: Union[int, Dict[str, int], None] = None,
+    timeout: Optional[float] = None,
+) -> GenerationBatch:
+    """Run generate() over a batch concurrently; each provider gets its own worker pool.
+
+    Concurrency per provider defaults to its pooled connection limit; an int applies to every
+    provider, a dict overrides by provider name. `timeout` is the default per-request timeout.
+    Requests are routed (route_model_key, so adaptive routing applies) before they are grouped:
+    each runs in the pool of the provider it was routed to. An adaptively routed request counts
+    as in flight on its key from its routing decision on, so the requests after it in the batch
+    see that load and spread across the alternatives. Failures (including routing errors) become
+    error receipts in their slot.
+    """
+    start = time.time()
+    reqs = [r if isinstance(r, GenerationRequest) else GenerationRequest(**r) for r in requests]
+    receipts: List[Optional[ModelReceipt]] = [None] * len(reqs)
+    routes: List[Any] = [None] * len(reqs)
+    by_provider: Dict[str, List[int]] = {}
+    for i, req in enumerate(reqs):
+        try:
+            routes[i] = route_model_key(req.task_type, req.sensitivity)
+        except ModelRunnerError as e:
+            receipts[i] = _batch_error_receipt(str(e))
+            continue
+        if routes[i][2] is not None:
+            adaptive_router().begin(routes[i][0])  # type: ignore[union-attr]
+        by_provider.setdefault(routes[i][1].get("provider", "ollama"), []).append(i)
+
+    def release(i: int) -> None:
+        """End the in-flight count taken at routing time for a request whose stream never started."""
+        key, _, routing = routes[i]
+        if routing is not None:
+            adaptive_router().end(key, None, False)  # type: ignore[union-attr]
+
+    clients = provider_clients()
+    caps: Dict[str, int] = {}
+    for provider in by_provider:
+        if isinstance(max_concurrency_per_provider, int):
+            caps[provider] = max_concurrency_per_provider
+        elif max_concurrency_per_provider and provider in max_concurrency_per_provider:
+            caps[provider] = max_concurrency_per_provider[provider]
+        else:
+            caps[provider] = clients.limit(provider)
+        if caps[provider] <= 0:
+            for idx in by_provider.values():
+                for i in idx:
+                    release(i)
+            raise ValueError(f"max concurrency for provider '{provider}' must be > 0")
+
+    def run(i: int) -> ModelReceipt:
+        req = reqs[i]
+        key, cfg, routing = routes[i]
+        stream: Optional[GenerationStream] = None
+        try:
+            stream = _open_stream(
+                key, cfg, routing, req.prompt, req.sensitivity, req.system_prompt, req.max_tokens, req.temperature,
+                req.cache, req.timeout if req.timeout is not None else timeout, time.time(), in_flight=routing is not None,
+            )
+            return stream.consume()
+        except Exception as e:  # keep the batch going; the slot records the failure
+            if stream is None:
+                release(i)
+            return _batch_error_receipt(str(e), cfg.get("id", ""), cfg.get("provider", "ollama"))
+
+    pools = {p: ThreadPoolExecutor(max_workers=min(caps[p], len(idx)), thread_name_prefix=f"generate:{p}") for p, idx in by_provider.items()}
+    try:
+        futures = {i: pools[p].submit(run, i) for p, idx in by_provider.items() for i in idx}
+        for i, future in futures.items():
+            receipts[i] = future.result()
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True)
+    done: List[ModelReceipt] = receipts  # type: ignore[assignment]
+    return GenerationBatch(receipts=done, summary=_batch_summary(done, caps, time.time() - start))
+
 def generate_dict(*args: Any, **kwargs: Any) -> Dict[str, Any]:
     """Helper returning receipt as dict plus convenience 'text'."""
     receipt = generate(*args, **kwargs)
@@ -0,0 +1,223 @@
+# agi/core/provider_clients.py
+"""Provider client registry (v0.1d).
+One pooled, keep-alive HTTP session per (provider, endpoint) and one Anthropic client per
+(api key, base url), shared across generate() calls and threads. Each provider has a connection
+cap (`max_connections`): concurrent calls beyond it wait for a free connection instead of
+opening more. Per-call connection reuse is recorded so receipts can report it.
+"""
+from __future__ import annotations
+
+import importlib
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+try:
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool  # type: ignore
+except ImportError:  # pragma: no cover
+    requests = None
+
+try:
+    import anthropic  # type: ignore
+except Exception:  # pragma: no cover
+    anthropic = None
+
+DEFAULT_MAX_CONNECTIONS = {"ollama": 4, "anthropic": 8}
+FALLBACK_MAX_CONNECTIONS = 4
+
+# Set by the counting connections below in the thread that opens a connection.
+_local = threading.local()
+
+if requests is not None:
+    from urllib3.connection import HTTPConnection, HTTPSConnection  # type: ignore
+
+    # connect() runs for new connections and for pooled ones whose socket was dropped.
+    class _CountingHTTPConnection(HTTPConnection):
+        def connect(self) -> None:
+            _local.opened = True
+            super().connect()
+
+    class _CountingHTTPSConnection(HTTPSConnection):
+        def connect(self) -> None:
+            _local.opened = True
+            super().connect()
+
+    class _CountingHTTPPool(HTTPConnectionPool):
+        ConnectionCls = _CountingHTTPConnection
+
+    class _CountingHTTPSPool(HTTPSConnectionPool):
+        ConnectionCls = _CountingHTTPSConnection
+
+    class _PooledAdapter(HTTPAdapter):
+        """HTTPAdapter whose pools flag connection setup (TCP/TLS) for the calling thread."""
+
+        def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = {"http": _CountingHTTPPool, "https": _CountingHTTPSPool}
+
+
+def _anthropic_http_client(limit: int):
+    """The SDK's default HTTP client with a capped pool (None on SDKs without DefaultHttpxClient)."""
+    client_cls = getattr(anthropic, "DefaultHttpxClient", None)
+    if client_cls is None:
+        return None
+    # Limits come from whichever httpx distribution the SDK is built on.
+    httpx = importlib.import_module(client_cls.__mro__[1].__module__.partition(".")[0])
+    return client_cls(limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit))
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    connections_opened: int = 0
+    errors: int = 0
+    tracks_connections: bool = True  # False where the client library hides connection setup
+
+    @property
+    def connections_reused(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        del data["tracks_connections"]
+        if not self.tracks_connections:
+            data.update(connections_opened=None, connections_reused=None, reuse_ratio=None)
+            return data
+        data["connections_reused"] = self.connections_reused
+        data["reuse_ratio"] = round(self.connections_reused / self.requests, 3) if self.requests else 0.0
+        return data
+
+
+class ProviderClients:
+    def __init__(self, max_connections: Optional[Dict[str, int]] = None):
+        self.max_connections: Dict[str, int] = dict(DEFAULT_MAX_CONNECTIONS)
+        self.max_connections.update(max_connections or {})
+        self._lock = threading.Lock()
+        self._sessions: Dict[Tuple[str, str], Any] = {}
+        self._anthropic: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._stats: Dict[str, ClientStats] = {}
+
+    def configure(self, providers: Dict[str, Dict[str, Any]]) -> None:
+        """Apply `max_connections` from a model_stack `providers:` block (before first use of a provider)."""
+        with self._lock:
+            for name, cfg in (providers or {}).items():
+                limit = (cfg or {}).get("max_connections")
+                if limit and name not in self._slots:
+                    self.max_connections[name] = int(limit)
+
+    def limit(self, provider: str) -> int:
+        return self.max_connections.get(provider, FALLBACK_MAX_CONNECTIONS)
+
+    def _provider_state(self, provider: str, tracks_connections: bool = True) -> Tuple[threading.BoundedSemaphore, ClientStats]:
+        with self._lock:
+            if provider not in self._slots:
+                self._slots[provider] = threading.BoundedSemaphore(self.limit(provider))
+                self._stats[provider] = ClientStats(tracks_connections=tracks_connections)
+            return self._slots[provider], self._stats[provider]
+
+    # ---- HTTP (Ollama and other plain JSON endpoints) ----
+
+    def session(self, provider: str, endpoint: str):
+        if requests is None:
+            raise RuntimeError("requests library not available")
+        key = (provider, endpoint.rstrip("/"))
+        with self._lock:
+            sess = self._sessions.get(key)
+            if sess is None:
+                limit = self.limit(provider)
+                sess = requests.Session()
+                adapter = _PooledAdapter(pool_connections=1, pool_maxsize=limit, pool_block=True)
+                sess.mount("http://", adapter)
+                sess.mount("https://", adapter)
+                self._sessions[key] = sess
+            return sess
+
+    @contextmanager
+    def post(self, provider: str, endpoint: str, path: str, *, timeout: float, **kwargs: Any) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """POST on the pooled session; yields (response, connection info) and holds a provider slot until exit."""
+        sess = self.session(provider, endpoint)
+        slots, stats = self._provider_state(provider)
+        with slots:
+            _local.opened = False
+            try:
+                resp = sess.post(endpoint.rstrip("/") + path, timeout=timeout, **kwargs)
+            except Exception:
+                with self._lock:
+                    stats.requests += 1
+                    stats.errors += 1
+                    stats.connections_opened += int(_local.opened)
+                raise
+            opened = _local.opened
+            with self._lock:
+                stats.requests += 1
+                stats.connections_opened += int(opened)
+            try:
+                yield resp, {"connection_reused": not opened}
+            except Exception:  # e.g. the caller rejecting a non-200 response
+                with self._lock:
+                    stats.errors += 1
+                raise
+            finally:
+                resp.close()
+
+    # ---- Anthropic ----
+
+    def anthropic_client(self, api_key: str, base_url: Optional[str] = None):
+        if anthropic is None:
+            raise RuntimeError("Anthropic library not available")
+        key = (api_key, base_url)
+        with self._lock:
+            client = self._anthropic.get(key)
+            if client is None:
+                options: Dict[str, Any] = {"api_key": api_key}
+                http_client = _anthropic_http_client(self.limit("anthropic"))
+                if http_client is not None:
+                    options["http_client"] = http_client
+                if base_url:
+                    options["base_url"] = base_url
+                client = self._anthropic[key] = anthropic.Anthropic(**options)
+            return client
+
+    @contextmanager
+    def anthropic_call(self, api_key: str, base_url: Optional[str] = None) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+        """Yields (shared client, connection info). The SDK's httpx pool keeps connections alive but
+        does not expose per-request reuse, so that is reported as None."""
+        client = self.anthropic_client(api_key, base_url)
+        slots, stats = self._provider_state("anthropic", tracks_connections=False)
+        with slots:
+            with self._lock:
+                stats.requests += 1
+            try:
+                yield client, {"connection_reused": None}
+            except Exception:
+                with self._lock:
+                    stats.errors += 1
+                raise
+
+    # ---- stats / lifecycle ----
+
+    def stats(self, provider: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            if provider is not None:
+                stats = self._stats.get(provider)
+                return dict(stats.as_dict() if stats else ClientStats().as_dict(), max_connections=self.limit(provider))
+            return {name: dict(s.as_dict(), max_connections=self.limit(name)) for name, s in self._stats.items()}
+
+    def close(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            clients = list(self._anthropic.values())
+            self._sessions.clear()
+            self._anthropic.clear()
+        for sess in sessions:
+            sess.close()
+        for client in clients:
+            client.close()
+
+
+# Process-wide registry used by model_runner and agent_triad.
+CLIENTS = ProviderClients()
@@ -0,0 +1,147 @@
+# agi/core/response_cache.py
+"""Persistent response cache for deterministic model calls (v0.1d).
+SQLite-backed; entries are keyed by model, provider, prompt/system hashes, call parameters and the
+model stack policy_version, so a policy change never serves an answer produced under the old one.
+Eviction: entries older than `ttl_seconds` are dropped on read and on write; beyond `max_entries`
+or `max_bytes` the least recently used entries go first.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def cache_key(
+    model_id: str,
+    provider: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    params: Dict[str, Any],
+    policy_version: Optional[str],
+) -> str:
+    material = {
+        "model_id": model_id,
+        "provider": provider,
+        "prompt_sha256": _sha256(prompt),
+        "system_sha256": _sha256(system_prompt) if system_prompt is not None else None,
+        "params": params,
+        "policy_version": policy_version,
+    }
+    return _sha256(json.dumps(material, sort_keys=True, separators=(",", ":")))
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = 10_000,
+        max_bytes: Optional[int] = 64 * 1024 * 1024,
+    ):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # a lost entry is only a future miss
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                output TEXT NOT NULL,
+                meta TEXT NOT NULL,        -- JSON: tokens, original latency, cost, model
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses(last_access)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry (`output` plus the stored metadata) or None; a hit refreshes its LRU position."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT output, meta, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None and self._expired(row[2], now):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.evictions += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        entry = json.loads(row[1])
+        entry["output"] = row[0]
+        entry["cached_at"] = row[2]
+        return entry
+
+    def put(self, key: str, output: str, **meta: Any) -> None:
+        meta_json = json.dumps(meta, sort_keys=True)
+        size = len(output.encode("utf-8")) + len(meta_json)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, output, meta, size, created_at, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, output, meta_json, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _evict(self, now: float) -> None:
+        cur = self._conn.cursor()
+        if self.ttl_seconds is not None:
+            cur.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            self.evictions += cur.rowcount
+        count, total = cur.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if (self.max_entries is None or count <= self.max_entries) and (self.max_bytes is None or total <= self.max_bytes):
+            return
+        doomed = []
+        for key, size in cur.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall():
+            if (self.max_entries is None or count <= self.max_entries) and (self.max_bytes is None or total <= self.max_bytes):
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+        cur.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {
+            "path": str(self.path),
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -1,16 +1,25 @@
 """Append-only loggers (CSV + JSONL).
 
-Logs go to validation/assistive_lab/ by default.
+Logs go to validation/assistive_lab/ by default. The JSONL run log goes
+through the shared journal writer (one open handle per file per process).
 """
 
 from __future__ import annotations
 
 import csv
 import json
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    from sovereign_os.journal import shared_journal
+except ImportError:
+    # Script-mode (python assistive_lab/lab.py): the repo root is not on sys.path.
+    sys.path.append(str(Path(__file__).resolve().parents[1]))
+    from sovereign_os.journal import shared_journal
+
 
 def utc_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -47,6 +56,4 @@ def log_run_csv(paths: LogPaths, row: dict) -> None:
 
 
 def log_run_jsonl(paths: LogPaths, event: dict) -> None:
-    ensure_log_root(paths.root)
-    with paths.jsonl_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    shared_journal(paths.jsonl_path).append(json.dumps(event, ensure_ascii=False))
@@ -2,6 +2,7 @@ import json
 import os
 import hashlib
 from core.config import CONFIG
+from sovereign_os.journal import shared_journal
 from core.governance import Proposal, BoardroomDecision, ConstitutionalViolation, ActionType
 
 class Boardroom:
@@ -52,9 +53,7 @@ class Boardroom:
         payload_str = json.dumps(entry, sort_keys=True, default=str)
         new_hash = hashlib.sha256(payload_str.encode()).hexdigest()
         entry["hash"] = new_hash
-        os.makedirs(os.path.dirname(CONFIG.LEDGER_PATH), exist_ok=True)
-        with open(CONFIG.LEDGER_PATH, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        shared_journal(CONFIG.LEDGER_PATH).append(json.dumps(entry))
         self.last_hash = new_hash
         with open(CONFIG.STATE_PATH, "w") as f:
             json.dump({"last_hash": new_hash}, f)
@@ -1,9 +1,13 @@
 import os
+import sys
 import json
 import shutil
 import time
 from pathlib import Path
 
+sys.path.append(os.getcwd())
+from sovereign_os.journal import shared_journal
+
 DRAFTS = Path("Evidence/Analysis/_drafts")
 VERIFIED = Path("Evidence/Analysis/_verified")
 AUDIT = Path("Governance/Logs/audit-insider.jsonl")
@@ -20,8 +24,7 @@ def log_action(filename: str, decision: str):
         "human_reviewer": "CLI",
         "source": "review_console"
     }
-    with AUDIT.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    shared_journal(AUDIT).append(json.dumps(entry))
 
 def review():
     ensure_dirs()
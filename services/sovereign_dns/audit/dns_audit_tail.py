@@ -4,6 +4,7 @@ import argparse
 import hashlib
 import json
 import os
+import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -11,6 +12,20 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+try:
+    import fcntl
+except ImportError:  # Windows: single-writer is by convention only
+    fcntl = None
+
+try:
+    from sovereign_os.journal import FSYNC_COMMIT, JournalWriter, last_line
+except ImportError:
+    # Running from a checkout rather than the container: repo root is three levels up.
+    sys.path.append(str(Path(__file__).resolve().parents[3]))
+    from sovereign_os.journal import FSYNC_COMMIT, JournalWriter, last_line
+
+ZERO_HASH = "0" * 64
+
 
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -21,26 +36,92 @@ def sha256_hex(data: str) -> str:
 
 
 def read_last_hash(ledger_path: Path) -> str:
-    if not ledger_path.exists() or ledger_path.stat().st_size == 0:
-        return "0" * 64
     try:
-        last = ledger_path.read_text(encoding="utf-8").strip().splitlines()[-1]
-        obj = json.loads(last)
-        return str(obj.get("hash") or ("0" * 64))
+        obj = json.loads(last_line(ledger_path) or "{}")
+        return str(obj.get("hash") or ZERO_HASH)
     except Exception:
-        return "0" * 64
+        return ZERO_HASH
+
+
+class LedgerBusyError(RuntimeError):
+    pass
+
+
+def _lock_ledger(ledger_path: Path):
+    """Exclusive, non-blocking lock on `<ledger>.lock`, held until the returned file is closed."""
+    lock_path = ledger_path.with_name(ledger_path.name + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    handle = open(lock_path, "a+b")
+    if fcntl is not None:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            raise LedgerBusyError(f"{ledger_path} is held by another writer (lock: {lock_path})") from None
+    return handle
+
+
+class AuditLedger:
+    """Single writer for a hash-chained ledger: the chain head is read once and kept in memory.
+
+    Only one process may write a ledger at a time - a second writer working
+    from its own in-memory head would fork the chain. The writer holds an
+    exclusive lock on `<ledger>.lock` (where fcntl is available) from
+    construction until close(); another AuditLedger on the same ledger raises
+    LedgerBusyError instead of appending.
+    """
+
+    def __init__(self, ledger_path: Path, *, agent: str, track: str, **journal_options: Any):
+        self.agent = agent
+        self.track = track
+        self._lock_file = _lock_ledger(Path(ledger_path))
+        try:
+            self.journal = JournalWriter(ledger_path, **journal_options)
+        except BaseException:
+            self._lock_file.close()
+            raise
+        self.last_hash = read_last_hash(ledger_path)
+
+    def append(
+        self,
+        event_type: str,
+        payload: Dict[str, Any],
+        *,
+        timestamp: Optional[str] = None,
+    ) -> str:
+        event: Dict[str, Any] = {
+            "event_id": str(uuid4()),
+            "event_type": event_type,
+            "timestamp": timestamp or utc_now_iso(),
+            "agent": self.agent,
+            "track": self.track,
+            "payload": payload,
+            "prev_hash": self.last_hash,
+        }
+        event_hash = sha256_hex(json.dumps(event, sort_keys=True))
+        event["hash"] = event_hash
+        self.journal.append(event)
+        self.last_hash = event_hash
+        return event_hash
+
+    def ensure_genesis(self) -> None:
+        if self.journal.size or self.last_hash != ZERO_HASH:
+            return
+        self.append("GENESIS", {"message": "Sovereign DNS Audit Ignited"})
+
+    def close(self) -> None:
+        try:
+            self.journal.close()
+        finally:
+            self._lock_file.close()
 
 
 def ensure_genesis(ledger_path: Path, *, agent: str, track: str) -> None:
-    if ledger_path.exists() and ledger_path.stat().st_size > 0:
-        return
-    append_event(
-        ledger_path,
-        event_type="GENESIS",
-        payload={"message": "Sovereign DNS Audit Ignited"},
-        agent=agent,
-        track=track,
-    )
+    ledger = AuditLedger(ledger_path, agent=agent, track=track)
+    try:
+        ledger.ensure_genesis()
+    finally:
+        ledger.close()
 
 
 def append_event(
@@ -52,24 +133,13 @@ def append_event(
     track: str,
     timestamp: Optional[str] = None,
 ) -> str:
-    prev_hash = read_last_hash(ledger_path)
-    event: Dict[str, Any] = {
-        "event_id": str(uuid4()),
-        "event_type": event_type,
-        "timestamp": timestamp or utc_now_iso(),
-        "agent": agent,
-        "track": track,
-        "payload": payload,
-        "prev_hash": prev_hash,
-    }
-    event_hash = sha256_hex(json.dumps(event, sort_keys=True))
-    event["hash"] = event_hash
-
-    ledger_path.parent.mkdir(parents=True, exist_ok=True)
-    with ledger_path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event, ensure_ascii=False) + "\n")
-
-    return event_hash
+    """One-off append; long-running writers should hold an AuditLedger instead.
+    Raises LedgerBusyError while another writer holds the ledger."""
+    ledger = AuditLedger(ledger_path, agent=agent, track=track)
+    try:
+        return ledger.append(event_type, payload, timestamp=timestamp)
+    finally:
+        ledger.close()
 
 
 @dataclass
@@ -90,56 +160,52 @@ def stat_inode(path: Path) -> Optional[int]:
 def tail_loop(log_path: Path, ledger_path: Path, *, agent: str, track: str) -> None:
     state = TailState()
 
-    ensure_genesis(ledger_path, agent=agent, track=track)
-    append_event(
+    # Bursts of query lines are group-committed by the journal's flusher thread
+    # (one write + fsync per batch); it flushes within flush_interval when idle.
+    ledger = AuditLedger(
         ledger_path,
-        event_type="DNS_AUDIT_START",
-        payload={"log_path": str(log_path), "pid": os.getpid()},
         agent=agent,
         track=track,
+        fsync=FSYNC_COMMIT,
+        flush_every=512,
+        flush_interval=0.25,
+        background=True,
     )
+    ledger.ensure_genesis()
+    ledger.append("DNS_AUDIT_START", {"log_path": str(log_path), "pid": os.getpid()})
 
-    while True:
-        ino = stat_inode(log_path)
-        if ino is None:
-            time.sleep(1)
-            continue
-
-        if state.inode is None or (ino is not None and state.inode != ino):
-            state.inode = ino
-            state.offset = 0
-
-        try:
-            with log_path.open("r", encoding="utf-8", errors="replace") as f:
-                f.seek(state.offset)
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
-                    state.offset = f.tell()
-                    line = line.rstrip("\r\n")
-                    if not line:
-                        continue
-
-                    # Keep it simple: store raw line; parsing can be improved once format is confirmed.
-                    append_event(
-                        ledger_path,
-                        event_type="DNS_QUERY_LOG",
-                        payload={"raw": line},
-                        agent=agent,
-                        track=track,
-                    )
-        except Exception as exc:
-            append_event(
-                ledger_path,
-                event_type="DNS_AUDIT_ERROR",
-                payload={"error": repr(exc)},
-                agent=agent,
-                track=track,
-            )
-            time.sleep(2)
-
-        time.sleep(0.25)
+    try:
+        while True:
+            ino = stat_inode(log_path)
+            if ino is None:
+                time.sleep(1)
+                continue
+
+            if state.inode is None or (ino is not None and state.inode != ino):
+                state.inode = ino
+                state.offset = 0
+
+            try:
+                with log_path.open("r", encoding="utf-8", errors="replace") as f:
+                    f.seek(state.offset)
+                    while True:
+                        line = f.readline()
+                        if not line:
+                            break
+                        state.offset = f.tell()
+                        line = line.rstrip("\r\n")
+                        if not line:
+                            continue
+
+                        # Keep it simple: store raw line; parsing can be improved once format is confirmed.
+                        ledger.append("DNS_QUERY_LOG", {"raw": line})
+            except Exception as exc:
+                ledger.append("DNS_AUDIT_ERROR", {"error": repr(exc)})
+                time.sleep(2)
+
+            time.sleep(0.25)
+    finally:
+        ledger.close()
 
 
 def main() -> int:
@@ -0,0 +1,298 @@
+"""
+Sovereign Journal
+
+One append-only JSONL writer for every ledger and audit log in the tree,
+replacing the open / append one line / close pattern:
+
+- persistent handle, opened once in binary append mode
+- group commit: records are buffered and written together once
+  `flush_every` records or `flush_bytes` bytes are pending, or (checked on
+  the next append) the oldest has waited `flush_interval` seconds;
+  `flush_every=1`, the default, writes each record through immediately -
+  readers see it as soon as `append` returns
+- fsync policy: `never` (leave it to the OS), `commit` (after every group
+  write) or `always` (every record is its own commit, fsynced)
+- rotation by size (`max_bytes`) and/or age (`rotate_interval` seconds): the
+  live file is renamed to `<name>.<UTC timestamp>[.n]` and a new one started
+- optional background flusher (`background=True`): `append` only enqueues into
+  a bounded queue of `queue_size` records and blocks while it is full
+  (backpressure); a thread drains and group-commits it
+
+`shared_journal(path)` returns one process-wide writer per file, so callers
+that only know a path (module-level `log_event` helpers) share a handle.
+Standard library only: the DNS audit container imports this file on its own.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+FSYNC_NEVER = "never"
+FSYNC_COMMIT = "commit"
+FSYNC_ALWAYS = "always"
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_COMMIT, FSYNC_ALWAYS)
+
+Record = Union[str, Dict[str, Any]]
+
+_STOP = object()
+
+
+def encode_record(record: Record) -> bytes:
+    """One JSONL line: strings are taken as already-serialised JSON."""
+    if not isinstance(record, str):
+        record = json.dumps(record, ensure_ascii=False)
+    return (record + "\n").encode("utf-8")
+
+
+def last_line(path: Union[str, Path], block_size: int = 8192) -> Optional[str]:
+    """Last non-empty line of a file, read backwards from the end (None if there is none)."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        tail = b""
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            tail = f.read(end - start) + tail
+            end = start
+            parts = tail.rstrip(b"\r\n").rsplit(b"\n", 1)
+            if len(parts) == 2 or end == 0:
+                line = parts[-1].rstrip(b"\r")
+                return line.decode("utf-8", errors="replace") if line else None
+    return None
+
+
+class JournalWriter:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        fsync: str = FSYNC_NEVER,
+        flush_every: int = 1,
+        flush_bytes: int = 1 << 20,
+        flush_interval: float = 0.05,
+        max_bytes: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+        background: bool = False,
+        queue_size: int = 10_000,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"unknown fsync policy {fsync!r} (expected one of {', '.join(FSYNC_POLICIES)})")
+        if flush_every <= 0:
+            raise ValueError("flush_every must be > 0")
+        self.path = Path(path)
+        self.fsync = fsync
+        self.flush_every = 1 if fsync == FSYNC_ALWAYS else flush_every
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+
+        self._lock = threading.RLock()
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._pending_since = 0.0
+        self._closed = False
+        self._error: Optional[BaseException] = None
+
+        self.records = 0
+        self.commits = 0
+        self.fsyncs = 0
+        self.rotations = 0
+        self.queue_high_water = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._open()
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._thread = threading.Thread(target=self._drain, name=f"journal:{self.path.name}", daemon=True)
+            self._thread.start()
+
+    def _open(self) -> None:
+        self._file = open(self.path, "ab")
+        self.size = self._file.seek(0, os.SEEK_END)
+        self._opened_at = time.time()
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ---- writing ----
+
+    def append(self, record: Record) -> None:
+        self.append_many((record,))
+
+    def append_many(self, records: Iterable[Record]) -> None:
+        """Append records in order; with `flush_every=1` they are written before this returns."""
+        lines = [encode_record(r) for r in records]
+        if not lines:
+            return
+        self._raise_pending_error()
+        if self._closed:
+            raise ValueError(f"journal {self.path} is closed")
+        if self._queue is not None:
+            for line in lines:
+                self._queue.put(line)
+            self.queue_high_water = max(self.queue_high_water, self._queue.qsize())
+            return
+        with self._lock:
+            self._buffer(lines)
+            if self._due():
+                self._commit()
+
+    def flush(self) -> None:
+        """Write (and fsync, per policy) everything appended so far."""
+        if self._queue is not None:
+            self._queue.join()
+            self._raise_pending_error()
+        with self._lock:
+            self._commit()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+        with self._lock:
+            self._closed = True
+            self._commit()
+            self._file.close()
+        self._raise_pending_error()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "fsync": self.fsync,
+            "flush_every": self.flush_every,
+            "records": self.records,
+            "commits": self.commits,
+            "fsyncs": self.fsyncs,
+            "rotations": self.rotations,
+            "pending": len(self._pending) + (self._queue.qsize() if self._queue is not None else 0),
+            "queue_high_water": self.queue_high_water,
+            "size": self.size,
+        }
+
+    # ---- internals (caller holds the lock) ----
+
+    def _buffer(self, lines: List[bytes]) -> None:
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.extend(lines)
+        self._pending_bytes += sum(len(line) for line in lines)
+
+    def _due(self) -> bool:
+        return (
+            len(self._pending) >= self.flush_every
+            or self._pending_bytes >= self.flush_bytes
+            or time.monotonic() - self._pending_since >= self.flush_interval
+        )
+
+    def _commit(self) -> None:
+        if not self._pending:
+            return
+        if self._should_rotate(self._pending_bytes):
+            self._rotate()
+        data = b"".join(self._pending)
+        self._file.write(data)
+        self._file.flush()
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self._file.fileno())
+            self.fsyncs += 1
+        self.size += len(data)
+        self.records += len(self._pending)
+        self.commits += 1
+        self._pending = []
+        self._pending_bytes = 0
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if not self.size:
+            return False
+        if self.max_bytes is not None and self.size + incoming > self.max_bytes:
+            return True
+        return self.rotate_interval is not None and time.time() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        self._file.close()
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        target = self.path.with_name(f"{self.path.name}.{stamp}")
+        n = 1
+        while target.exists():
+            target = self.path.with_name(f"{self.path.name}.{stamp}.{n}")
+            n += 1
+        os.replace(self.path, target)
+        self.rotations += 1
+        self._open()
+
+    def _drain(self) -> None:
+        q = self._queue
+        stop = False
+        while not stop:
+            try:
+                item = q.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [item]
+            while len(batch) < self.flush_every:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not _STOP]
+            stop = len(lines) != len(batch)
+            try:
+                with self._lock:
+                    if lines:
+                        self._buffer(lines)
+                    self._commit()
+            except BaseException as exc:  # surfaced to the next caller
+                self._error = exc
+            finally:
+                for _ in batch:
+                    q.task_done()
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            exc, self._error = self._error, None
+            raise exc
+
+
+# ---- process-wide writers per path ----
+
+_SHARED: Dict[str, JournalWriter] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_journal(path: Union[str, Path], **options: Any) -> JournalWriter:
+    """The process-wide writer for `path` (options apply when it is first opened)."""
+    key = os.path.abspath(path)
+    with _SHARED_LOCK:
+        writer = _SHARED.get(key)
+        if writer is None or writer._closed:
+            writer = _SHARED[key] = JournalWriter(path, **options)
+        return writer
+
+
+@atexit.register
+def close_shared_journals() -> None:
+    with _SHARED_LOCK:
+        writers = list(_SHARED.values())
+        _SHARED.clear()
+    for writer in writers:
+        writer.close()
@@ -0,0 +1,751 @@
+"""
+Sovereign Storage benchmarks (Phase 1)
+
+Offline, synthetic measurements of the storage substrate. Every benchmark
+works in a temporary evidence directory and prints a JSON result.
+
+    python -m sovereign_os.phase1.benchmarks ingest --count 100000
+    python -m sovereign_os.phase1.benchmarks ingest --count 5000 --mode rewrite
+    python -m sovereign_os.phase1.benchmarks ingest --count 1000000 --mode bulk
+    python -m sovereign_os.phase1.benchmarks lineage --count 1000000 --backend both
+    python -m sovereign_os.phase1.benchmarks signing --batch-sizes 1 100 1000 --workers 4
+    python -m sovereign_os.phase1.benchmarks policy --count 100000
+    python -m sovereign_os.phase1.benchmarks frames --count 10000 --size 65536
+    python -m sovereign_os.phase1.benchmarks startup --count 100000
+    python -m sovereign_os.phase1.benchmarks journal --count 100000
+    python -m sovereign_os.phase1.benchmarks suite --sizes 10000 100000 --output bench.json
+    python -m sovereign_os.phase1.benchmarks suite --sizes 10000 --compare bench.json
+
+`suite` is the cross-commit harness: every (forest shape, size) case runs in
+a fresh process (so peak RSS is per case) and the results are written as
+JSON together with the commit they were measured on.
+"""
+
+import argparse
+import gc
+import hashlib
+import io
+import json
+import multiprocessing
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import resource as _rusage
+except ImportError:  # not available on Windows
+    _rusage = None
+
+from ..journal import FSYNC_COMMIT, JournalWriter
+from .lineage_store import LineageStore
+from .resource_frames import FrameWriter, iter_frames
+from .signing import KEY_TYPES, Signer
+from .sovereign_resource import SovereignResource, ResourceType, AccessLevel
+from .sovereign_storage import FractalGraph, SovereignStorage, StoragePolicy
+
+
+class _RewriteGraph(FractalGraph):
+    """Pre-journal persistence: pretty-printed full graph rewrite on every insert."""
+
+    def _journal_append(self, records: List[Dict[str, Any]]) -> None:
+        state = {
+            "timestamp": time.time(),
+            "nodes": {
+                nid: {
+                    "constitutional_hash": self.graph.nodes[nid]["constitutional_hash"],
+                    "lineage_depth": self.graph.nodes[nid]["lineage_depth"],
+                }
+                for nid in self.graph.nodes
+            },
+            "edges": [{"source": s, "target": t} for s, t in self.graph.edges],
+        }
+        with open(self.evidence_path / self.STATE_FILE, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+
+
+def _synthetic_resource(i: int) -> SovereignResource:
+    return SovereignResource(
+        resource_type=ResourceType.DOCUMENT,
+        data=f"synthetic-{i}".encode(),
+        metadata={"self_attested": True, "access_level": AccessLevel.PRIVATE, "seq": i},
+        governance_template="benchmark",
+    )
+
+
+def bench_ingest(count: int, mode: str = "journal", fanout: int = 8) -> Dict[str, Any]:
+    """Insert `count` resources as a `fanout`-ary tree and time ingestion and reload.
+
+    Modes: `rewrite` (pre-journal full rewrite), `journal` (add_resource one at a
+    time) and `bulk` (add_resources in batches of 10k).
+    """
+    graph_cls = _RewriteGraph if mode == "rewrite" else FractalGraph
+
+    with tempfile.TemporaryDirectory() as tmp:
+        graph = graph_cls(evidence_path=tmp)
+        ids: List[str] = []
+
+        start = time.perf_counter()
+        if mode == "bulk":
+            batch_size = 10_000
+            for lo in range(0, count, batch_size):
+                batch = [_synthetic_resource(i) for i in range(lo, min(lo + batch_size, count))]
+                parent_map = {}
+                for i, r in enumerate(batch, start=lo):
+                    ids.append(r.resource_id)
+                    if i:
+                        parent_map[r.resource_id] = ids[(i - 1) // fanout]
+                graph.add_resources(batch, parent_map)
+        else:
+            for i in range(count):
+                parent = ids[(i - 1) // fanout] if i else None
+                ids.append(graph.add_resource(_synthetic_resource(i), parent_id=parent))
+        ingest_s = time.perf_counter() - start
+
+        graph.close()
+        start = time.perf_counter()
+        reloaded = FractalGraph(evidence_path=tmp)
+        load_s = time.perf_counter() - start
+        assert reloaded.graph.number_of_nodes() == count
+        reloaded.close()
+
+    return {
+        "benchmark": "ingest",
+        "mode": mode,
+        "count": count,
+        "fanout": fanout,
+        "ingest_seconds": round(ingest_s, 3),
+        "resources_per_second": round(count / ingest_s, 1) if ingest_s else None,
+        "load_seconds": round(load_s, 3),
+    }
+
+
+def _lineage_graph(backend: str):
+    if backend == "networkx":
+        import networkx as nx
+
+        return nx.DiGraph()
+    return LineageStore()
+
+
+def bench_lineage(count: int, backend: str = "compact", fanout: int = 8, walks: int = 10_000) -> Dict[str, Any]:
+    """Build a `fanout`-ary lineage forest of `count` nodes directly on a graph backend.
+
+    Measures build time, traced memory (tracemalloc peak/current, which
+    includes the id strings and hashes both backends hold) and the time of
+    `walks` root-ward walks through `predecessors`, the access pattern of
+    `get_verifiable_subset`. Backends: `compact` (LineageStore) and `networkx`.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    graph = _lineage_graph(backend)
+    ids: List[str] = []
+    for i in range(count):
+        rid = f"res-{i:012d}"
+        depth = 0
+        parent = None
+        if i:
+            parent = ids[(i - 1) // fanout]
+            depth = graph.nodes[parent]["lineage_depth"] + 1
+        graph.add_node(rid, constitutional_hash=hashlib.sha3_256(rid.encode()).hexdigest(), lineage_depth=depth)
+        if parent is not None:
+            graph.add_edge(parent, rid)
+        ids.append(rid)
+
+    build_s = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    step = max(1, count // walks)
+    start = time.perf_counter()
+    hops = 0
+    for i in range(count - 1, -1, -step):
+        current_id = ids[i]
+        while True:
+            parents = list(graph.predecessors(current_id))
+            if not parents:
+                break
+            current_id = parents[0]
+            hops += 1
+    walk_s = time.perf_counter() - start
+
+    return {
+        "benchmark": "lineage",
+        "backend": backend,
+        "count": count,
+        "fanout": fanout,
+        "build_seconds": round(build_s, 3),
+        "nodes_per_second": round(count / build_s, 1) if build_s else None,
+        "traced_mib": round(current / 2**20, 1),
+        "peak_traced_mib": round(peak / 2**20, 1),
+        "bytes_per_node": round(current / count, 1) if count else None,
+        "walks": len(range(count - 1, -1, -step)),
+        "walk_hops": hops,
+        "walk_seconds": round(walk_s, 3),
+    }
+
+
+def bench_signing(key_type: str, batch_size: int, workers: int = 0, rounds: int = 0) -> Dict[str, Any]:
+    """Sign authorization-package-sized payloads with `Signer.sign_many`; report signatures/sec.
+
+    `rounds` batches are signed (default: enough for ~2000 signatures). With
+    `workers` > 0, batches of at least `parallel_min_batch` go through the
+    signer's process pool, as in `generate_read_authorizations`. The pool is
+    started by a warm-up batch, reported as `first_batch_seconds` and kept out
+    of the rate.
+    """
+    signer = Signer.generate(key_type)
+    pooled = workers > 0 and batch_size >= max(signer.parallel_min_batch, 2 * workers)
+    rounds = rounds or max(1, 2000 // batch_size)
+    payloads = [
+        json.dumps({"resource_id": f"res-{i:012d}", "constraints": {"nonce": f"{i:016x}"}, "pad": "x" * 900},
+                   sort_keys=True).encode()
+        for i in range(batch_size)
+    ]
+
+    start = time.perf_counter()
+    if pooled:
+        signer.sign_many(payloads, workers)
+    first_batch_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        signatures = signer.sign_many(payloads, workers)
+    sign_s = time.perf_counter() - start
+    signer.close()
+
+    start = time.perf_counter()
+    assert all(signer.verify(p, sig) for p, sig in zip(payloads, signatures))
+    verify_s = time.perf_counter() - start
+
+    total = rounds * batch_size
+    return {
+        "benchmark": "signing",
+        "key_type": key_type,
+        "batch_size": batch_size,
+        "workers": workers,
+        "pooled": pooled,
+        "first_batch_seconds": round(first_batch_s, 3) if pooled else None,
+        "signatures": total,
+        "sign_seconds": round(sign_s, 3),
+        "signatures_per_second": round(total / sign_s, 1) if sign_s else None,
+        "verifications_per_second": round(batch_size / verify_s, 1) if verify_s else None,
+    }
+
+
+def write_fixture_policy(directory: Path) -> Tuple[str, str]:
+    """Minimal constitution + guardrails YAMLs for offline benchmarks."""
+    constitution = directory / "constitution.yaml"
+    constitution.write_text("version: '1.2'\nprinciples: []\ngovernance_model: recursive\n", encoding="utf-8")
+    guardrails = directory / "guardrails.yaml"
+    guardrails.write_text("public_write_restrictions:\n  quorum_size: 3\n", encoding="utf-8")
+    return str(constitution), str(guardrails)
+
+
+def bench_policy(count: int, operations: Tuple[str, ...] = ("read", "write", "create", "update", "delete"),
+                 seed: int = 7) -> Dict[str, Any]:
+    """Constraint generation and compliance checking throughput.
+
+    `count` random (operation, resource_type, access_level, self_attested)
+    requests and execution results; compliance runs per item and as one
+    `verify_compliance_many` batch. Outcomes must be identical.
+    """
+    rng = random.Random(seed)
+    requests = [
+        (
+            rng.choice(operations),
+            rng.choice(list(ResourceType)),
+            {"self_attested": rng.random() < 0.5, "access_level": rng.choice(list(AccessLevel))},
+        )
+        for _ in range(count)
+    ]
+    results = [
+        {
+            "verifications": {"self_attestation": rng.random() < 0.8},
+            "approvals": ["a"] * rng.randint(0, 4),
+            "evidence_logged": rng.random() < 0.9,
+        }
+        for _ in range(count)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        policy = StoragePolicy(*write_fixture_policy(Path(tmp)))
+
+        def timed(fn):
+            start = time.perf_counter()
+            out = fn()
+            return out, time.perf_counter() - start
+
+        constraints, gen_s = timed(lambda: [policy.generate_constraints(*r) for r in requests])
+        single_out, check_s = timed(
+            lambda: [policy.verify_compliance(x, c) for x, c in zip(results, constraints)]
+        )
+        batch_out, batch_check_s = timed(lambda: policy.verify_compliance_many(results, constraints))
+        assert single_out == batch_out
+
+    def rate(seconds: float) -> float:
+        return round(count / seconds, 1) if seconds else None
+
+    return {
+        "benchmark": "policy",
+        "count": count,
+        "operations": list(operations),
+        "generate_per_second": rate(gen_s),
+        "verify_per_second": {"single": rate(check_s), "batch": rate(batch_check_s)},
+    }
+
+
+def bench_frames(count: int, size: int, seed: int = 7) -> Dict[str, Any]:
+    """Export + import `count` resources of `size` bytes: JSON lines (base64) vs binary frames.
+
+    Both paths run in memory, so the numbers are encode/decode cost only. The
+    decode passes stop at rebuilding the resources; `frames_verified` also
+    re-hashes every payload against its constitutional hash.
+    """
+    rng = random.Random(seed)
+    resources = [
+        SovereignResource(
+            resource_type=ResourceType.BLOB,
+            data=rng.randbytes(size),
+            metadata={"self_attested": True, "access_level": AccessLevel.PRIVATE, "seq": i},
+            governance_template="benchmark",
+        )
+        for i in range(count)
+    ]
+    payload_mib = count * size / (1024 * 1024)
+
+    start = time.perf_counter()
+    json_blob = "\n".join(json.dumps(r.to_dict(), sort_keys=True) for r in resources).encode("utf-8")
+    json_write_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = [SovereignResource.from_dict(json.loads(line)) for line in json_blob.split(b"\n")]
+    json_read_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    out = io.BytesIO()
+    with FrameWriter(out) as writer:
+        for r in resources:
+            writer.write(r)
+    frames_blob = out.getbuffer()
+    frames_write_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    framed = [frame.to_resource(verify=False) for frame in iter_frames(frames_blob)]
+    frames_read_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    verified = [frame.to_resource(verify=True) for frame in iter_frames(frames_blob)]
+    frames_verified_s = time.perf_counter() - start
+
+    assert [r.constitutional_hash for r in decoded] == [r.constitutional_hash for r in framed]
+    assert all(bytes(a.data) == b.data for a, b in zip(verified, resources))
+    del decoded, framed, verified
+
+    def mib_s(seconds: float) -> float:
+        return round(payload_mib / seconds, 1) if seconds else None
+
+    return {
+        "benchmark": "frames",
+        "count": count,
+        "payload_bytes": size,
+        "encoded_bytes": {"json": len(json_blob), "frames": frames_blob.nbytes},
+        "write_mib_per_second": {"json": mib_s(json_write_s), "frames": mib_s(frames_write_s)},
+        "read_mib_per_second": {
+            "json": mib_s(json_read_s),
+            "frames": mib_s(frames_read_s),
+            "frames_verified": mib_s(frames_verified_s),
+        },
+    }
+
+
+def bench_startup(count: int, fanout: int = 8, rounds: int = 5) -> Dict[str, Any]:
+    """SovereignStorage construction time: cold (empty evidence path) vs warm restarts.
+
+    Warm restarts are timed twice: with the insertion journal still to replay,
+    and after `compact()` (snapshot only).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        constitution, guardrails = write_fixture_policy(root)
+        evidence = str(root / "evidence")
+        key = str(root / "storage_root.pem")
+
+        start = time.perf_counter()
+        storage = SovereignStorage(constitution, guardrails, storage_key_path=key, evidence_path=evidence,
+                                   persist_key=True)
+        cold_s = time.perf_counter() - start
+
+        ids = [storage.genesis_id]
+        parent_map: Dict[str, str] = {}
+        resources = []
+        for i in range(count):
+            r = _synthetic_resource(i)
+            parent_map[r.resource_id] = ids[i // fanout]
+            ids.append(r.resource_id)
+            resources.append(r)
+        storage.ingest_resources(resources, parent_map)
+        storage.close()
+        del resources
+
+        def warm() -> float:
+            best = None
+            for _ in range(rounds):
+                start = time.perf_counter()
+                s = SovereignStorage(constitution, guardrails, storage_key_path=key, evidence_path=evidence)
+                elapsed = time.perf_counter() - start
+                assert s.genesis_id == ids[0] and s.graph.graph.number_of_nodes() == count + 1
+                s.close()
+                best = elapsed if best is None else min(best, elapsed)
+            return best
+
+        warm_journal_s = warm()
+        s = SovereignStorage(constitution, guardrails, storage_key_path=key, evidence_path=evidence)
+        s.graph.compact()
+        s.close()
+        warm_snapshot_s = warm()
+
+    return {
+        "benchmark": "startup",
+        "count": count,
+        "cold_seconds": round(cold_s, 4),
+        "warm_journal_seconds": round(warm_journal_s, 4),
+        "warm_snapshot_seconds": round(warm_snapshot_s, 4),
+    }
+
+
+def bench_journal(count: int, group: int = 256, fsync_count: int = 2000) -> Dict[str, Any]:
+    """Events/sec for one JSONL ledger: open-append-close per event vs JournalWriter modes.
+
+    The fsync pattern is measured over `fsync_count` events (it is bound by the disk).
+    """
+    events = [
+        {"event_id": f"evt-{i}", "event_type": "DNS_QUERY_LOG", "payload": {"raw": f"info: 127.0.0.1 host{i}.lan. A IN"}}
+        for i in range(count)
+    ]
+
+    def open_per_event(path: Path, batch: List[Dict[str, Any]]) -> None:
+        for event in batch:
+            with path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def journal(**options: Any):
+        def run(path: Path, batch: List[Dict[str, Any]]) -> None:
+            with JournalWriter(path, **options) as writer:
+                for event in batch:
+                    writer.append(event)
+        return run
+
+    patterns = [
+        ("open_per_event", open_per_event, count),
+        ("write_through", journal(), count),
+        ("group_commit", journal(flush_every=group), count),
+        ("background", journal(flush_every=group, background=True), count),
+        ("fsync_per_event", journal(fsync="always"), fsync_count),
+        ("fsync_group_commit", journal(fsync=FSYNC_COMMIT, flush_every=group), fsync_count),
+    ]
+    results: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, run, n in patterns:
+            path = Path(tmp) / f"{name}.jsonl"
+            start = time.perf_counter()
+            run(path, events[:n])
+            elapsed = time.perf_counter() - start
+            with path.open("rb") as f:
+                assert sum(1 for _ in f) == n
+            results[name] = {"events": n, "events_per_second": round(n / elapsed, 1)}
+    baseline = results["open_per_event"]["events_per_second"]
+    for name in ("write_through", "group_commit", "background"):
+        results[name]["speedup"] = round(results[name]["events_per_second"] / baseline, 2)
+    return {"benchmark": "journal", "count": count, "group": group, "patterns": results}
+
+
+FOREST_SHAPES = ("wide", "deep", "mixed")
+
+
+def _forest_parent(shape: str, k: int, rng: random.Random) -> int:
+    """Parent position (in insertion order, 0 = genesis) of the k-th resource (k >= 1).
+
+    - wide:  64-ary tree under genesis (depth ~log64 n)
+    - deep:  8 chains under genesis (depth ~n/8)
+    - mixed: half extend the newest node, half attach to one of the last 1000
+    """
+    if shape == "wide":
+        return (k - 1) // 64
+    if shape == "deep":
+        return k - 8 if k > 8 else 0
+    if shape == "mixed":
+        return k - 1 if rng.random() < 0.5 else rng.randrange(max(0, k - 1000), k)
+    raise ValueError(f"unknown forest shape {shape!r} (expected one of {', '.join(FOREST_SHAPES)})")
+
+
+def _peak_rss_mib() -> Optional[float]:
+    if _rusage is None:
+        return None
+    peak = _rusage.getrusage(_rusage.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
+
+
+def bench_suite_case(shape: str, count: int, samples: int = 2000, seed: int = 7) -> Dict[str, Any]:
+    """One suite case: build a `shape` forest of `count` resources through SovereignStorage.
+
+    Times `add_resource` (resource construction excluded), `get_verifiable_subset`
+    (cold, then cached), `generate_read_authorization`, `verify_read_completion`
+    on `samples` random resources, and a warm restart (best of 3).
+    """
+    gc.collect()
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        constitution, guardrails = write_fixture_policy(root)
+        evidence = str(root / "evidence")
+        key = str(root / "storage_root.pem")
+
+        storage = SovereignStorage(constitution, guardrails, storage_key_path=key, evidence_path=evidence,
+                                   persist_key=True)
+        graph = storage.graph
+        ids = [storage.genesis_id]
+        add_s = 0.0
+        chunk = 10_000
+        for lo in range(1, count + 1, chunk):
+            batch = [_synthetic_resource(k) for k in range(lo, min(lo + chunk, count + 1))]
+            for k, resource in enumerate(batch, start=lo):
+                parent_id = ids[_forest_parent(shape, k, rng)]
+                start = time.perf_counter()
+                ids.append(graph.add_resource(resource, parent_id=parent_id))
+                add_s += time.perf_counter() - start
+        max_depth = max(graph.graph.depth)
+
+        sample = rng.sample(ids[1:], min(samples, count))
+        timings: Dict[str, float] = {}
+
+        start = time.perf_counter()
+        for rid in sample:
+            graph.get_verifiable_subset(rid)
+        timings["subset_cold"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for rid in sample:
+            graph.get_verifiable_subset(rid)
+        timings["subset_cached"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        packages = [storage.generate_read_authorization(rid, {}) for rid in sample]
+        timings["authorization"] = time.perf_counter() - start
+
+        result = {"verifications": {"self_attestation": True}}
+        start = time.perf_counter()
+        for package in packages:
+            storage.verify_read_completion(result, package)
+        timings["verify"] = time.perf_counter() - start
+        storage.close()
+
+        startup_s = None
+        for _ in range(3):
+            start = time.perf_counter()
+            warm = SovereignStorage(constitution, guardrails, storage_key_path=key, evidence_path=evidence)
+            elapsed = time.perf_counter() - start
+            assert warm.graph.graph.number_of_nodes() == count + 1
+            warm.close()
+            startup_s = elapsed if startup_s is None else min(startup_s, elapsed)
+
+    def rate(n: int, seconds: float) -> Optional[float]:
+        return round(n / seconds, 1) if seconds else None
+
+    return {
+        "benchmark": "suite",
+        "shape": shape,
+        "count": count,
+        "max_depth": max_depth,
+        "samples": len(sample),
+        "add_resource_per_second": rate(count, add_s),
+        "subset_per_second": {
+            "cold": rate(len(sample), timings["subset_cold"]),
+            "cached": rate(len(sample), timings["subset_cached"]),
+        },
+        "authorization_per_second": rate(len(sample), timings["authorization"]),
+        "verify_per_second": rate(len(sample), timings["verify"]),
+        "startup_seconds": round(startup_s, 4),
+        "peak_rss_mib": _peak_rss_mib(),
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def bench_suite(
+    sizes: Sequence[int] = (10_000, 100_000),
+    shapes: Sequence[str] = FOREST_SHAPES,
+    samples: int = 2000,
+    isolate: bool = True,
+) -> Dict[str, Any]:
+    """Every (shape, size) case, each in a fresh spawned process when `isolate`."""
+    results = []
+    for count in sizes:
+        for shape in shapes:
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    results.append(pool.submit(bench_suite_case, shape, count, samples).result())
+            else:
+                results.append(bench_suite_case(shape, count, samples))
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "isolated": isolate,
+        },
+        "results": results,
+    }
+
+
+def _flatten(result: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    for key, value in result.items():
+        if isinstance(value, dict):
+            out.update(_flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            out[prefix + key] = value
+    return out
+
+
+def compare_suites(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-case ratios current / baseline for every numeric metric both runs report."""
+    before = {(r["shape"], r["count"]): _flatten(r) for r in baseline.get("results", [])}
+    rows = []
+    for result in current.get("results", []):
+        old = before.get((result["shape"], result["count"]))
+        if old is None:
+            continue
+        new = _flatten(result)
+        rows.append({
+            "shape": result["shape"],
+            "count": result["count"],
+            "ratio": {
+                metric: round(value / old[metric], 3)
+                for metric, value in new.items()
+                if old.get(metric) and metric not in ("count", "samples", "max_depth")
+            },
+        })
+    return rows
+
+
+def main(argv: List[str] = None) -> int:
+    p = argparse.ArgumentParser(description="Sovereign Storage benchmarks (offline, synthetic)")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    ip = sub.add_parser("ingest", help="add_resource ingestion + reload")
+    ip.add_argument("--count", type=int, default=100_000)
+    ip.add_argument("--mode", choices=["journal", "rewrite", "bulk"], default="journal")
+    ip.add_argument("--fanout", type=int, default=8)
+
+    lp = sub.add_parser("lineage", help="lineage graph memory/speed: LineageStore vs networkx")
+    lp.add_argument("--count", type=int, default=1_000_000)
+    lp.add_argument("--backend", choices=["compact", "networkx", "both"], default="both")
+    lp.add_argument("--fanout", type=int, default=8)
+    lp.add_argument("--walks", type=int, default=10_000)
+
+    sp = sub.add_parser("signing", help="signatures/sec per key type and batch size")
+    sp.add_argument("--key-types", nargs="+", choices=list(KEY_TYPES), default=list(KEY_TYPES))
+    sp.add_argument("--batch-sizes", nargs="+", type=int, default=[1, 100, 1000])
+    sp.add_argument("--workers", type=int, default=0, help="Process pool size for batches (0: in-process)")
+
+    pp = sub.add_parser("policy", help="constraint generation + compliance checking throughput")
+    pp.add_argument("--count", type=int, default=100_000)
+    pp.add_argument("--operations", nargs="+", default=["read", "write", "create", "update", "delete"])
+
+    fp = sub.add_parser("frames", help="resource export/import: JSON+base64 vs binary frames")
+    fp.add_argument("--count", type=int, default=10_000)
+    fp.add_argument("--size", type=int, default=64 * 1024, help="Payload bytes per resource")
+
+    up = sub.add_parser("startup", help="SovereignStorage cold vs warm construction time")
+    up.add_argument("--count", type=int, default=100_000)
+    up.add_argument("--fanout", type=int, default=8)
+
+    jp = sub.add_parser("journal", help="JSONL ledger appends: open-per-event vs JournalWriter modes")
+    jp.add_argument("--count", type=int, default=100_000)
+    jp.add_argument("--group", type=int, default=256, help="flush_every for the group-commit patterns")
+    jp.add_argument("--fsync-count", type=int, default=2000)
+
+    xp = sub.add_parser("suite", help="storage substrate suite over synthetic forests (JSON for cross-commit comparison)")
+    xp.add_argument("--sizes", nargs="+", type=int, default=[10_000, 100_000])
+    xp.add_argument("--shapes", nargs="+", choices=list(FOREST_SHAPES), default=list(FOREST_SHAPES))
+    xp.add_argument("--samples", type=int, default=2000, help="Resources sampled for subset/authorization/verify")
+    xp.add_argument("--output", help="Write the suite JSON here")
+    xp.add_argument("--compare", help="Earlier suite JSON to report ratios against")
+    xp.add_argument("--in-process", action="store_true", help="Run cases in this process (peak RSS is then cumulative)")
+
+    args = p.parse_args(argv)
+
+    if args.cmd == "ingest":
+        print(json.dumps(bench_ingest(args.count, args.mode, args.fanout), indent=2))
+        return 0
+
+    if args.cmd == "lineage":
+        backends = ["compact", "networkx"] if args.backend == "both" else [args.backend]
+        results = [bench_lineage(args.count, b, args.fanout, args.walks) for b in backends]
+        print(json.dumps(results if len(results) > 1 else results[0], indent=2))
+        return 0
+
+    if args.cmd == "signing":
+        results = [
+            bench_signing(key_type, batch_size, args.workers)
+            for key_type in args.key_types
+            for batch_size in args.batch_sizes
+        ]
+        print(json.dumps(results, indent=2))
+        return 0
+
+    if args.cmd == "policy":
+        print(json.dumps(bench_policy(args.count, tuple(args.operations)), indent=2))
+        return 0
+
+    if args.cmd == "frames":
+        print(json.dumps(bench_frames(args.count, args.size), indent=2))
+        return 0
+
+    if args.cmd == "suite":
+        suite = bench_suite(args.sizes, args.shapes, args.samples, isolate=not args.in_process)
+        if args.compare:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                suite["comparison"] = {"baseline": args.compare, "cases": compare_suites(suite, json.load(f))}
+        text = json.dumps(suite, indent=2)
+        if args.output:
+            Path(args.output).write_text(text + "\n", encoding="utf-8")
+        print(text)
+        return 0
+
+    if args.cmd == "startup":
+        print(json.dumps(bench_startup(args.count, args.fanout), indent=2))
+        return 0
+
+    if args.cmd == "journal":
+        print(json.dumps(bench_journal(args.count, args.group, args.fsync_count), indent=2))
+        return 0
+
+    raise SystemExit("unknown command")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
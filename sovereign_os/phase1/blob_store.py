@@ -0,0 +1,176 @@
+"""
+Sovereign Blob Store (Phase 1)
+
+Content-addressed, chunked payload storage under the evidence path:
+
+- `chunks/<aa>/<sha3-256>`: fixed-size chunks, deduplicated by digest
+- `blobs/<aa>/<sha3-256>.json`: manifest (size + ordered chunk digests)
+- `payloads/<aa>/<sha3-256>`: contiguous copy of a multi-chunk payload,
+  written from its chunks on first `view`
+
+A blob is identified by the SHA3-256 of its full content, i.e. the same
+`data_sha3_256` that `SovereignResource.compute_constitutional_hash` embeds,
+so moving a payload into the store never changes a constitutional hash.
+
+Writers stream (no full payload in memory); readers get `memoryview`s over
+read-only `mmap`s of the chunk or payload files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    """Reference to a stored payload; carried by resources instead of raw bytes."""
+
+    digest: str
+    size: int
+    chunks: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"digest": self.digest, "size": self.size, "chunks": list(self.chunks)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlobRef":
+        return cls(
+            digest=str(data["digest"]),
+            size=int(data["size"]),
+            chunks=tuple(str(c) for c in data.get("chunks", [])),
+        )
+
+
+class BlobStore:
+    def __init__(self, root: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be > 0")
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        (self.root / "chunks").mkdir(parents=True, exist_ok=True)
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+        (self.root / "payloads").mkdir(parents=True, exist_ok=True)
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.root / "chunks" / digest[:2] / digest
+
+    def _manifest_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / f"{digest}.json"
+
+    def _payload_path(self, digest: str) -> Path:
+        return self.root / "payloads" / digest[:2] / digest
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _write_payload(self, ref: BlobRef) -> Path:
+        """Concatenate the chunks of `ref` into its payload file, one chunk at a time."""
+        path = self._payload_path(ref.digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            for chunk in self.iter_chunks(ref):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return path
+
+    # ---- writing ----
+
+    def put_stream(self, stream: BinaryIO) -> BlobRef:
+        """Store everything readable from `stream`, one chunk in memory at a time."""
+        whole = hashlib.sha3_256()
+        chunks: List[str] = []
+        size = 0
+
+        while True:
+            block = stream.read(self.chunk_size)
+            if not block:
+                break
+            whole.update(block)
+            size += len(block)
+            digest = hashlib.sha3_256(block).hexdigest()
+            path = self._chunk_path(digest)
+            if not path.exists():
+                self._write_atomic(path, block)
+            chunks.append(digest)
+
+        ref = BlobRef(digest=whole.hexdigest(), size=size, chunks=tuple(chunks))
+        manifest = self._manifest_path(ref.digest)
+        if not manifest.exists():
+            self._write_atomic(manifest, json.dumps(ref.to_dict(), sort_keys=True).encode("utf-8"))
+        return ref
+
+    def put_file(self, path: Union[str, Path]) -> BlobRef:
+        with open(path, "rb") as f:
+            return self.put_stream(f)
+
+    def put_bytes(self, data: Union[bytes, memoryview]) -> BlobRef:
+        return self.put_stream(io.BytesIO(data))
+
+    # ---- reading ----
+
+    def get_ref(self, digest: str) -> BlobRef:
+        path = self._manifest_path(digest)
+        if not path.exists():
+            raise KeyError(f"blob {digest} not in store")
+        return BlobRef.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def contains(self, digest: str) -> bool:
+        return self._manifest_path(digest).exists()
+
+    @staticmethod
+    def _map_file(path: Path) -> memoryview:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def iter_chunks(self, ref: BlobRef) -> Iterator[memoryview]:
+        """Zero-copy views over each chunk, in order."""
+        for digest in ref.chunks:
+            yield self._map_file(self._chunk_path(digest))
+
+    def view(self, ref: BlobRef) -> memoryview:
+        """Read-only view of the whole payload.
+
+        Always an `mmap` view: single-chunk blobs (the common case) map their
+        chunk file; larger blobs map their payload file, which the first `view`
+        writes from the chunks (one chunk in memory at a time, one extra copy
+        of the payload on disk).
+        """
+        if not ref.chunks:
+            return memoryview(b"")
+        if len(ref.chunks) == 1:
+            return self._map_file(self._chunk_path(ref.chunks[0]))
+        path = self._payload_path(ref.digest)
+        if not path.exists() or path.stat().st_size != ref.size:
+            path = self._write_payload(ref)
+        return self._map_file(path)
+
+    def verify(self, ref: BlobRef) -> bool:
+        whole = hashlib.sha3_256()
+        size = 0
+        for digest, chunk in zip(ref.chunks, self.iter_chunks(ref)):
+            if hashlib.sha3_256(chunk).hexdigest() != digest:
+                return False
+            whole.update(chunk)
+            size += len(chunk)
+        return size == ref.size and whole.hexdigest() == ref.digest
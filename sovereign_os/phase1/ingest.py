@@ -0,0 +1,128 @@
+"""
+Sovereign Storage bulk ingest (Phase 1)
+
+Streams a JSONL evidence corpus into a FractalGraph. Each line is a
+`SovereignResource.to_dict()` record, optionally with a `parent_id`; lines
+must be in topological order (parents before children).
+
+Records are decoded and their payloads hashed in a process pool, a chunk at
+a time, then inserted with `FractalGraph.add_resources` (one journal write
+per chunk). A record whose `constitutional_hash` does not match its content
+raises ValueError before its chunk is inserted.
+
+    python -m sovereign_os.phase1.ingest corpus.jsonl --evidence-path evidence/genealogy/ --workers 8
+"""
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from .sovereign_resource import SovereignResource
+from .sovereign_storage import FractalGraph
+
+
+def _decode_record(line: str) -> Tuple[Union[SovereignResource, Dict[str, Any]], Optional[str]]:
+    record = json.loads(line)
+    parent_id = record.get("parent_id") or None
+    if record.get("blob_ref"):
+        # Blob-backed: nothing to hash, and mapped views cannot cross processes;
+        # the parent resolves it against the graph's blob store.
+        return record, parent_id
+    # Hashed here (in the worker): the stored hash is checked and the payload digest stays cached.
+    resource = SovereignResource.from_dict(record, verify=True)
+    return resource, parent_id
+
+
+def _chunks(lines: Iterator[str], size: int) -> Iterator[List[str]]:
+    while True:
+        chunk = [line for line in islice(lines, size) if line.strip()]
+        if not chunk:
+            return
+        yield chunk
+
+
+def ingest_jsonl(
+    graph: FractalGraph,
+    lines: Iterator[str],
+    *,
+    workers: int = 0,
+    chunk_size: int = 10_000,
+    progress=None,
+) -> int:
+    """Ingest JSONL lines into `graph`; returns the number of resources added."""
+    total = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    try:
+        for chunk in _chunks(lines, chunk_size):
+            if pool is not None:
+                decoded = list(pool.map(_decode_record, chunk, chunksize=max(1, len(chunk) // (workers * 4))))
+            else:
+                decoded = [_decode_record(line) for line in chunk]
+
+            resources: List[SovereignResource] = []
+            parent_map: Dict[str, str] = {}
+            for item, parent_id in decoded:
+                resource = item if isinstance(item, SovereignResource) else SovereignResource.from_dict(
+                    item, blob_store=graph.blob_store, verify=True
+                )
+                resources.append(resource)
+                if parent_id:
+                    parent_map[resource.resource_id] = parent_id
+
+            graph.add_resources(resources, parent_map)
+            total += len(resources)
+            if progress is not None:
+                progress(total)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return total
+
+
+def main(argv: List[str] = None) -> int:
+    p = argparse.ArgumentParser(description="Bulk-ingest a JSONL resource corpus into the fractal graph (OFFLINE)")
+    p.add_argument("input", help="JSONL file of SovereignResource records ('-' for stdin)")
+    p.add_argument("--evidence-path", default="evidence/genealogy/", help="Graph evidence directory")
+    p.add_argument("--workers", type=int, default=0, help="Process pool size for decode + hashing (0: in-process)")
+    p.add_argument("--chunk-size", type=int, default=10_000, help="Resources per insert/journal batch")
+    p.add_argument("--min-rate", type=float, default=0.0, help="Exit non-zero if resources/sec falls below this")
+    p.add_argument("--quiet", action="store_true", help="No progress lines on stderr")
+    args = p.parse_args(argv)
+
+    graph = FractalGraph(evidence_path=args.evidence_path)
+    start = time.perf_counter()
+
+    def _progress(done: int) -> None:
+        if not args.quiet:
+            elapsed = time.perf_counter() - start
+            print(f"ingested={done} rate={done / elapsed if elapsed else 0:.0f}/s", file=sys.stderr)
+
+    src = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    try:
+        count = ingest_jsonl(graph, iter(src), workers=args.workers, chunk_size=args.chunk_size, progress=_progress)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        graph.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    print(json.dumps({
+        "ingested": count,
+        "seconds": round(elapsed, 3),
+        "resources_per_second": round(rate, 1),
+        "graph_nodes": graph.graph.number_of_nodes(),
+    }, indent=2))
+
+    if args.min_rate and count and rate < args.min_rate:
+        print(f"throughput {rate:.0f}/s below target {args.min_rate:.0f}/s", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,238 @@
+"""
+Sovereign Lineage Store (Phase 1)
+
+Compact, array-backed lineage graph for FractalGraph. Every resource has at
+most one parent, so the graph is a forest and fits in flat typed arrays:
+
+- resource ids interned to integer indices (insertion order)
+- `parent[i]`: index of the parent, -1 for roots        (int64)
+- `depth[i]`: lineage depth                             (int32)
+- `hashes[32*i:32*i+32]`: raw constitutional hash bytes (SHA3-256)
+
+The store keeps the small part of the `networkx.DiGraph` API FractalGraph and
+its callers rely on (`in`, `nodes[id][...]`, `add_node`, `add_edge`,
+`predecessors`, `edges`, `number_of_nodes`).
+
+Snapshots are raw little-endian arrays in a generation directory
+(`lineage_<gen>/parent.i64`, `depth.i32`, `hash.bin`, `ids.txt`) published by
+atomically replacing `lineage.json`; the array files can be opened directly
+with `numpy.memmap` for analysis.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+_HASH_BYTES = 32
+_NO_HASH = bytes(_HASH_BYTES)
+
+MANIFEST_FILE = "lineage.json"
+
+
+def _hash_to_bytes(value: str) -> bytes:
+    if not value:
+        return _NO_HASH
+    raw = bytes.fromhex(value)
+    if len(raw) != _HASH_BYTES:
+        raise ValueError(f"constitutional hash must be {_HASH_BYTES} bytes, got {len(raw)}")
+    return raw
+
+
+class _NodeView:
+    """Read-only `graph.nodes` look-alike: iterate ids, index to an attribute dict."""
+
+    def __init__(self, store: "LineageStore"):
+        self._store = store
+
+    def __getitem__(self, resource_id: str) -> Dict[str, Any]:
+        i = self._store._index[resource_id]
+        return {
+            "constitutional_hash": self._store.hash_at(i),
+            "lineage_depth": self._store.depth[i],
+        }
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.ids)
+
+    def __len__(self) -> int:
+        return len(self._store.ids)
+
+    def __contains__(self, resource_id: object) -> bool:
+        return resource_id in self._store._index
+
+
+class LineageStore:
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self._index: Dict[str, int] = {}
+        self.parent = array("q")
+        self.depth = array("i")
+        self.hashes = bytearray()
+
+    # ---- networkx-compatible surface ----
+
+    @property
+    def nodes(self) -> _NodeView:
+        return _NodeView(self)
+
+    @property
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        ids, parent = self.ids, self.parent
+        return ((ids[p], ids[i]) for i, p in enumerate(parent) if p >= 0)
+
+    def __contains__(self, resource_id: object) -> bool:
+        return resource_id in self._index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def has_node(self, resource_id: str) -> bool:
+        return resource_id in self._index
+
+    def number_of_nodes(self) -> int:
+        return len(self.ids)
+
+    def number_of_edges(self) -> int:
+        return sum(1 for p in self.parent if p >= 0)
+
+    def _intern(self, resource_id: str) -> int:
+        i = self._index.get(resource_id)
+        if i is None:
+            if "\n" in resource_id:
+                raise ValueError("resource_id must not contain newlines")
+            i = len(self.ids)
+            self._index[resource_id] = i
+            self.ids.append(resource_id)
+            self.parent.append(-1)
+            self.depth.append(0)
+            self.hashes += _NO_HASH
+        return i
+
+    def add_node(self, resource_id: str, constitutional_hash: str = "", lineage_depth: int = 0) -> None:
+        i = self._intern(resource_id)
+        self.depth[i] = int(lineage_depth)
+        self.hashes[i * _HASH_BYTES:(i + 1) * _HASH_BYTES] = _hash_to_bytes(constitutional_hash)
+
+    def add_edge(self, source: str, target: str) -> None:
+        s = self._intern(source)
+        t = self._intern(target)
+        existing = self.parent[t]
+        if existing >= 0 and existing != s:
+            raise ValueError(f"{target} already has parent {self.ids[existing]}")
+        self.parent[t] = s
+
+    def predecessors(self, resource_id: str) -> Iterator[str]:
+        p = self.parent[self._index[resource_id]]
+        if p >= 0:
+            yield self.ids[p]
+
+    def successors(self, resource_id: str) -> Iterator[str]:
+        """Children of a node. O(n): the store only indexes parents."""
+        s = self._index[resource_id]
+        return (self.ids[i] for i, p in enumerate(self.parent) if p == s)
+
+    # ---- index-level access ----
+
+    def index_of(self, resource_id: str) -> int:
+        return self._index[resource_id]
+
+    def raw_hash_at(self, i: int) -> bytes:
+        return bytes(self.hashes[i * _HASH_BYTES:(i + 1) * _HASH_BYTES])
+
+    def hash_at(self, i: int) -> str:
+        raw = bytes(self.hashes[i * _HASH_BYTES:(i + 1) * _HASH_BYTES])
+        return "" if raw == _NO_HASH else raw.hex()
+
+    def parent_id(self, resource_id: str) -> Optional[str]:
+        p = self.parent[self._index[resource_id]]
+        return self.ids[p] if p >= 0 else None
+
+    def memory_bytes(self) -> int:
+        """Approximate resident size of arrays, id strings and the intern table."""
+        ids = sum(sys.getsizeof(x) for x in self.ids)
+        return (
+            self.parent.itemsize * len(self.parent)
+            + self.depth.itemsize * len(self.depth)
+            + len(self.hashes)
+            + ids
+            + sys.getsizeof(self.ids)
+            + sys.getsizeof(self._index)
+        )
+
+    # ---- persistence ----
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Write a new snapshot generation and publish it atomically."""
+        directory = Path(directory)
+        manifest = directory / MANIFEST_FILE
+        old_gen = None
+        if manifest.exists():
+            old_gen = json.loads(manifest.read_text(encoding="utf-8")).get("generation")
+        gen = (int(old_gen) + 1) if old_gen is not None else 1
+
+        gen_dir = directory / f"lineage_{gen:06d}"
+        if gen_dir.exists():
+            shutil.rmtree(gen_dir)
+        gen_dir.mkdir(parents=True)
+
+        parent, depth = self.parent, self.depth
+        if sys.byteorder != "little":
+            parent, depth = array("q", parent), array("i", depth)
+            parent.byteswap()
+            depth.byteswap()
+
+        for name, payload in (
+            ("parent.i64", parent.tobytes()),
+            ("depth.i32", depth.tobytes()),
+            ("hash.bin", bytes(self.hashes)),
+            ("ids.txt", "\n".join(self.ids).encode("utf-8")),
+        ):
+            with open(gen_dir / name, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+
+        tmp = manifest.with_name(MANIFEST_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"generation": gen, "count": len(self.ids), "format": "lineage-v1"}))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, manifest)
+
+        if old_gen is not None:
+            shutil.rmtree(directory / f"lineage_{int(old_gen):06d}", ignore_errors=True)
+
+    @classmethod
+    def load(cls, directory: Union[str, Path]) -> Optional["LineageStore"]:
+        """Load the published snapshot, or None if there is none."""
+        directory = Path(directory)
+        manifest = directory / MANIFEST_FILE
+        if not manifest.exists():
+            return None
+        meta = json.loads(manifest.read_text(encoding="utf-8"))
+        gen_dir = directory / f"lineage_{int(meta['generation']):06d}"
+        count = int(meta["count"])
+
+        store = cls()
+        text = (gen_dir / "ids.txt").read_bytes().decode("utf-8")
+        store.ids = text.split("\n") if count else []
+        if len(store.ids) != count:
+            raise ValueError(f"lineage snapshot id count mismatch: {len(store.ids)} != {count}")
+        store._index = {rid: i for i, rid in enumerate(store.ids)}
+
+        store.parent.frombytes((gen_dir / "parent.i64").read_bytes())
+        store.depth.frombytes((gen_dir / "depth.i32").read_bytes())
+        if sys.byteorder != "little":
+            store.parent.byteswap()
+            store.depth.byteswap()
+        store.hashes = bytearray((gen_dir / "hash.bin").read_bytes())
+
+        if len(store.parent) != count or len(store.depth) != count or len(store.hashes) != count * _HASH_BYTES:
+            raise ValueError("lineage snapshot array length mismatch")
+        return store
@@ -0,0 +1,156 @@
+"""
+Sovereign Merkle Index (Phase 1)
+
+Append-only Merkle tree over every node of the fractal graph, in insertion
+order, with RFC 6962 (Certificate Transparency) tree shape and domain
+separation over SHA3-256:
+
+- leaf:  H(0x00 || "<resource_id>:<constitutional_hash>:<lineage_depth>")
+- node:  H(0x01 || left || right)
+
+Only complete (perfect, aligned) subtrees are stored, one flat bytearray of
+32-byte digests per level, so `append` and `update` touch O(log n) digests;
+the root and inclusion proofs are assembled from those subtrees in O(log n)
+space. `verify_inclusion` needs nothing but the leaf, its index, the tree
+size, the audit path and a (signed) root.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import List, Sequence, Union
+
+_DIGEST = 32
+
+
+def leaf_hash(resource_id: str, constitutional_hash: str, lineage_depth: int) -> bytes:
+    return hashlib.sha3_256(b"\x00" + f"{resource_id}:{constitutional_hash}:{int(lineage_depth)}".encode()).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha3_256(b"\x01" + left + right).digest()
+
+
+def _split(n: int) -> int:
+    """Largest power of two strictly less than n (n >= 2)."""
+    return 1 << ((n - 1).bit_length() - 1)
+
+
+class MerkleIndex:
+    def __init__(self) -> None:
+        self._levels: List[bytearray] = [bytearray()]
+
+    def __len__(self) -> int:
+        return len(self._levels[0]) // _DIGEST
+
+    @property
+    def size(self) -> int:
+        return len(self)
+
+    def _get(self, level: int, i: int) -> bytes:
+        return bytes(self._levels[level][i * _DIGEST:(i + 1) * _DIGEST])
+
+    def _set(self, level: int, i: int, digest: bytes) -> None:
+        buf = self._levels[level]
+        if len(buf) == i * _DIGEST:
+            buf += digest
+        else:
+            buf[i * _DIGEST:(i + 1) * _DIGEST] = digest
+
+    # ---- mutation ----
+
+    def append(self, leaf: bytes) -> int:
+        """Add a leaf digest; returns its index. Hashes at most log2(n) nodes."""
+        index = len(self)
+        self._set(0, index, leaf)
+        i, level = index, 0
+        while i & 1:
+            if level + 1 == len(self._levels):
+                self._levels.append(bytearray())
+            self._set(level + 1, i >> 1, node_hash(self._get(level, i - 1), self._get(level, i)))
+            i >>= 1
+            level += 1
+        return index
+
+    def update(self, index: int, leaf: bytes) -> None:
+        """Replace a leaf digest (a re-embedded node) and rehash its complete ancestors."""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        self._set(0, index, leaf)
+        i, level = index, 0
+        while level + 1 < len(self._levels) and (i >> 1) < len(self._levels[level + 1]) // _DIGEST:
+            left, right = (i - 1, i) if i & 1 else (i, i + 1)
+            self._set(level + 1, i >> 1, node_hash(self._get(level, left), self._get(level, right)))
+            i >>= 1
+            level += 1
+
+    # ---- reading ----
+
+    def leaf(self, index: int) -> bytes:
+        return self._get(0, index)
+
+    def _subtree(self, start: int, end: int) -> bytes:
+        n = end - start
+        if n & (n - 1) == 0:
+            level = n.bit_length() - 1
+            return self._get(level, start >> level)
+        k = _split(n)
+        return node_hash(self._subtree(start, start + k), self._subtree(start + k, end))
+
+    def root(self, size: int = None) -> bytes:
+        """Root over the first `size` leaves (default: all); empty tree is H("")."""
+        size = len(self) if size is None else size
+        if not 0 <= size <= len(self):
+            raise ValueError(f"size {size} outside 0..{len(self)}")
+        if size == 0:
+            return hashlib.sha3_256(b"").digest()
+        return self._subtree(0, size)
+
+    def inclusion_proof(self, index: int, size: int = None) -> List[bytes]:
+        """RFC 6962 audit path for leaf `index` in the tree of the first `size` leaves."""
+        size = len(self) if size is None else size
+        if not 0 <= index < size <= len(self):
+            raise IndexError(f"leaf {index} not in tree of size {size}")
+        path: List[bytes] = []
+        start, end = 0, size
+        while end - start > 1:
+            k = _split(end - start)
+            if index < start + k:
+                path.append(self._subtree(start + k, end))
+                end = start + k
+            else:
+                path.append(self._subtree(start, start + k))
+                start = start + k
+        path.reverse()
+        return path
+
+
+def verify_inclusion(
+    leaf: Union[bytes, str],
+    index: int,
+    size: int,
+    path: Sequence[Union[bytes, str]],
+    root: Union[bytes, str],
+) -> bool:
+    """Check an audit path (RFC 9162 section 2.1.3.2); digests may be bytes or hex."""
+    def _raw(d: Union[bytes, str]) -> bytes:
+        return bytes.fromhex(d) if isinstance(d, str) else d
+
+    if not 0 <= index < size:
+        return False
+    fn, sn = index, size - 1
+    r = _raw(leaf)
+    for p in path:
+        p = _raw(p)
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            r = node_hash(p, r)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            r = node_hash(r, p)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and r == _raw(root)
@@ -0,0 +1,183 @@
+"""
+Sovereign Receipt Batching (Phase 1)
+
+Amortises receipt signing and logging over many verified reads. Receipts are
+accumulated for up to `max_ops` operations or `max_ms` milliseconds, then
+sealed together: one Merkle tree over the receipts (same tree shape and
+domain separation as `merkle_index`), one signature over the batch root, one
+callback (one evidence log line) per batch.
+
+Each sealed receipt carries its own `batch` record - batch id, leaf index,
+batch size, batch root and audit path - and the root signature in
+`storage_root_signature`, so it stays independently verifiable with only the
+storage root public key (`verify_batch_inclusion`).
+
+A leaf commits to the receipt hash together with the authorized resource's
+constitutional hash and fractal depth - what the unbatched path signs - so a
+batched receipt attests to the same resource state as an unbatched one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .merkle_index import MerkleIndex, verify_inclusion
+from .signing import verify_signature
+
+
+def receipt_leaf(receipt_hash: str, package_hash: str, fractal_depth: int) -> bytes:
+    preimage = json.dumps([receipt_hash, package_hash, int(fractal_depth)]).encode()
+    return hashlib.sha3_256(b"\x00" + preimage).digest()
+
+
+def batch_statement(batch_id: str, batch_root: str, batch_size: int) -> bytes:
+    return json.dumps(
+        {"batch_id": batch_id, "batch_root": batch_root, "batch_size": batch_size},
+        sort_keys=True,
+    ).encode()
+
+
+def verify_batch_inclusion(
+    receipt_hash: str,
+    package_hash: str,
+    fractal_depth: int,
+    batch: Dict[str, Any],
+    signature: str,
+    key_type: Optional[str],
+    public_key_pem: str,
+) -> bool:
+    """Check the batch root signature and the receipt's audit path within the batch."""
+    try:
+        if not verify_signature(
+            public_key_pem,
+            batch_statement(batch["batch_id"], batch["batch_root"], int(batch["batch_size"])),
+            signature,
+            key_type,
+        ):
+            return False
+        return verify_inclusion(
+            receipt_leaf(receipt_hash, package_hash, fractal_depth),
+            int(batch["leaf_index"]),
+            int(batch["batch_size"]),
+            batch["audit_path"],
+            batch["batch_root"],
+        )
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+class ReceiptBatcher:
+    """
+    Collects unsigned receipts (objects with `constitutional_hash`,
+    `package_hash`, `fractal_depth`, `storage_root_signature` and `batch`
+    attributes) and seals them in batches.
+
+    `submit` returns a Future resolved with the sealed receipt. A batch is
+    sealed in the submitting thread when it reaches `max_ops`, by a timer
+    thread `max_ms` after its first receipt, or by `flush`/`close`.
+    `on_seal(batch_id, batch_root, receipts)` runs once per sealed batch.
+    """
+
+    def __init__(
+        self,
+        sign: Callable[[bytes], str],
+        on_seal: Optional[Callable[[str, str, List[Any]], None]] = None,
+        max_ops: int = 256,
+        max_ms: float = 50.0,
+    ):
+        if max_ops <= 0:
+            raise ValueError("max_ops must be > 0")
+        self._sign = sign
+        self._on_seal = on_seal
+        self.max_ops = max_ops
+        self.max_ms = max_ms
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[Any, Future]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._seq = 0
+        self.batches = 0
+        self.receipts = 0
+
+    def submit(self, receipt: Any) -> "Future[Any]":
+        future: Future = Future()
+        with self._lock:
+            self._pending.append((receipt, future))
+            if len(self._pending) >= self.max_ops:
+                batch = self._take()
+            else:
+                batch = None
+                if self._timer is None and self.max_ms > 0:
+                    self._timer = threading.Timer(self.max_ms / 1000.0, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._seal(*batch)
+        return future
+
+    def flush(self) -> int:
+        """Seal whatever is pending now; returns the number of receipts sealed."""
+        with self._lock:
+            batch = self._take()
+        if not batch:
+            return 0
+        self._seal(*batch)
+        return len(batch[1])
+
+    def close(self) -> None:
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_ops": self.max_ops,
+            "max_ms": self.max_ms,
+            "batches": self.batches,
+            "receipts": self.receipts,
+            "pending": len(self._pending),
+        }
+
+    def _take(self) -> Optional[Tuple[str, List[Tuple[Any, Future]]]]:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, []
+        self._seq += 1
+        self.batches += 1
+        self.receipts += len(pending)
+        return f"rb_{time.time_ns():x}_{self._seq:06d}", pending
+
+    def _seal(self, batch_id: str, pending: List[Tuple[Any, Future]]) -> None:
+        try:
+            tree = MerkleIndex()
+            for receipt, _ in pending:
+                tree.append(receipt_leaf(
+                    receipt.constitutional_hash, receipt.package_hash or "", receipt.fractal_depth
+                ))
+            root = tree.root().hex()
+            signature = self._sign(batch_statement(batch_id, root, len(pending)))
+
+            receipts = []
+            for i, (receipt, _) in enumerate(pending):
+                receipt.storage_root_signature = signature
+                receipt.batch = {
+                    "batch_id": batch_id,
+                    "batch_root": root,
+                    "batch_size": len(pending),
+                    "leaf_index": i,
+                    "audit_path": [d.hex() for d in tree.inclusion_proof(i)],
+                }
+                receipts.append(receipt)
+            if self._on_seal is not None:
+                self._on_seal(batch_id, root, receipts)
+        except Exception as exc:
+            for _, future in pending:
+                future.set_exception(exc)
+            return
+        for receipt, future in pending:
+            future.set_result(receipt)
@@ -0,0 +1,207 @@
+"""
+Sovereign Resource Frames (Phase 1)
+
+Length-prefixed binary container for exporting and importing resources,
+replacing JSON + base64 (`to_dict`/`from_dict`) for evidence sets:
+
+    file   := "SVRF" u16 version u16 flags  frame*  end
+    frame  := u32 header_len  u64 data_len  32-byte constitutional hash
+              header (canonical JSON: resource_id, resource_type,
+              governance_template, metadata[, parent_id])
+              data (raw payload bytes)
+    end    := u32 0  u64 frame_count  32 zero bytes
+
+All integers are little-endian. The end record makes truncation detectable.
+
+Writers stream one frame at a time (blob-backed payloads chunk by chunk).
+`iter_frames` walks an in-memory or mapped buffer and hands out `memoryview`
+slices of it - headers are parsed, payloads are never copied; `open_frames`
+maps a file for that. `read_frames` reads a non-seekable stream frame by frame.
+`Frame.to_resource` rebuilds the resource and, by default, checks its
+constitutional hash against the frame.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Union
+
+from .blob_store import BlobStore
+from .sovereign_resource import AccessLevel, ResourceType, SovereignResource, _canonical_json, _plain_metadata
+
+MAGIC = b"SVRF"
+FORMAT_VERSION = 1
+
+_FILE_HEADER = struct.Struct("<4sHH")
+_FRAME_HEADER = struct.Struct("<IQ32s")
+_NO_HASH = bytes(32)
+
+
+@dataclass(frozen=True)
+class Frame:
+    header: Dict[str, Any]
+    data: memoryview
+    constitutional_hash: str
+
+    @property
+    def resource_id(self) -> str:
+        return self.header["resource_id"]
+
+    @property
+    def parent_id(self) -> Optional[str]:
+        return self.header.get("parent_id")
+
+    def to_resource(self, verify: bool = True) -> SovereignResource:
+        """Rebuild the resource over the frame's payload view (no copy)."""
+        metadata = dict(self.header.get("metadata") or {})
+        if isinstance(metadata.get("access_level"), str):
+            try:
+                metadata["access_level"] = AccessLevel(metadata["access_level"])
+            except ValueError:
+                pass
+        resource = SovereignResource(
+            resource_type=ResourceType(self.header["resource_type"]),
+            data=self.data,
+            metadata=metadata,
+            governance_template=self.header.get("governance_template") or "",
+            resource_id=self.resource_id,
+            constitutional_hash=self.constitutional_hash,
+        )
+        if verify and resource.compute_constitutional_hash() != self.constitutional_hash:
+            raise ValueError(f"frame {self.resource_id} does not match its constitutional hash")
+        return resource
+
+
+class FrameWriter:
+    """Streams resources to a binary stream; `close` writes the end record."""
+
+    def __init__(self, stream: BinaryIO, blob_store: Optional[BlobStore] = None):
+        self.stream = stream
+        self.blob_store = blob_store
+        self.count = 0
+        self.bytes_written = _FILE_HEADER.size
+        self._closed = False
+        stream.write(_FILE_HEADER.pack(MAGIC, FORMAT_VERSION, 0))
+
+    def __enter__(self) -> "FrameWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+
+    def write(self, resource: SovereignResource, parent_id: Optional[str] = None) -> int:
+        """Append one frame; returns its size in bytes."""
+        header: Dict[str, Any] = {
+            "resource_id": resource.resource_id,
+            "resource_type": resource.resource_type.value,
+            "governance_template": resource.governance_template,
+            "metadata": _plain_metadata(resource.metadata),
+        }
+        if parent_id:
+            header["parent_id"] = parent_id
+        encoded = _canonical_json(header).encode("utf-8")
+        chash = bytes.fromhex(resource.constitutional_hash) if resource.constitutional_hash else _NO_HASH
+
+        if resource.blob_ref is not None and self.blob_store is not None:
+            size = resource.blob_ref.size
+            parts = self.blob_store.iter_chunks(resource.blob_ref)
+        else:
+            size = memoryview(resource.data).nbytes
+            parts = (resource.data,)
+
+        self.stream.write(_FRAME_HEADER.pack(len(encoded), size, chash))
+        self.stream.write(encoded)
+        for part in parts:
+            self.stream.write(part)
+
+        written = _FRAME_HEADER.size + len(encoded) + size
+        self.count += 1
+        self.bytes_written += written
+        return written
+
+    def close(self) -> int:
+        """Write the end record (once); returns the number of frames."""
+        if not self._closed:
+            self.stream.write(_FRAME_HEADER.pack(0, self.count, _NO_HASH))
+            self.bytes_written += _FRAME_HEADER.size
+            self._closed = True
+        return self.count
+
+
+def _check_file_header(raw: bytes) -> None:
+    if len(raw) < _FILE_HEADER.size:
+        raise ValueError("not a resource frame file (too short)")
+    magic, version, _ = _FILE_HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError("not a resource frame file (bad magic)")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported resource frame version {version}")
+
+
+def _frame(header: bytes, data: memoryview, chash: bytes) -> Frame:
+    return Frame(
+        header=json.loads(bytes(header)),
+        data=data,
+        constitutional_hash="" if chash == _NO_HASH else chash.hex(),
+    )
+
+
+def iter_frames(buffer: Union[bytes, bytearray, memoryview, mmap.mmap]) -> Iterator[Frame]:
+    """Frames of an in-memory or mapped container; payloads are views into `buffer`."""
+    view = memoryview(buffer).cast("B")
+    _check_file_header(view[:_FILE_HEADER.size])
+    pos, count = _FILE_HEADER.size, 0
+    while True:
+        if pos + _FRAME_HEADER.size > len(view):
+            raise ValueError(f"resource frame container truncated after {count} frames")
+        header_len, data_len, chash = _FRAME_HEADER.unpack_from(view, pos)
+        pos += _FRAME_HEADER.size
+        if header_len == 0:
+            if data_len != count:
+                raise ValueError(f"end record says {data_len} frames, read {count}")
+            return
+        end = pos + header_len + data_len
+        if end > len(view):
+            raise ValueError(f"resource frame container truncated after {count} frames")
+        yield _frame(view[pos:pos + header_len], view[pos + header_len:end], chash)
+        pos = end
+        count += 1
+
+
+def open_frames(path: Union[str, Path]) -> Iterator[Frame]:
+    """Map a container file read-only and iterate its frames (payloads stay mapped)."""
+    with open(path, "rb") as f:
+        if f.seek(0, 2) == 0:
+            raise ValueError("not a resource frame file (empty)")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return iter_frames(mapped)
+
+
+def _read_exact(stream: BinaryIO, n: int) -> bytes:
+    out = stream.read(n)
+    while len(out) < n:
+        more = stream.read(n - len(out))
+        if not more:
+            raise ValueError("resource frame stream truncated")
+        out += more
+    return out
+
+
+def read_frames(stream: BinaryIO) -> Iterator[Frame]:
+    """Frames from a (possibly non-seekable) stream, one frame buffered at a time."""
+    _check_file_header(_read_exact(stream, _FILE_HEADER.size))
+    count = 0
+    while True:
+        header_len, data_len, chash = _FRAME_HEADER.unpack(_read_exact(stream, _FRAME_HEADER.size))
+        if header_len == 0:
+            if data_len != count:
+                raise ValueError(f"end record says {data_len} frames, read {count}")
+            return
+        body = memoryview(_read_exact(stream, header_len + data_len))
+        yield _frame(body[:header_len], body[header_len:], chash)
+        count += 1
@@ -0,0 +1,151 @@
+"""
+Sovereign Resource Registry (Phase 1)
+
+Persistent resource registry for the fractal graph: every resource is stored
+as its `to_dict()` record in SQLite (`registry.sqlite` under the evidence
+path; large payloads are already blob references) and loaded lazily on first
+access through a bounded LRU cache.
+
+Opening the registry does not read any records, so start-up cost does not
+depend on registry size, and the number of resources held in memory is
+capped at `cache_size`.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+from .blob_store import BlobStore
+from .sovereign_resource import SovereignResource
+
+
+class ResourceRegistry:
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        cache_size: int = 10_000,
+        blob_store: Optional[Callable[[], BlobStore]] = None,
+    ):
+        if cache_size <= 0:
+            raise ValueError("cache_size must be > 0")
+        self.db_path = Path(db_path)
+        self.cache_size = cache_size
+        self._blob_store = blob_store
+        self._cache: "OrderedDict[str, SovereignResource]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS resources (
+                resource_id TEXT PRIMARY KEY,
+                record TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    # ---- cache ----
+
+    def _remember(self, resource: SovereignResource) -> None:
+        self._cache[resource.resource_id] = resource
+        self._cache.move_to_end(resource.resource_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+            self.evictions += 1
+
+    def _decode(self, record: str) -> SovereignResource:
+        data = json.loads(record)
+        store = self._blob_store() if (self._blob_store is not None and data.get("blob_ref")) else None
+        return SovereignResource.from_dict(data, blob_store=store)
+
+    @staticmethod
+    def _encode(resource: SovereignResource) -> str:
+        return json.dumps(resource.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+    # ---- mapping API ----
+
+    def get(self, resource_id: str, default: Optional[SovereignResource] = None) -> Optional[SovereignResource]:
+        with self._lock:
+            cached = self._cache.get(resource_id)
+            if cached is not None:
+                self._cache.move_to_end(resource_id)
+                self.hits += 1
+                return cached
+
+            self.misses += 1
+            row = self._conn.execute(
+                "SELECT record FROM resources WHERE resource_id = ?", (resource_id,)
+            ).fetchone()
+            if row is None:
+                return default
+            resource = self._decode(row[0])
+            self._remember(resource)
+            return resource
+
+    def __getitem__(self, resource_id: str) -> SovereignResource:
+        resource = self.get(resource_id)
+        if resource is None:
+            raise KeyError(resource_id)
+        return resource
+
+    def __setitem__(self, resource_id: str, resource: SovereignResource) -> None:
+        self.put_many([resource])
+
+    def put_many(self, resources: Iterable[SovereignResource]) -> int:
+        """Write-through in a single transaction."""
+        with self._lock:
+            count = 0
+            with self._conn:
+                for resource in resources:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO resources (resource_id, record) VALUES (?, ?)",
+                        (resource.resource_id, self._encode(resource)),
+                    )
+                    self._remember(resource)
+                    count += 1
+            return count
+
+    def __contains__(self, resource_id: object) -> bool:
+        with self._lock:
+            if resource_id in self._cache:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM resources WHERE resource_id = ?", (resource_id,)
+            ).fetchone()
+            return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM resources").fetchone()[0])
+
+    def ids(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT resource_id FROM resources").fetchall()
+        for (resource_id,) in rows:
+            yield resource_id
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cache_size": self.cache_size,
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._conn.close()
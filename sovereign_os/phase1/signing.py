@@ -0,0 +1,199 @@
+"""
+Sovereign Signing (Phase 1)
+
+Pluggable storage-root signers. Every signature the storage substrate emits
+(authorization packages, receipts, graph roots) goes through a `Signer`, and
+the key type is recorded next to the signature so verifiers pick the right
+algorithm:
+
+- `ecdsa-p384`: ECDSA over P-384 with SHA-256 (the original scheme, default)
+- `ed25519`:    Ed25519, several times faster to sign and verify
+
+`Signer.sign_many` / `Signer.verify_many` run large batches in the signer's
+process pool. The pool is started on first use and kept until `close()`;
+workers receive the private key once (as PKCS#8 PEM, via the pool
+initializer) and then only the payloads. Batches smaller than
+`parallel_min_batch` are handled in-process, where pool overhead would
+outweigh the work. The module-level `verify_many` is for holders of a public
+key only; it starts a pool per call, so only above the same threshold.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+ECDSA_P384 = "ecdsa-p384"
+ED25519 = "ed25519"
+KEY_TYPES = (ECDSA_P384, ED25519)
+
+# Smallest batch worth handing to a process pool.
+PARALLEL_MIN_BATCH = 256
+
+
+class Signer:
+    """Storage-root signing key of one of `KEY_TYPES`."""
+
+    def __init__(self, private_key):
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            self.key_type = ED25519
+        elif isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(private_key.curve, ec.SECP384R1):
+            self.key_type = ECDSA_P384
+        else:
+            raise ValueError(f"unsupported storage key: {type(private_key).__name__}")
+        self.private_key = private_key
+        self.public_key = private_key.public_key()
+        self.public_key_pem = self.public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        ).decode()
+        self.parallel_min_batch = PARALLEL_MIN_BATCH
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
+
+    @classmethod
+    def generate(cls, key_type: str = ECDSA_P384) -> "Signer":
+        if key_type == ECDSA_P384:
+            return cls(ec.generate_private_key(ec.SECP384R1()))
+        if key_type == ED25519:
+            return cls(ed25519.Ed25519PrivateKey.generate())
+        raise ValueError(f"unknown key type {key_type!r} (expected one of {', '.join(KEY_TYPES)})")
+
+    @classmethod
+    def from_pem(cls, pem: bytes) -> "Signer":
+        return cls(load_pem_private_key(pem, password=None))
+
+    def private_pem(self) -> bytes:
+        return self.private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+
+    def sign(self, data: bytes) -> str:
+        if self.key_type == ED25519:
+            return self.private_key.sign(data).hex()
+        return self.private_key.sign(data, ec.ECDSA(hashes.SHA256())).hex()
+
+    def verify(self, data: bytes, signature: str) -> bool:
+        return verify_signature(self.public_key, data, signature, self.key_type)
+
+    def sign_many(self, payloads: Sequence[bytes], workers: int = 0) -> List[str]:
+        """Sign every payload, in the signer's process pool when `workers` > 0 and the batch is worth it."""
+        if not _worth_a_pool(len(payloads), workers, self.parallel_min_batch):
+            return [self.sign(p) for p in payloads]
+        return list(self._worker_pool(workers).map(_worker_sign, payloads, chunksize=_chunksize(len(payloads), workers)))
+
+    def verify_many(self, items: Sequence[Tuple[bytes, str, Optional[str]]], workers: int = 0) -> List[bool]:
+        """Verify `(data, signature, key_type)` triples against this signer's key (pooled like `sign_many`)."""
+        if not _worth_a_pool(len(items), workers, self.parallel_min_batch):
+            return [verify_signature(self.public_key, data, sig, key_type) for data, sig, key_type in items]
+        return list(self._worker_pool(workers).map(_worker_verify, items, chunksize=_chunksize(len(items), workers)))
+
+    def _worker_pool(self, workers: int) -> ProcessPoolExecutor:
+        """The signer's process pool, started on first use (restarted if `workers` changes)."""
+        with self._pool_lock:
+            if self._pool is None or self._pool_workers != workers:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=True)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker_signer,
+                    initargs=(self.private_pem(),),
+                )
+                self._pool_workers = workers
+            return self._pool
+
+    def close(self) -> None:
+        """Stop the process pool, if one was started."""
+        with self._pool_lock:
+            pool, self._pool, self._pool_workers = self._pool, None, 0
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+def load_public_key(public_key_pem: str):
+    return serialization.load_pem_public_key(public_key_pem.encode())
+
+
+def verify_signature(
+    public_key: Union[str, object],
+    data: bytes,
+    signature: str,
+    key_type: Optional[str] = None,
+) -> bool:
+    """Verify a hex signature; `public_key` is a key object or SubjectPublicKeyInfo PEM.
+
+    `key_type` (as recorded next to the signature) must match the key when given.
+    """
+    if isinstance(public_key, str):
+        public_key = load_public_key(public_key)
+    actual = ED25519 if isinstance(public_key, ed25519.Ed25519PublicKey) else ECDSA_P384
+    if key_type is not None and key_type != actual:
+        return False
+    try:
+        raw = bytes.fromhex(signature)
+        if actual == ED25519:
+            public_key.verify(raw, data)
+        else:
+            public_key.verify(raw, data, ec.ECDSA(hashes.SHA256()))
+    except (InvalidSignature, TypeError, ValueError):  # malformed signatures are invalid, not errors
+        return False
+    return True
+
+
+def verify_many(
+    public_key_pem: str,
+    items: Sequence[Tuple[bytes, str, Optional[str]]],
+    workers: int = 0,
+) -> List[bool]:
+    """Verify `(data, signature, key_type)` triples; a one-off process pool is used when
+    `workers` > 0 and the batch reaches `PARALLEL_MIN_BATCH` (see `Signer.verify_many`)."""
+    if not _worth_a_pool(len(items), workers, PARALLEL_MIN_BATCH):
+        public_key = load_public_key(public_key_pem)
+        return [verify_signature(public_key, data, sig, key_type) for data, sig, key_type in items]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker_verifier,
+        initargs=(public_key_pem,),
+    ) as pool:
+        return list(pool.map(_worker_verify, items, chunksize=_chunksize(len(items), workers)))
+
+
+def _worth_a_pool(count: int, workers: int, min_batch: int) -> bool:
+    return workers > 0 and count >= max(min_batch, 2 * workers)
+
+
+def _chunksize(count: int, workers: int) -> int:
+    return max(1, count // (workers * 4))
+
+
+# ---- process-pool workers ----
+
+_WORKER_KEYS: Dict[str, object] = {}
+
+
+def _init_worker_signer(pem: bytes) -> None:
+    signer = Signer.from_pem(pem)
+    _WORKER_KEYS["signer"] = signer
+    _WORKER_KEYS["public_key"] = signer.public_key
+
+
+def _worker_sign(payload: bytes) -> str:
+    return _WORKER_KEYS["signer"].sign(payload)
+
+
+def _init_worker_verifier(public_key_pem: str) -> None:
+    _WORKER_KEYS["public_key"] = load_public_key(public_key_pem)
+
+
+def _worker_verify(item: Tuple[bytes, str, Optional[str]]) -> bool:
+    data, signature, key_type = item
+    return verify_signature(_WORKER_KEYS["public_key"], data, signature, key_type)
@@ -14,11 +14,15 @@ from __future__ import annotations
 import base64
 import hashlib
 import json
-from dataclasses import dataclass
+import mmap
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Union
 from uuid import uuid4
 
+from .blob_store import DEFAULT_CHUNK_SIZE, BlobRef, BlobStore
+
 
 class ResourceType(str, Enum):
     SYSTEM = "system"
@@ -40,21 +44,52 @@ def _sha3_hex(value: str) -> str:
     return hashlib.sha3_256(value.encode("utf-8")).hexdigest()
 
 
-@dataclass
+def _sha3_stream(data: Union[bytes, memoryview], chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """SHA3-256 of `data`, fed in slices so a mapped payload is paged in a chunk at a time."""
+    view = memoryview(data)
+    if view.nbytes <= chunk_size:
+        return hashlib.sha3_256(view).hexdigest()
+    h = hashlib.sha3_256()
+    view = view.cast("B")
+    for start in range(0, view.nbytes, chunk_size):
+        h.update(view[start:start + chunk_size])
+    return h.hexdigest()
+
+
+def _plain_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """`metadata` with enum values serialised; the same dict when nothing needs converting."""
+    metadata = metadata or {}
+    if isinstance(metadata.get("access_level"), Enum):
+        metadata = dict(metadata)
+        metadata["access_level"] = metadata["access_level"].value
+    return metadata
+
+
+@dataclass(slots=True)
 class SovereignResource:
     """A minimal, policy-embedded resource object.
 
     This object is evidence-grade and deterministic:
     - `constitutional_hash` is derived from resource content + metadata + governance embedding.
     - `embed_parent_governance` tightens lineage integrity by updating the hash.
+
+    Large payloads live in a `BlobStore`: `blob_ref` names the content and
+    `data` is then a read-only `memoryview` over the mapped blob.
+
+    The payload digest is computed once and cached against the `data` object
+    (assigning new `data` invalidates it), so re-embedding governance only
+    re-hashes the small metadata envelope.
     """
 
     resource_type: ResourceType
-    data: bytes
+    data: Union[bytes, memoryview]
     metadata: Dict[str, Any]
     governance_template: str
     resource_id: str = ""
     constitutional_hash: str = ""
+    blob_ref: Optional[BlobRef] = None
+    _data_digest: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _digest_source: Any = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not self.resource_id:
@@ -62,21 +97,96 @@ class SovereignResource:
         if not self.constitutional_hash:
             self.constitutional_hash = self.compute_constitutional_hash()
 
-    def compute_constitutional_hash(self) -> str:
-        metadata = dict(self.metadata or {})
-        if isinstance(metadata.get("access_level"), Enum):
-            metadata["access_level"] = metadata["access_level"].value
+    @classmethod
+    def from_stream(
+        cls,
+        store: BlobStore,
+        stream: BinaryIO,
+        resource_type: ResourceType,
+        metadata: Dict[str, Any],
+        governance_template: str,
+        resource_id: str = "",
+    ) -> "SovereignResource":
+        """Create a blob-backed resource, streaming `stream` into `store` chunk by chunk."""
+        ref = store.put_stream(stream)
+        return cls(
+            resource_type=resource_type,
+            data=store.view(ref),
+            metadata=metadata,
+            governance_template=governance_template,
+            resource_id=resource_id,
+            blob_ref=ref,
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: Union[str, Path],
+        resource_type: ResourceType,
+        metadata: Dict[str, Any],
+        governance_template: str,
+        resource_id: str = "",
+        store: Optional[BlobStore] = None,
+    ) -> "SovereignResource":
+        """Create a resource from a file without reading it into memory.
 
+        With a `store` the file is streamed into it (see `from_stream`);
+        otherwise `data` is a read-only mapped view of the file, hashed in chunks.
+        """
+        with open(path, "rb") as f:
+            if store is not None:
+                return cls.from_stream(store, f, resource_type, metadata, governance_template, resource_id)
+            if f.seek(0, 2) == 0:
+                data: Union[bytes, memoryview] = b""
+            else:
+                data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return cls(
+            resource_type=resource_type,
+            data=data,
+            metadata=metadata,
+            governance_template=governance_template,
+            resource_id=resource_id,
+        )
+
+    def move_to_blob_store(self, store: BlobStore) -> None:
+        """Replace in-memory `data` with a mapped view of the stored blob (hash unchanged)."""
+        if self.blob_ref is not None:
+            return
+        self.blob_ref = store.put_bytes(self.data)
+        self.data = store.view(self.blob_ref)
+
+    def data_digest(self) -> str:
+        if self.blob_ref is not None:
+            return self.blob_ref.digest
+        if self._data_digest is None or self._digest_source is not self.data:
+            self._remember_digest(_sha3_stream(self.data))
+        return self._data_digest
+
+    @property
+    def data_digest_cached(self) -> bool:
+        """True when `data_digest()` will not touch the payload."""
+        return self.blob_ref is not None or (self._data_digest is not None and self._digest_source is self.data)
+
+    def _remember_digest(self, digest: str) -> None:
+        self._data_digest = digest
+        self._digest_source = self.data
+
+    def compute_constitutional_hash(self) -> str:
+        """Hash content + metadata + governance."""
         payload = {
             "resource_id": self.resource_id,
             "resource_type": self.resource_type.value,
             "governance_template": self.governance_template,
-            "metadata": metadata,
-            "data_sha3_256": hashlib.sha3_256(self.data).hexdigest(),
+            "metadata": _plain_metadata(self.metadata),
+            "data_sha3_256": self.data_digest(),
         }
         return _sha3_hex(_canonical_json(payload))
 
-    def embed_parent_governance(self, parent_constitutional_hash: str, lineage_depth: int) -> None:
+    def embed_parent_governance(
+        self,
+        parent_constitutional_hash: str,
+        lineage_depth: int,
+    ) -> None:
         """Embed parent governance into this resource.
 
         This mutates the resource's constitutional embedding (hash) but does not
@@ -89,23 +199,41 @@ class SovereignResource:
         self.constitutional_hash = self.compute_constitutional_hash()
 
     def to_dict(self) -> Dict[str, Any]:
-        metadata = dict(self.metadata or {})
-        if isinstance(metadata.get("access_level"), Enum):
-            metadata["access_level"] = metadata["access_level"].value
-
-        return {
+        """Serialisable record. `metadata` is shared with the resource unless it needed converting."""
+        out = {
             "resource_id": self.resource_id,
             "resource_type": self.resource_type.value,
             "governance_template": self.governance_template,
-            "metadata": metadata,
-            "data_b64": base64.b64encode(self.data).decode("ascii"),
+            "metadata": _plain_metadata(self.metadata),
             "constitutional_hash": self.constitutional_hash,
         }
+        if self.blob_ref is not None:
+            out["blob_ref"] = self.blob_ref.to_dict()
+        else:
+            out["data_b64"] = base64.b64encode(self.data).decode("ascii")
+        return out
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "SovereignResource":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        blob_store: Optional[BlobStore] = None,
+        verify: bool = False,
+    ) -> "SovereignResource":
+        """Rebuild a resource from `to_dict` output.
+
+        The record's `constitutional_hash` is kept as given unless `verify`
+        is set, in which case it is recomputed and a mismatch raises ValueError.
+        """
         resource_type = ResourceType(str(data.get("resource_type")))
-        raw = base64.b64decode(str(data.get("data_b64", "")) or "")
+        blob_ref = None
+        if data.get("blob_ref"):
+            if blob_store is None:
+                raise ValueError("blob-backed resource record needs a blob_store to resolve its data")
+            blob_ref = BlobRef.from_dict(data["blob_ref"])
+            raw = blob_store.view(blob_ref)
+        else:
+            raw = base64.b64decode(str(data.get("data_b64", "")) or "")
         metadata = dict(data.get("metadata") or {})
         access_level = metadata.get("access_level")
         if isinstance(access_level, str):
@@ -121,7 +249,10 @@ class SovereignResource:
             governance_template=str(data.get("governance_template") or ""),
             resource_id=str(data.get("resource_id") or ""),
             constitutional_hash=str(data.get("constitutional_hash") or ""),
+            blob_ref=blob_ref,
         )
         if not obj.constitutional_hash:
             obj.constitutional_hash = obj.compute_constitutional_hash()
+        elif verify and obj.compute_constitutional_hash() != obj.constitutional_hash:
+            raise ValueError(f"record {obj.resource_id} does not match its constitutional hash")
         return obj
@@ -13,22 +13,31 @@ ARCHITECTURAL PRINCIPLE:
 
 import hashlib
 import json
+import os
+import threading
 import time
 import yaml
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import BinaryIO, Callable, Dict, Iterable, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
-import networkx as nx
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.serialization import load_pem_private_key
-from cryptography.exceptions import InvalidSignature
-
+from ..journal import JournalWriter
+from .blob_store import BlobStore
+from .lineage_store import LineageStore
+from .merkle_index import MerkleIndex, leaf_hash, verify_inclusion
+from .receipt_batch import ReceiptBatcher, verify_batch_inclusion
+from .resource_frames import Frame, FrameWriter, open_frames
+from .resource_registry import ResourceRegistry
+from .signing import ECDSA_P384, Signer, verify_signature
 from .sovereign_resource import SovereignResource, ResourceType, AccessLevel
 
 
+# libyaml's loader when available: same safe subset, several times faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 # =========================
 # Constitutional Exceptions
 # =========================
@@ -77,6 +86,14 @@ class StorageReceipt:
     witness_signatures: List[str] = field(default_factory=list)
     fractal_depth: int = 0
     execution_surface_id: Optional[str] = None
+    key_type: str = ECDSA_P384
+    # Batched receipts only: batch id/root/size, leaf index and audit path;
+    # `storage_root_signature` is then the signature over the batch root.
+    batch: Optional[Dict[str, Any]] = None
+    # Constitutional hash of the authorized resource (from the auth package).
+    # Unbatched receipts sign it directly; batched receipts commit to it in
+    # their Merkle leaf.
+    package_hash: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -104,16 +121,32 @@ class StoragePolicy:
     Constitutional storage policy derived from baseline.yaml and guardrails.
 
     Policies are generated OFFLINE and enforced by execution surfaces.
+
+    The constitution is parsed up front (its required sections are checked);
+    guardrails are parsed on first use.
     """
 
     def __init__(self, constitution_path: str, guardrails_path: str):
         self.constitution = self._load_yaml(constitution_path, required=["principles", "governance_model", "version"])
-        self.guardrails = self._load_yaml(guardrails_path, required=None)
+        if not Path(guardrails_path).is_file():
+            raise FileNotFoundError(guardrails_path)
+        self.guardrails_path = guardrails_path
+        self._guardrails: Optional[Dict[str, Any]] = None
+
+    @property
+    def guardrails(self) -> Dict[str, Any]:
+        if self._guardrails is None:
+            self._guardrails = self._load_yaml(self.guardrails_path, required=None)
+        return self._guardrails
+
+    @guardrails.setter
+    def guardrails(self, value: Dict[str, Any]) -> None:
+        self._guardrails = value
 
     @staticmethod
     def _load_yaml(path: str, required: Optional[List[str]]) -> Dict[str, Any]:
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         if required:
             for key in required:
@@ -131,13 +164,32 @@ class StoragePolicy:
         """
         Generate constraint set for an execution surface.
         """
+        return self.stamp_constraints(self.constraint_template(operation, resource_type, metadata))
+
+    @staticmethod
+    def stamp_constraints(template: Dict[str, Any]) -> Dict[str, Any]:
+        """Fresh constraint set from a template: copied rules plus a new timestamp and nonce."""
+        return {
+            **template,
+            "constraints": [dict(rule) for rule in template["constraints"]],
+            "timestamp": time.time(),
+            "nonce": hashlib.sha256(str(time.time_ns()).encode()).hexdigest()[:16],
+        }
+
+    def constraint_template(
+        self,
+        operation: str,
+        resource_type: ResourceType,
+        metadata: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Deterministic part of a constraint set (no timestamp, no nonce).
+        """
         constraints: Dict[str, Any] = {
             "operation": operation,
             "resource_type": resource_type.value,
-            "timestamp": time.time(),
             "constitutional_version": self.constitution.get("version", "1.0"),
             "constraints": [],
-            "nonce": hashlib.sha256(str(time.time_ns()).encode()).hexdigest()[:16],
         }
 
         if not metadata.get("self_attested", False):
@@ -208,6 +260,20 @@ class StoragePolicy:
 
         return True, "Compliant"
 
+    def verify_compliance_many(
+        self,
+        execution_results: List[Dict[str, Any]],
+        constraints_list: List[Dict[str, Any]],
+    ) -> List[Tuple[bool, str]]:
+        """
+        `verify_compliance` over a batch (OFFLINE), one outcome per item.
+
+        A plain loop over the per-item interpreter: rule sets are a few entries
+        long, so grouping or precompiling them costs more than it saves.
+        """
+        verify = self.verify_compliance
+        return [verify(result, constraints) for result, constraints in zip(execution_results, constraints_list)]
+
 
 # =========================
 # Fractal Resource Graph
@@ -218,55 +284,231 @@ class FractalGraph:
     Fractal resource graph with embedded governance.
 
     The full graph NEVER exists on execution surfaces.
+
+    The lineage itself is a `LineageStore` (flat typed arrays; every resource
+    has at most one parent), exposed as `graph` with a networkx-like surface.
+
+    Persistence is a binary lineage snapshot (`lineage.json` + generation
+    directory) plus an append-only journal (`graph_journal.jsonl`) of node/edge
+    records written since that snapshot. A pre-existing `graph_state.json`
+    snapshot is still read and is retired by the first binary snapshot.
+    Loading reads the snapshot and replays the journal tail. Once the journal
+    holds at least `snapshot_interval` records, and at least as many as the
+    graph has nodes (keeping compaction amortised O(1) per insert), the graph is
+    compacted into a new snapshot (atomic manifest replace) and the journal is
+    reset. Replay is idempotent, so a crash between the snapshot replace and
+    the journal reset is harmless.
+
+    Payloads of at least `blob_threshold` bytes are moved into the
+    content-addressed blob store under `<evidence_path>/blobs` on insert, so the
+    registry holds mapped views instead of private copies and identical
+    payloads are stored once (`blob_threshold=None` keeps everything inline).
+
+    `resource_registry` is persisted in `registry.sqlite` and loaded lazily
+    through an LRU cache of `registry_cache_size` resources, so resources stay
+    readable after a restart without loading them all up front.
+
+    `get_verifiable_subset` memoises each node's Merkle leaf (shared by every
+    descendant whose subset includes it) and each subset root in an LRU of
+    `subset_cache_size` entries keyed by `(resource_id, depth)` and validated
+    against the path's (node, constitutional_hash, depth) chain. The chain is
+    read from the lineage arrays without hashing, so a re-embedded node on the
+    path misses exactly the entries it belongs to, and a repeat request does no
+    hashing at all.
+
+    `merkle_index` is an append-only Merkle tree over all nodes in insertion
+    order (see `merkle_index.py`). It is built on first use and then kept
+    current in O(log n) per inserted or re-embedded node, so `graph_root` and
+    `inclusion_proof` give O(log n) membership proofs against one root.
+
+    `export_subgraph` / `import_subgraph` move a subtree (with its ancestors)
+    between graphs as binary resource frames (see `resource_frames.py`).
     """
 
-    def __init__(self, evidence_path: str = "evidence/genealogy/"):
-        self.graph = nx.DiGraph()
-        self.resource_registry: Dict[str, SovereignResource] = {}
+    STATE_FILE = "graph_state.json"
+    JOURNAL_FILE = "graph_journal.jsonl"
+
+    def __init__(
+        self,
+        evidence_path: str = "evidence/genealogy/",
+        snapshot_interval: int = 10_000,
+        blob_threshold: Optional[int] = 64 * 1024,
+        registry_cache_size: int = 10_000,
+        subset_cache_size: int = 100_000,
+    ):
+        self.graph = LineageStore()
         self.evidence_path = Path(evidence_path)
         self.evidence_path.mkdir(parents=True, exist_ok=True)
+        self.snapshot_interval = snapshot_interval
+        self.blob_threshold = blob_threshold
+        self._blob_store: Optional[BlobStore] = None
+        self.resource_registry = ResourceRegistry(
+            self.evidence_path / "registry.sqlite",
+            cache_size=registry_cache_size,
+            blob_store=lambda: self.blob_store,
+        )
+
+        self._journal = None
+        self._journal_records = 0
+
+        self.subset_cache_size = subset_cache_size
+        self._leaf_cache: Dict[int, Tuple[bytes, int, str]] = {}
+        self._subset_cache: "OrderedDict[Tuple[str, int], tuple]" = OrderedDict()
+        self.subset_hits = 0
+        self.subset_misses = 0
+
+        self._merkle: Optional[MerkleIndex] = None
 
         self._load_from_evidence()
 
     def _load_from_evidence(self) -> None:
-        state_file = self.evidence_path / "graph_state.json"
-        if not state_file.exists():
+        state_file = self.evidence_path / self.STATE_FILE
+        snapshot = LineageStore.load(self.evidence_path)
+        if snapshot is not None:
+            self.graph = snapshot
+        elif state_file.exists():
+            with open(state_file, "r", encoding="utf-8") as f:
+                state = json.load(f)
+
+            for node_id, node_data in state.get("nodes", {}).items():
+                self.graph.add_node(
+                    node_id,
+                    constitutional_hash=node_data["constitutional_hash"],
+                    lineage_depth=node_data["lineage_depth"],
+                )
+
+            for edge in state.get("edges", []):
+                self.graph.add_edge(edge["source"], edge["target"])
+
+        journal_file = self.evidence_path / self.JOURNAL_FILE
+        if not journal_file.exists():
             return
 
-        with open(state_file, "r", encoding="utf-8") as f:
-            state = json.load(f)
-
-        for node_id, node_data in state.get("nodes", {}).items():
-            self.graph.add_node(
-                node_id,
-                constitutional_hash=node_data["constitutional_hash"],
-                lineage_depth=node_data["lineage_depth"],
-            )
+        with open(journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn tail from an interrupted append; everything before it is intact.
+                    continue
+                self._apply_journal_record(record)
+                self._journal_records += 1
+
+    def _apply_journal_record(self, record: Dict[str, Any]) -> None:
+        op = record.get("op")
+        if op == "node":
+            self._put_node(record["id"], record["constitutional_hash"], record["lineage_depth"])
+        elif op == "edge":
+            self.graph.add_edge(record["source"], record["target"])
+
+    def _journal_append(self, records: List[Dict[str, Any]]) -> None:
+        if self._journal is None:
+            path = self.evidence_path / self.JOURNAL_FILE
+            self._journal = open(path, "a+b")
+            # Never glue a new record onto a torn last line.
+            if self._journal.seek(0, 2) > 0:
+                self._journal.seek(-1, 2)
+                if self._journal.read(1) != b"\n":
+                    self._journal.write(b"\n")
+
+        self._journal.write(
+            "".join(json.dumps(r, sort_keys=True, separators=(",", ":")) + "\n" for r in records).encode("utf-8")
+        )
+        self._journal.flush()
+        self._journal_records += len(records)
 
-        for edge in state.get("edges", []):
-            self.graph.add_edge(edge["source"], edge["target"])
+        if self.snapshot_interval and self._journal_records >= max(
+            self.snapshot_interval, self.graph.number_of_nodes()
+        ):
+            self._persist_to_evidence()
 
     def _persist_to_evidence(self) -> None:
-        state = {
-            "timestamp": time.time(),
-            "nodes": {
-                nid: {
-                    "constitutional_hash": self.graph.nodes[nid]["constitutional_hash"],
-                    "lineage_depth": self.graph.nodes[nid]["lineage_depth"],
-                }
-                for nid in self.graph.nodes
-            },
-            "edges": [{"source": s, "target": t} for s, t in self.graph.edges],
+        """Write a compacted snapshot atomically and reset the journal."""
+        self.graph.save(self.evidence_path)
+
+        legacy = self.evidence_path / self.STATE_FILE
+        if legacy.exists():
+            legacy.unlink()
+
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        with open(self.evidence_path / self.JOURNAL_FILE, "wb"):
+            pass
+        self._journal_records = 0
+
+    def _put_node(self, resource_id: str, constitutional_hash: str, depth: int) -> None:
+        self.graph.add_node(resource_id, constitutional_hash=constitutional_hash, lineage_depth=depth)
+        if self._merkle is not None:
+            self._sync_merkle(self.graph.index_of(resource_id))
+
+    def _sync_merkle(self, changed: Optional[int] = None) -> None:
+        store, merkle = self.graph, self._merkle
+        if changed is not None and changed < len(merkle):
+            merkle.update(changed, leaf_hash(store.ids[changed], store.hash_at(changed), store.depth[changed]))
+        for i in range(len(merkle), len(store)):
+            merkle.append(leaf_hash(store.ids[i], store.hash_at(i), store.depth[i]))
+
+    @property
+    def merkle_index(self) -> MerkleIndex:
+        if self._merkle is None:
+            self._merkle = MerkleIndex()
+            self._sync_merkle()
+        return self._merkle
+
+    def graph_root(self) -> Dict[str, Any]:
+        merkle = self.merkle_index
+        return {"tree_size": len(merkle), "graph_root": merkle.root().hex()}
+
+    def inclusion_proof(self, resource_id: str) -> Dict[str, Any]:
+        """O(log n) audit path of `resource_id` against the current `graph_root`."""
+        if resource_id not in self.graph:
+            raise ResourceNotFoundError(resource_id)
+        merkle = self.merkle_index
+        index = self.graph.index_of(resource_id)
+        node = self.graph.nodes[resource_id]
+        return {
+            "resource_id": resource_id,
+            "constitutional_hash": node["constitutional_hash"],
+            "lineage_depth": node["lineage_depth"],
+            "leaf_index": index,
+            "tree_size": len(merkle),
+            "audit_path": [d.hex() for d in merkle.inclusion_proof(index)],
+            "graph_root": merkle.root().hex(),
         }
 
-        path = self.evidence_path / "graph_state.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, sort_keys=True)
+    @property
+    def blob_store(self) -> BlobStore:
+        if self._blob_store is None:
+            self._blob_store = BlobStore(self.evidence_path / "blobs")
+        return self._blob_store
+
+    def _externalise(self, resource: SovereignResource) -> None:
+        if (
+            self.blob_threshold is not None
+            and resource.blob_ref is None
+            and len(resource.data) >= self.blob_threshold
+        ):
+            resource.move_to_blob_store(self.blob_store)
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot."""
+        self._persist_to_evidence()
+
+    def close(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self.resource_registry.close()
 
     def add_resource(self, resource: SovereignResource, parent_id: Optional[str] = None) -> str:
         resource_id = resource.resource_id
 
         depth = 0
+        records: List[Dict[str, Any]] = []
         if parent_id and parent_id in self.graph:
             depth = self.graph.nodes[parent_id]["lineage_depth"] + 1
             self.graph.add_edge(parent_id, resource_id)
@@ -275,54 +517,275 @@ class FractalGraph:
                 depth,
             )
 
-        self.graph.add_node(
-            resource_id,
-            constitutional_hash=resource.constitutional_hash,
-            lineage_depth=depth,
-        )
+        self._put_node(resource_id, resource.constitutional_hash, depth)
+        records.append({
+            "op": "node",
+            "id": resource_id,
+            "constitutional_hash": resource.constitutional_hash,
+            "lineage_depth": depth,
+        })
+        if depth:
+            records.append({"op": "edge", "source": parent_id, "target": resource_id})
 
+        self._externalise(resource)
         self.resource_registry[resource_id] = resource
-        self._persist_to_evidence()
+        self._journal_append(records)
         return resource_id
 
+    def add_resources(
+        self,
+        resources: Iterable[SovereignResource],
+        parent_map: Optional[Dict[str, str]] = None,
+        *,
+        progress: Optional[Callable[[int], None]] = None,
+        progress_every: int = 10_000,
+    ) -> List[str]:
+        """Insert many resources in one pass and persist once.
+
+        `resources` must be in topological order: a parent named in
+        `parent_map` (resource_id -> parent_id) must already be in the graph or
+        earlier in the batch. A payload is hashed here only if its resource has
+        no cached digest: constructed resources hash theirs on creation, and
+        `ingest` hashes decoded records in its worker processes.
+        """
+        batch = list(resources)
+        parent_map = parent_map or {}
+
+        # Validate ordering before touching the graph so a bad batch leaves no partial state.
+        seen: set = set()
+        for r in batch:
+            parent_id = parent_map.get(r.resource_id)
+            if parent_id and parent_id not in seen and parent_id not in self.graph:
+                raise FractalIntegrityError(
+                    f"Parent {parent_id} of {r.resource_id} not in graph (batch not in topological order?)"
+                )
+            seen.add(r.resource_id)
+
+        records: List[Dict[str, Any]] = []
+        ids: List[str] = []
+        inserted: List[SovereignResource] = []
+        for n, resource in enumerate(batch, start=1):
+            resource_id = resource.resource_id
+            parent_id = parent_map.get(resource_id)
+
+            depth = 0
+            if parent_id:
+                parent = self.graph.nodes[parent_id]
+                depth = parent["lineage_depth"] + 1
+                resource.embed_parent_governance(
+                    parent["constitutional_hash"],
+                    depth,
+                )
+                self.graph.add_edge(parent_id, resource_id)
+
+            self._put_node(resource_id, resource.constitutional_hash, depth)
+            records.append({
+                "op": "node",
+                "id": resource_id,
+                "constitutional_hash": resource.constitutional_hash,
+                "lineage_depth": depth,
+            })
+            if depth:
+                records.append({"op": "edge", "source": parent_id, "target": resource_id})
+
+            self._externalise(resource)
+            inserted.append(resource)
+            ids.append(resource_id)
+
+            if progress is not None and n % progress_every == 0:
+                progress(n)
+
+        if records:
+            self.resource_registry.put_many(inserted)
+            self._journal_append(records)
+        if progress is not None and len(batch) % progress_every:
+            progress(len(batch))
+        return ids
+
+    def _subgraph_order(self, resource_id: Optional[str], include_ancestors: bool) -> List[int]:
+        """Indices of the subtree under `resource_id` (whole graph if None), parents first."""
+        store = self.graph
+        children: Dict[int, List[int]] = {}
+        roots: List[int] = []
+        for i, p in enumerate(store.parent):
+            if p >= 0:
+                children.setdefault(p, []).append(i)
+            else:
+                roots.append(i)
+
+        order: List[int] = []
+        if resource_id is not None:
+            if resource_id not in store:
+                raise ResourceNotFoundError(resource_id)
+            start = store.index_of(resource_id)
+            if include_ancestors:
+                p = store.parent[start]
+                while p >= 0:
+                    order.append(p)
+                    p = store.parent[p]
+                order.reverse()
+            roots = [start]
+
+        queue = list(roots)
+        while queue:
+            i = queue.pop()
+            order.append(i)
+            queue.extend(reversed(children.get(i, ())))
+        return order
+
+    def export_subgraph(
+        self,
+        out: Union[str, Path, BinaryIO],
+        resource_id: Optional[str] = None,
+        include_ancestors: bool = True,
+    ) -> int:
+        """Write a resource and its descendants (the whole graph if None) as binary frames.
+
+        Ancestors are included by default so the export carries the lineage its
+        hashes were embedded under and imports into any graph. Returns the
+        number of frames written.
+        """
+        order = self._subgraph_order(resource_id, include_ancestors)
+        stream = open(out, "wb") if isinstance(out, (str, Path)) else out
+        try:
+            writer = FrameWriter(stream, blob_store=self.blob_store)
+            for i in order:
+                rid = self.graph.ids[i]
+                resource = self.resource_registry.get(rid)
+                if resource is None:
+                    raise ResourceNotFoundError(f"{rid} is in the lineage but not in the registry")
+                p = self.graph.parent[i]
+                writer.write(resource, self.graph.ids[p] if p >= 0 else None)
+            return writer.close()
+        finally:
+            if stream is not out:
+                stream.close()
+
+    def import_subgraph(self, source: Union[str, Path, Iterable[Frame]]) -> List[str]:
+        """Import frames written by `export_subgraph`; returns the ids added.
+
+        Every frame's constitutional hash is checked against its content, and
+        every parent link against the parent's hash and depth (from the graph
+        or an earlier frame), before anything is inserted. Frames already in
+        the graph with the same hash are skipped, so overlapping exports
+        (e.g. shared ancestors) import cleanly.
+        """
+        frames = open_frames(source) if isinstance(source, (str, Path)) else source
+        resources: List[SovereignResource] = []
+        parent_map: Dict[str, str] = {}
+        known: Dict[str, Tuple[str, int]] = {}
+
+        for frame in frames:
+            resource = frame.to_resource(verify=True)
+            rid = resource.resource_id
+            if rid in self.graph:
+                if self.graph.nodes[rid]["constitutional_hash"] != resource.constitutional_hash:
+                    raise FractalIntegrityError(f"{rid} already in graph with a different constitutional hash")
+                continue
+
+            parent_id = frame.parent_id
+            depth = 0
+            if parent_id:
+                if parent_id in known:
+                    parent_hash, parent_depth = known[parent_id]
+                elif parent_id in self.graph:
+                    node = self.graph.nodes[parent_id]
+                    parent_hash, parent_depth = node["constitutional_hash"], node["lineage_depth"]
+                else:
+                    raise FractalIntegrityError(f"Parent {parent_id} of {rid} is neither in the graph nor earlier in the export")
+                depth = parent_depth + 1
+                if (
+                    resource.metadata.get("parent_constitutional_hash") != parent_hash
+                    or resource.metadata.get("lineage_depth") != depth
+                ):
+                    raise FractalIntegrityError(f"{rid} was not embedded under {parent_id} as recorded here")
+                parent_map[rid] = parent_id
+
+            known[rid] = (resource.constitutional_hash, depth)
+            resources.append(resource)
+
+        if not resources:
+            return []
+        return self.add_resources(resources, parent_map)
+
     def get_verifiable_subset(self, resource_id: str, depth: int = 3) -> Dict[str, Any]:
         if resource_id not in self.graph:
             raise ResourceNotFoundError(resource_id)
 
-        lineage: List[Dict[str, Any]] = []
-        current = resource_id
-
-        for _ in range(depth):
-            if current not in self.graph:
-                break
-            node = self.graph.nodes[current]
-            lineage.append({
-                "resource_id": current,
-                "constitutional_hash": node["constitutional_hash"],
-                "depth": node["lineage_depth"],
-            })
-            parents = list(self.graph.predecessors(current))
-            current = parents[0] if parents else None
+        store = self.graph
+        path: List[int] = []
+        i = store.index_of(resource_id)
+        while i >= 0 and len(path) < depth:
+            path.append(i)
+            i = store.parent[i]
+        chain = tuple((i, store.raw_hash_at(i), store.depth[i]) for i in path)
+
+        key = (resource_id, depth)
+        cached = self._subset_cache.get(key)
+        if cached is not None and cached[0] == chain:
+            self._subset_cache.move_to_end(key)
+            self.subset_hits += 1
+            _, entries, root = cached
+        else:
+            self.subset_misses += 1
+            leaves = [self._lineage_leaf(i, raw, d) for i, raw, d in chain]
+            entries = tuple(entry for entry, _ in leaves)
+            ordered = sorted(leaves, key=lambda x: x[0]["depth"])
+            root = self._merkle_root_from_leaves([leaf for _, leaf in ordered])
+            self._subset_cache[key] = (chain, entries, root)
+            self._subset_cache.move_to_end(key)
+            while len(self._subset_cache) > self.subset_cache_size:
+                self._subset_cache.popitem(last=False)
 
         return {
             "root_id": resource_id,
             "timestamp": time.time(),
-            "lineage": lineage,
-            "merkle_root": self._merkle_root(lineage),
+            "lineage": [dict(e) for e in entries],
+            "merkle_root": root,
+        }
+
+    def _lineage_leaf(self, index: int, raw_hash: bytes, depth: int) -> Tuple[Dict[str, Any], str]:
+        """Lineage entry and Merkle leaf for one node, hashed once per (hash, depth)."""
+        cached = self._leaf_cache.get(index)
+        entry = {
+            "resource_id": self.graph.ids[index],
+            "constitutional_hash": self.graph.hash_at(index),
+            "depth": depth,
+        }
+        if cached is not None and cached[0] == raw_hash and cached[1] == depth:
+            return entry, cached[2]
+        leaf = hashlib.sha3_256(
+            f"{entry['resource_id']}:{entry['constitutional_hash']}:{depth}".encode()
+        ).hexdigest()
+        self._leaf_cache[index] = (raw_hash, depth, leaf)
+        if len(self._leaf_cache) > self.subset_cache_size:
+            del self._leaf_cache[next(iter(self._leaf_cache))]
+        return entry, leaf
+
+    def subset_cache_stats(self) -> Dict[str, int]:
+        return {
+            "cache_size": self.subset_cache_size,
+            "cached": len(self._subset_cache),
+            "leaves": len(self._leaf_cache),
+            "hits": self.subset_hits,
+            "misses": self.subset_misses,
         }
 
     @staticmethod
     def _merkle_root(lineage: List[Dict[str, Any]]) -> str:
-        if not lineage:
-            return ""
-
-        leaves = [
+        return FractalGraph._merkle_root_from_leaves([
             hashlib.sha3_256(
                 f"{n['resource_id']}:{n['constitutional_hash']}:{n['depth']}".encode()
             ).hexdigest()
             for n in sorted(lineage, key=lambda x: x["depth"])
-        ]
+        ])
+
+    @staticmethod
+    def _merkle_root_from_leaves(leaves: List[str]) -> str:
+        if not leaves:
+            return ""
 
+        leaves = list(leaves)
         while len(leaves) > 1:
             if len(leaves) % 2:
                 leaves.append(leaves[-1])
@@ -343,36 +806,178 @@ class SovereignStorage:
     Constitutional storage substrate.
 
     Runs OFFLINE only.
+
+    Warm start: the genesis resource's identity is recorded in
+    `<evidence_path>/genesis.json`. A later construction with the same key and
+    evidence path reuses it - it loads the lineage snapshot and journal tail,
+    and adds no new genesis node - so restarting writes nothing. The key comes
+    from an existing `storage_key_path`; a missing one means a temporary key
+    for this run only, unless `persist_key` is set, in which case the
+    generated key is written there (mode 0600) for later runs. Without a
+    persisted key every construction has a fresh key and therefore a fresh
+    genesis bound to it.
     """
 
+    GENESIS_FILE = "genesis.json"
+    OPERATIONS_LOG = "storage_operations.jsonl"
+
     def __init__(
         self,
         constitution_path: str,
         guardrails_path: str,
         storage_key_path: Optional[str] = None,
+        evidence_path: str = "evidence/genealogy/",
+        key_type: str = ECDSA_P384,
+        sign_workers: int = 0,
+        receipt_batch_ops: int = 256,
+        receipt_batch_ms: float = 50.0,
+        auth_cache_size: int = 10_000,
+        persist_key: bool = False,
     ):
         self.policy = StoragePolicy(constitution_path, guardrails_path)
-        self.graph = FractalGraph()
+        self.graph = FractalGraph(evidence_path=evidence_path)
+
+        self.signer = self._load_or_create_signer(storage_key_path, key_type, persist_key)
+        self.sign_workers = sign_workers
+
+        self.private_key = self.signer.private_key
+        self.public_key = self.signer.public_key
+        self.public_key_pem = self.signer.public_key_pem
+
+        self.operation_counter = 0
+        self._operations_journal: Optional[JournalWriter] = None
+        self._operations_journal_lock = threading.Lock()
+        self._signed_root: Optional[Dict[str, Any]] = None
+
+        # Deterministic part of read authorizations, keyed by
+        # (resource_id, constitutional_hash, lineage merkle_root, constitution version).
+        self.auth_cache_size = auth_cache_size
+        self._auth_cache: "OrderedDict[Tuple[str, str, str, str], Tuple[Dict[str, Any], str]]" = OrderedDict()
+        self.auth_cache_hits = 0
+        self.auth_cache_misses = 0
+        self.auth_cache_evictions = 0
+        self.receipt_batcher = ReceiptBatcher(
+            self._sign_data,
+            on_seal=self._log_receipt_batch,
+            max_ops=receipt_batch_ops,
+            max_ms=receipt_batch_ms,
+        )
+        self.genesis_id = self._existing_genesis() or self._create_genesis_resource()
 
+    @staticmethod
+    def _load_or_create_signer(storage_key_path: Optional[str], key_type: str, persist_key: bool = False) -> Signer:
+        # An existing key file wins; its own type is used regardless of `key_type`.
         if storage_key_path and Path(storage_key_path).exists():
             with open(storage_key_path, "rb") as f:
-                self.private_key = load_pem_private_key(f.read(), password=None)
-        else:
-            self.private_key = ec.generate_private_key(ec.SECP384R1())
+                return Signer.from_pem(f.read())
+        signer = Signer.generate(key_type)
+        if storage_key_path and persist_key:
+            path = Path(storage_key_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(signer.private_pem())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        return signer
+
+    def ingest_resources(
+        self,
+        resources: Iterable[SovereignResource],
+        parent_map: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Bulk-insert resources (see `FractalGraph.add_resources`) and log one evidence entry."""
+        ids = self.graph.add_resources(resources, parent_map, **kwargs)
+        if ids:
+            self._log_operation(
+                operation="bulk_ingest",
+                resource_id=ids[0],
+                details={"count": len(ids), "first_id": ids[0], "last_id": ids[-1]},
+            )
+        return ids
 
-        self.public_key = self.private_key.public_key()
-        self.public_key_pem = self.public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        ).decode()
+    def close(self) -> None:
+        self.receipt_batcher.close()
+        if self._operations_journal is not None:
+            self._operations_journal.close()
+            self._operations_journal = None
+        self.graph.close()
+        self.signer.close()
 
-        self.operation_counter = 0
-        self._create_genesis_resource()
+    @property
+    def key_type(self) -> str:
+        return self.signer.key_type
 
     def _sign_data(self, data: bytes) -> str:
-        return self.private_key.sign(data, ec.ECDSA(hashes.SHA256())).hex()
+        return self.signer.sign(data)
+
+    def auth_cache_stats(self) -> Dict[str, Any]:
+        return {
+            "cache_size": self.auth_cache_size,
+            "cached": len(self._auth_cache),
+            "hits": self.auth_cache_hits,
+            "misses": self.auth_cache_misses,
+            "evictions": self.auth_cache_evictions,
+        }
+
+    @staticmethod
+    def _graph_root_statement(tree_size: int, graph_root: str) -> bytes:
+        return json.dumps({"graph_root": graph_root, "tree_size": tree_size}, sort_keys=True).encode()
+
+    def signed_graph_root(self) -> Dict[str, Any]:
+        """Current whole-graph Merkle root signed by the storage root key (re-signed only when it moves)."""
+        head = self.graph.graph_root()
+        if self._signed_root is None or self._signed_root["graph_root"] != head["graph_root"]:
+            head["signature"] = self._sign_data(self._graph_root_statement(head["tree_size"], head["graph_root"]))
+            head["key_type"] = self.key_type
+            self._signed_root = head
+        return dict(self._signed_root)
+
+    @staticmethod
+    def verify_graph_inclusion(inclusion: Dict[str, Any], public_key_pem: str) -> bool:
+        """Check a `graph_inclusion` proof with only the storage root public key - no graph state."""
+        try:
+            signed = verify_signature(
+                public_key_pem,
+                SovereignStorage._graph_root_statement(int(inclusion["tree_size"]), inclusion["graph_root"]),
+                inclusion["graph_root_signature"],
+                inclusion.get("key_type"),
+            )
+        except (KeyError, ValueError):
+            return False
+        if not signed:
+            return False
+        leaf = leaf_hash(inclusion["resource_id"], inclusion["constitutional_hash"], inclusion["lineage_depth"])
+        return verify_inclusion(
+            leaf,
+            int(inclusion["leaf_index"]),
+            int(inclusion["tree_size"]),
+            inclusion["audit_path"],
+            inclusion["graph_root"],
+        )
 
-    def _create_genesis_resource(self) -> None:
+    def _existing_genesis(self) -> Optional[str]:
+        """Genesis id from a previous start, if it is bound to this key and still in the graph."""
+        path = self.graph.evidence_path / self.GENESIS_FILE
+        if not path.exists():
+            return None
+        try:
+            record = json.loads(path.read_text(encoding="utf-8"))
+            resource_id = record["resource_id"]
+        except (ValueError, KeyError):
+            return None
+        if (
+            record.get("storage_root_public_key") == self.public_key_pem
+            and resource_id in self.graph.graph
+            and self.graph.graph.nodes[resource_id]["constitutional_hash"] == record.get("constitutional_hash")
+        ):
+            return resource_id
+        return None
+
+    def _create_genesis_resource(self) -> str:
         genesis = SovereignResource(
             resource_type=ResourceType.SYSTEM,
             data=b"Sovereign Storage Genesis",
@@ -385,47 +990,124 @@ class SovereignStorage:
         )
 
         self.graph.add_resource(genesis)
+        path = self.graph.evidence_path / self.GENESIS_FILE
+        tmp = path.with_name(self.GENESIS_FILE + ".tmp")
+        tmp.write_text(json.dumps({
+            "resource_id": genesis.resource_id,
+            "constitutional_hash": genesis.constitutional_hash,
+            "storage_root_public_key": self.public_key_pem,
+            "key_type": self.key_type,
+        }, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, path)
+        return genesis.resource_id
 
     def generate_read_authorization(
         self,
         resource_id: str,
         requester_context: Dict,
+        include_graph_proof: bool = False,
     ) -> Dict:
         """
         Generate read authorization for execution surface.
         Contains access constraints and cryptographic proofs.
 
+        With `include_graph_proof`, the package also carries `graph_inclusion`:
+        an O(log n) inclusion proof of the resource against the signed
+        whole-graph root (see `verify_graph_inclusion`).
+
         NOTE: Authorization packages are evidence-grade declarations generated OFFLINE.
         They do not grant power; they constrain execution surfaces.
         """
+        auth_package = self._build_read_authorization(resource_id, requester_context, include_graph_proof)
+        package_json = json.dumps(auth_package, sort_keys=True)
+        auth_package["signature"] = self._sign_data(package_json.encode())
+
+        return auth_package
+
+    def generate_read_authorizations(
+        self,
+        requests: Iterable[Tuple[str, Dict]],
+        include_graph_proof: bool = False,
+        workers: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Batch form of `generate_read_authorization` for `(resource_id, requester_context)` pairs.
+
+        Packages are built in order, then signed together - in the signer's
+        process pool of `workers` (default: `sign_workers`) when set and the
+        batch is large enough (`Signer.parallel_min_batch`). Any unknown
+        resource fails the batch before anything is signed.
+        """
+        packages = [
+            self._build_read_authorization(resource_id, context, include_graph_proof)
+            for resource_id, context in requests
+        ]
+        payloads = [json.dumps(p, sort_keys=True).encode() for p in packages]
+        signatures = self.signer.sign_many(payloads, self.sign_workers if workers is None else workers)
+        for package, signature in zip(packages, signatures):
+            package["signature"] = signature
+        return packages
+
+    def _build_read_authorization(
+        self,
+        resource_id: str,
+        requester_context: Dict,
+        include_graph_proof: bool,
+    ) -> Dict[str, Any]:
+        """Unsigned authorization package.
+
+        Only the nonce and timestamps are fresh per call when the resource hash,
+        its lineage root and the constitution version are unchanged since a
+        previous package (see `auth_cache_stats`).
+        """
         if resource_id not in self.graph.graph:
             raise ResourceNotFoundError(f"Resource {resource_id} not found")
 
-        resource = self.graph.resource_registry.get(resource_id)
-        if resource is None:
-            raise ResourceNotFoundError(
-                f"Resource {resource_id} not available in offline registry (evidence missing or not loaded)"
-            )
-
-        constraints = self.policy.generate_constraints(
-            "read",
-            resource.resource_type,
-            resource.metadata,
+        verifiable_subset = self.graph.get_verifiable_subset(resource_id, depth=3)
+        key = (
+            resource_id,
+            self.graph.graph.nodes[resource_id]["constitutional_hash"],
+            verifiable_subset["merkle_root"],
+            str(self.policy.constitution.get("version", "1.0")),
         )
 
-        verifiable_subset = self.graph.get_verifiable_subset(resource_id, depth=3)
+        cached = self._auth_cache.get(key)
+        if cached is not None:
+            self._auth_cache.move_to_end(key)
+            self.auth_cache_hits += 1
+            template, constitutional_hash = cached
+        else:
+            self.auth_cache_misses += 1
+            resource = self.graph.resource_registry.get(resource_id)
+            if resource is None:
+                raise ResourceNotFoundError(
+                    f"Resource {resource_id} not available in offline registry (evidence missing or not loaded)"
+                )
+            template = self.policy.constraint_template("read", resource.resource_type, resource.metadata)
+            constitutional_hash = resource.constitutional_hash
+            if self.auth_cache_size > 0:
+                self._auth_cache[key] = (template, constitutional_hash)
+                while len(self._auth_cache) > self.auth_cache_size:
+                    self._auth_cache.popitem(last=False)
+                    self.auth_cache_evictions += 1
 
         auth_package: Dict[str, Any] = {
-            "constraints": constraints,
+            "constraints": self.policy.stamp_constraints(template),
             "verifiable_subset": verifiable_subset,
             "resource_id": resource_id,
             "requester_context": requester_context,
             "generated_at": time.time(),
-            "constitutional_hash": resource.constitutional_hash,
+            "constitutional_hash": constitutional_hash,
+            "key_type": self.key_type,
         }
-
-        package_json = json.dumps(auth_package, sort_keys=True)
-        auth_package["signature"] = self._sign_data(package_json.encode())
+        if include_graph_proof:
+            head = self.signed_graph_root()
+            inclusion = self.graph.inclusion_proof(resource_id)
+            if inclusion["graph_root"] != head["graph_root"]:
+                raise FractalIntegrityError("Graph root moved while building the inclusion proof")
+            inclusion["graph_root_signature"] = head["signature"]
+            inclusion["key_type"] = head["key_type"]
+            auth_package["graph_inclusion"] = inclusion
 
         return auth_package
 
@@ -440,25 +1122,166 @@ class SovereignStorage:
 
         execution_result is expected to include proofs of compliance (e.g., verifications, approvals, evidence_logged).
         """
+        receipt = self._verified_read_receipt(execution_result, auth_package)
+        receipt.storage_root_signature = self._sign_data(str(auth_package.get("constitutional_hash", "")).encode())
+
+        self._log_operation(
+            operation="read_verified",
+            resource_id=receipt.resource_id,
+            details={
+                "receipt_hash": receipt.constitutional_hash,
+                "compliance_verified": True,
+            },
+        )
+        return receipt
+
+    def submit_read_completion(
+        self,
+        execution_result: Dict,
+        auth_package: Dict,
+    ) -> "Future[StorageReceipt]":
+        """
+        Batched form of `verify_read_completion`.
+
+        The read is verified now (violations raise immediately); the receipt is
+        resolved when its batch is sealed - after `receipt_batch_ops` reads,
+        `receipt_batch_ms` milliseconds, or `flush_receipts()`. A batch costs one
+        signature (over the Merkle root of its receipt hashes) and one log entry;
+        each receipt carries its audit path (see `verify_batched_receipt`).
+        """
+        return self.receipt_batcher.submit(self._verified_read_receipt(execution_result, auth_package))
+
+    def flush_receipts(self) -> int:
+        return self.receipt_batcher.flush()
+
+    @staticmethod
+    def verify_batched_receipt(receipt: Dict[str, Any], public_key_pem: str) -> bool:
+        """Check a batched receipt (`StorageReceipt.to_dict()`) with only the storage root public key."""
+        batch = receipt.get("batch")
+        if not batch:
+            return False
+        fields = {k: receipt[k] for k in StorageReceipt.__dataclass_fields__ if k in receipt}
+        try:
+            expected = StorageReceipt(**fields).generate_hash()
+        except TypeError:
+            return False
+        if expected != receipt.get("constitutional_hash"):
+            return False
+        return verify_batch_inclusion(
+            expected,
+            str(receipt.get("package_hash") or ""),
+            receipt.get("fractal_depth", 0),
+            batch,
+            str(receipt.get("storage_root_signature", "")),
+            receipt.get("key_type"),
+            public_key_pem,
+        )
+
+    def _log_receipt_batch(self, batch_id: str, batch_root: str, receipts: List[StorageReceipt]) -> None:
+        self._log_operation(
+            operation="read_verified_batch",
+            resource_id=receipts[0].resource_id,
+            details={
+                "batch_id": batch_id,
+                "batch_root": batch_root,
+                "count": len(receipts),
+                "receipt_hashes": [r.constitutional_hash for r in receipts],
+                "compliance_verified": True,
+            },
+        )
+
+    def verify_read_completions(
+        self,
+        completions: Iterable[Tuple[Dict, Dict]],
+        workers: Optional[int] = None,
+    ) -> List[Union[StorageReceipt, Exception]]:
+        """
+        Batch form of `verify_read_completion` for `(execution_result, auth_package)` pairs.
+
+        Package signatures are verified together (in the signer's process pool
+        of `workers`, default `sign_workers`, for large batches), compliance is
+        checked per item, receipts are signed together and the batch is logged
+        in one write.
+
+        Returns one entry per pair, in order: the receipt, or the exception
+        `verify_read_completion` would have raised for that pair. A malformed
+        pair (not a 2-tuple, non-dict entries, wrongly typed fields) fails only
+        its own slot.
+        """
+        items = list(completions)
+        workers = self.sign_workers if workers is None else workers
+        results: List[Union[StorageReceipt, Exception, None]] = [None] * len(items)
+
+        pending: List[int] = []
+        checks: List[Tuple[bytes, str, Optional[str]]] = []
+        for i, item in enumerate(items):
+            try:
+                _, auth_package = item
+                checks.append(self._package_signature_check(auth_package))
+                pending.append(i)
+            except Exception as exc:
+                results[i] = exc
+
+        signed: List[int] = []
+        for i, ok in zip(pending, self.signer.verify_many(checks, workers)):
+            if ok:
+                signed.append(i)
+            else:
+                results[i] = ConstitutionalViolationError("Invalid authorization package signature")
+
+        receipts: List[StorageReceipt] = []
+        for i in signed:
+            execution_result, auth_package = items[i]
+            try:
+                compliant, reason = self.policy.verify_compliance(execution_result, auth_package.get("constraints", {}))
+                if not compliant:
+                    raise ConstitutionalViolationError(f"Read execution non-compliant: {reason}")
+                receipt = self._new_read_receipt(execution_result, auth_package)
+            except Exception as exc:
+                results[i] = exc
+                continue
+            results[i] = receipt
+            receipts.append(receipt)
+
+        # Receipts over the same package sign the same bytes: sign each once.
+        payloads = sorted({str(items[i][1].get("constitutional_hash", "")) for i in range(len(items))
+                           if isinstance(results[i], StorageReceipt)})
+        signatures = dict(zip(payloads, self.signer.sign_many([p.encode() for p in payloads], workers)))
+        for i, receipt in enumerate(results):
+            if isinstance(receipt, StorageReceipt):
+                receipt.storage_root_signature = signatures[str(items[i][1].get("constitutional_hash", ""))]
+
+        self._log_operations([
+            {
+                "operation": "read_verified",
+                "resource_id": r.resource_id,
+                "details": {"receipt_hash": r.constitutional_hash, "compliance_verified": True},
+            }
+            for r in receipts
+        ])
+        return results
+
+    def _package_signature_check(self, auth_package: Dict) -> Tuple[bytes, str, Optional[str]]:
+        """`(signed bytes, signature, key_type)` of a package; raises if unsigned."""
         package_copy = dict(auth_package)
         provided_signature = package_copy.pop("signature", None)
         if not provided_signature:
             raise ConstitutionalViolationError("Missing authorization package signature")
+        # Packages from before key types were recorded carry no `key_type`; the key decides.
+        return json.dumps(package_copy, sort_keys=True).encode(), provided_signature, package_copy.get("key_type")
 
-        package_json = json.dumps(package_copy, sort_keys=True)
-        try:
-            self.public_key.verify(
-                bytes.fromhex(provided_signature),
-                package_json.encode(),
-                ec.ECDSA(hashes.SHA256()),
-            )
-        except InvalidSignature:
+    def _verified_read_receipt(self, execution_result: Dict, auth_package: Dict) -> StorageReceipt:
+        """Check signature, compliance and resource; return the unsigned, hashed receipt."""
+        if not verify_signature(self.public_key, *self._package_signature_check(auth_package)):
             raise ConstitutionalViolationError("Invalid authorization package signature")
 
         compliant, reason = self.policy.verify_compliance(execution_result, auth_package["constraints"])
         if not compliant:
             raise ConstitutionalViolationError(f"Read execution non-compliant: {reason}")
 
+        return self._new_read_receipt(execution_result, auth_package)
+
+    def _new_read_receipt(self, execution_result: Dict, auth_package: Dict) -> StorageReceipt:
         resource_id = str(auth_package.get("resource_id"))
         if resource_id not in self.graph.graph:
             raise ResourceNotFoundError(f"Resource {resource_id} not found")
@@ -470,27 +1293,21 @@ class SovereignStorage:
         if exec_surface_id is not None:
             exec_surface_id = str(exec_surface_id)
 
+        package_hash = str(auth_package.get("constitutional_hash", ""))
         receipt = StorageReceipt(
             operation_id=f"read_{self.operation_counter:08x}",
             resource_id=resource_id,
             timestamp=time.time(),
-            constitutional_hash=str(auth_package.get("constitutional_hash", "")),
+            constitutional_hash=package_hash,
             policy_version=self.policy.constitution.get("version", "1.0"),
-            storage_root_signature=self._sign_data(str(auth_package.get("constitutional_hash", "")).encode()),
+            storage_root_signature="",
             execution_surface_id=exec_surface_id,
             fractal_depth=depth,
+            key_type=self.key_type,
+            package_hash=package_hash,
         )
         receipt.constitutional_hash = receipt.generate_hash()
 
-        self._log_operation(
-            operation="read_verified",
-            resource_id=resource_id,
-            details={
-                "receipt_hash": receipt.constitutional_hash,
-                "compliance_verified": True,
-            },
-        )
-
         self.operation_counter += 1
         return receipt
 
@@ -499,16 +1316,19 @@ class SovereignStorage:
 
         Append-only by file semantics (JSONL).
         """
-        log_dir = self.graph.evidence_path
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / "storage_operations.jsonl"
+        self._log_operations([{"operation": operation, "resource_id": resource_id, "details": details}])
 
-        entry = {
-            "timestamp": time.time(),
-            "operation": operation,
-            "resource_id": resource_id,
-            "details": details,
-        }
-
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n")
+    def _log_operations(self, entries: List[Dict[str, Any]]) -> None:
+        """Append several operation log entries in one write."""
+        if not entries:
+            return
+        # Opened on first use (receipt batches may log from the batcher's timer thread).
+        with self._operations_journal_lock:
+            if self._operations_journal is None:
+                self._operations_journal = JournalWriter(self.graph.evidence_path / self.OPERATIONS_LOG)
+
+        now = time.time()
+        self._operations_journal.append_many(
+            json.dumps({"timestamp": now, **entry}, ensure_ascii=False, sort_keys=True)
+            for entry in entries
+        )
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+from .ledger import _canonical_json, _exclusive_file_lock, utc_iso
+
+
+DEFAULT_ARCHIVE_PATH = "validation/sovereign_recursion/archive"
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ArchiveKey:
+    loop: str
+    iteration: int
+    attempt: int
+    kind: str = "run_report"
+    target: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "loop": self.loop,
+            "iteration": self.iteration,
+            "attempt": self.attempt,
+            "kind": self.kind,
+            "target": self.target,
+        }
+
+    @staticmethod
+    def from_dict(obj: dict[str, Any]) -> "ArchiveKey":
+        return ArchiveKey(
+            loop=str(obj.get("loop", "")),
+            iteration=int(obj.get("iteration", 0)),
+            attempt=int(obj.get("attempt", 0)),
+            kind=str(obj.get("kind", "run_report")),
+            target=str(obj.get("target", "") or ""),
+        )
+
+    def ref(self) -> str:
+        """Human-readable locator used in summaries/ledger instead of a directory path."""
+
+        base = f"{self.loop}/{self.target}" if self.target else self.loop
+        return f"archive:{base}/iter_{self.iteration:04d}/attempt_{self.attempt:02d}/{self.kind}"
+
+
+@dataclass(frozen=True)
+class ArchiveEntry:
+    key: ArchiveKey
+    segment: str
+    offset: int
+    length: int
+    sha256: str
+    ts_utc: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key.to_dict(),
+            "segment": self.segment,
+            "offset": self.offset,
+            "length": self.length,
+            "sha256": self.sha256,
+            "ts_utc": self.ts_utc,
+        }
+
+    @staticmethod
+    def from_dict(obj: dict[str, Any]) -> "ArchiveEntry":
+        return ArchiveEntry(
+            key=ArchiveKey.from_dict(obj.get("key") or {}),
+            segment=str(obj["segment"]),
+            offset=int(obj["offset"]),
+            length=int(obj["length"]),
+            sha256=str(obj["sha256"]),
+            ts_utc=str(obj.get("ts_utc", "")),
+        )
+
+
+class RunArchive:
+    """Append-only pack of run reports and alerts, replacing per-run directories.
+
+    Layout under `root`:
+    - `pack_00001.seg`, `pack_00002.seg`, ...: one canonical JSON record per line;
+      a new segment starts once the current one reaches `segment_max_bytes`.
+    - `index.jsonl`: one line per record with its key (loop, target, iteration,
+      attempt, kind) and the segment/offset/length/sha256 needed to read it back.
+
+    Segments are self-describing JSONL, so the index can be rebuilt from them.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_ARCHIVE_PATH, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES) -> None:
+        if segment_max_bytes <= 0:
+            raise ValueError("segment_max_bytes must be > 0")
+        self.root = Path(root)
+        self.segment_max_bytes = segment_max_bytes
+        self.index_path = self.root / "index.jsonl"
+        self._lock = threading.Lock()
+        self._index: dict[ArchiveKey, ArchiveEntry] | None = None
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _segments(self) -> list[Path]:
+        return sorted(self.root.glob("pack_*.seg"))
+
+    def _current_segment(self) -> Path:
+        segments = self._segments()
+        if segments and segments[-1].stat().st_size < self.segment_max_bytes:
+            return segments[-1]
+        n = int(segments[-1].stem.split("_")[1]) + 1 if segments else 1
+        return self.root / f"pack_{n:05d}.seg"
+
+    def append(self, key: ArchiveKey, payload: dict[str, Any]) -> ArchiveEntry:
+        record = _canonical_json({"key": key.to_dict(), "payload": payload}).encode("utf-8") + b"\n"
+
+        # Thread lock for in-process writers (multi-target loops), file lock on the
+        # index for other processes; the index lock serialises segment appends too.
+        with self._lock:
+            with self.index_path.open("a+", encoding="utf-8") as idx:
+                with _exclusive_file_lock(idx):
+                    segment = self._current_segment()
+                    with segment.open("ab") as f:
+                        offset = f.seek(0, os.SEEK_END)
+                        f.write(record)
+                        f.flush()
+                    entry = ArchiveEntry(
+                        key=key,
+                        segment=segment.name,
+                        offset=offset,
+                        length=len(record),
+                        sha256=hashlib.sha256(record).hexdigest(),
+                        ts_utc=utc_iso(),
+                    )
+                    idx.seek(0, os.SEEK_END)
+                    idx.write(_canonical_json(entry.to_dict()) + "\n")
+                    idx.flush()
+
+            if self._index is not None:
+                self._index[key] = entry
+        return entry
+
+    def entries(self) -> Iterable[ArchiveEntry]:
+        if not self.index_path.exists():
+            return
+        with self.index_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield ArchiveEntry.from_dict(json.loads(line))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+
+    def _load_index(self) -> dict[ArchiveKey, ArchiveEntry]:
+        if self._index is None:
+            # Later entries win if a key was ever written twice.
+            self._index = {e.key: e for e in self.entries()}
+        return self._index
+
+    def read_entry(self, entry: ArchiveEntry) -> dict[str, Any]:
+        with (self.root / entry.segment).open("rb") as f:
+            f.seek(entry.offset)
+            record = f.read(entry.length)
+        if hashlib.sha256(record).hexdigest() != entry.sha256:
+            raise ValueError(f"archive record hash mismatch: {entry.key.ref()}")
+        obj = json.loads(record)
+        return obj["payload"]
+
+    def get(self, key: ArchiveKey) -> dict[str, Any] | None:
+        entry = self._load_index().get(key)
+        if entry is None:
+            return None
+        return self.read_entry(entry)
+
+    def find(
+        self,
+        *,
+        loop: str | None = None,
+        iteration: int | None = None,
+        attempt: int | None = None,
+        kind: str | None = None,
+        target: str | None = None,
+    ) -> list[ArchiveEntry]:
+        out: list[ArchiveEntry] = []
+        for key, entry in self._load_index().items():
+            if loop is not None and key.loop != loop:
+                continue
+            if iteration is not None and key.iteration != iteration:
+                continue
+            if attempt is not None and key.attempt != attempt:
+                continue
+            if kind is not None and key.kind != kind:
+                continue
+            if target is not None and key.target != target:
+                continue
+            out.append(entry)
+        return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    import argparse
+
+    p = argparse.ArgumentParser(description="Sovereign Recursion run-artefact archive")
+    p.add_argument("--archive", default=os.getenv("SOVEREIGN_ARCHIVE", DEFAULT_ARCHIVE_PATH), help="Archive folder")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    lp = sub.add_parser("list")
+    xp = sub.add_parser("extract")
+    for sp in (lp, xp):
+        sp.add_argument("--loop", default=None)
+        sp.add_argument("--target", default=None)
+        sp.add_argument("--iteration", type=int, default=None)
+        sp.add_argument("--attempt", type=int, default=None)
+        sp.add_argument("--kind", default=None, help="run_report or alert")
+    xp.add_argument("--output", default="", help="Write the payload here instead of stdout")
+
+    args = p.parse_args(argv)
+    archive = RunArchive(args.archive)
+
+    entries = archive.find(
+        loop=args.loop,
+        iteration=args.iteration,
+        attempt=args.attempt,
+        kind=args.kind,
+        target=args.target,
+    )
+
+    if args.cmd == "list":
+        for e in entries:
+            print(json.dumps(e.to_dict(), sort_keys=True))
+        return 0
+
+    if args.cmd == "extract":
+        if len(entries) != 1:
+            print(f"expected exactly one matching record, found {len(entries)}", file=sys.stderr)
+            return 1
+        text = json.dumps(archive.read_entry(entries[0]), indent=2)
+        if args.output:
+            out = Path(args.output)
+            out.parent.mkdir(parents=True, exist_ok=True)
+            out.write_text(text, encoding="utf-8")
+            print(str(out))
+        else:
+            print(text)
+        return 0
+
+    raise SystemExit("unknown command")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
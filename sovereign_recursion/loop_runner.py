@@ -2,15 +2,20 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .archive import DEFAULT_ARCHIVE_PATH, ArchiveKey, RunArchive
 from .ledger import UniversalLedger, utc_iso
+from .timing import StageTimer, aggregate_timings
 
 
 def utc_stamp() -> str:
@@ -93,15 +98,17 @@ class IterationOutcome:
     iteration: int
     attempt: int
     rc: int
-    out_dir: Path
+    out_dir: Path | str
     stability: int | None
     failing_layers: list[str]
     classification: str
     action: str
     ts_utc: str
+    target: str | None = None
+    timings: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        d: dict[str, Any] = {
             "ts_utc": self.ts_utc,
             "iteration": self.iteration,
             "attempt": self.attempt,
@@ -112,6 +119,95 @@ class IterationOutcome:
             "classification": self.classification,
             "action": self.action,
         }
+        if self.target is not None:
+            d["target"] = self.target
+        if self.timings is not None:
+            d["timings"] = self.timings
+        return d
+
+
+# Target names become directories under the loop's out_root: one path component, no dot prefix.
+_TARGET_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+@dataclass(frozen=True)
+class LoopTarget:
+    """One repo root / NAS host / ledger triple for a multi-target loop."""
+
+    name: str
+    repo_root: str
+    ledger: str
+    nas_host: str | None = None
+    rating: int | None = None
+    max_retries: int | None = None
+
+    def __post_init__(self) -> None:
+        if not _TARGET_NAME.match(self.name):
+            raise ValueError(
+                f"target name {self.name!r} must be a single path component "
+                "(letters, digits, '.', '_', '-'; not starting with '.')"
+            )
+
+    @staticmethod
+    def from_json(obj: dict[str, Any], index: int) -> "LoopTarget":
+        repo_root = str(obj.get("repo_root", "")).strip()
+        ledger = str(obj.get("ledger", "")).strip()
+        if not repo_root:
+            raise ValueError(f"target {index}: repo_root is required")
+        if not ledger:
+            raise ValueError(f"target {index}: ledger is required")
+
+        name = str(obj.get("name", "")).strip() or f"target_{index:02d}"
+        nas_host = str(obj.get("nas_host") or "").strip() or None
+
+        rating = obj.get("rating")
+        max_retries = obj.get("max_retries")
+        if rating is not None and not isinstance(rating, int):
+            raise ValueError(f"target {name}: rating must be an integer")
+        if max_retries is not None and (not isinstance(max_retries, int) or max_retries < 0):
+            raise ValueError(f"target {name}: max_retries must be an integer >= 0")
+
+        return LoopTarget(
+            name=name,
+            repo_root=str(Path(repo_root).resolve()),
+            ledger=ledger,
+            nas_host=nas_host,
+            rating=rating,
+            max_retries=max_retries,
+        )
+
+    @staticmethod
+    def load_all(path: str | Path) -> list["LoopTarget"]:
+        """Load targets from a JSON file: a list, or an object with a `targets` list."""
+
+        obj = json.loads(Path(path).read_text(encoding="utf-8"))
+        if isinstance(obj, dict):
+            obj = obj.get("targets")
+        if not isinstance(obj, list) or not obj:
+            raise ValueError("targets file must contain a non-empty list of targets")
+
+        targets: list[LoopTarget] = []
+        for idx, item in enumerate(obj, start=1):
+            if not isinstance(item, dict):
+                raise ValueError(f"target {idx}: expected an object")
+            targets.append(LoopTarget.from_json(item, idx))
+
+        LoopTarget.check_unique(targets)
+        return targets
+
+    @staticmethod
+    def check_unique(targets: list["LoopTarget"]) -> None:
+        """Reject targets sharing a name (output directory) or a ledger file."""
+
+        names = [t.name for t in targets]
+        dupes = sorted({n for n in names if names.count(n) > 1})
+        if dupes:
+            raise ValueError(f"duplicate target names: {dupes}")
+
+        ledgers = [str(Path(t.ledger).resolve()) for t in targets]
+        dupes = sorted({lp for lp in ledgers if ledgers.count(lp) > 1})
+        if dupes:
+            raise ValueError(f"targets share a ledger: {dupes}")
 
 
 def _parse_run_report(stdout_text: str) -> dict[str, Any] | None:
@@ -200,7 +296,24 @@ def _classify(
     return "SOFT_FAIL", "retry", ["nonzero_rc_without_failing_layers"]
 
 
-def _write_alert(out_dir: Path, payload: dict[str, Any]) -> Path:
+def _write_alert(
+    out_dir: Path | str,
+    archive: RunArchive | None,
+    report_key: ArchiveKey | None,
+    payload: dict[str, Any],
+) -> Path | str:
+    if archive is not None and report_key is not None:
+        alert_key = ArchiveKey(
+            loop=report_key.loop,
+            iteration=report_key.iteration,
+            attempt=report_key.attempt,
+            kind="alert",
+            target=report_key.target,
+        )
+        archive.append(alert_key, payload)
+        return alert_key.ref()
+
+    out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
     alert_path = out_dir / "alert.json"
     alert_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
@@ -216,7 +329,10 @@ def run_engine_once(
     nas_host: str | None,
     offline: bool,
     gated: bool,
-    out_dir: Path,
+    out_dir: Path | None,
+    ledger_timings: bool = False,
+    archive: RunArchive | None = None,
+    archive_key: ArchiveKey | None = None,
 ) -> tuple[int, dict[str, Any] | None, str]:
     args: list[str] = [
         python_exe,
@@ -226,9 +342,22 @@ def run_engine_once(
         repo_root,
         "--ledger",
         ledger_path,
-        "--out-dir",
-        str(out_dir),
     ]
+    if archive is not None and archive_key is not None:
+        args += [
+            "--archive",
+            str(archive.root),
+            "--archive-loop",
+            archive_key.loop,
+            "--archive-target",
+            archive_key.target,
+            "--archive-iteration",
+            str(archive_key.iteration),
+            "--archive-attempt",
+            str(archive_key.attempt),
+        ]
+    elif out_dir is not None:
+        args += ["--out-dir", str(out_dir)]
     if rating is not None:
         args += ["--rating", str(rating)]
     if nas_host:
@@ -237,6 +366,8 @@ def run_engine_once(
         args.append("--offline")
     if gated:
         args.append("--gated")
+    if ledger_timings:
+        args.append("--ledger-timings")
 
     proc = subprocess.run(args, capture_output=True, text=True)
     report = _parse_run_report(proc.stdout)
@@ -244,6 +375,339 @@ def run_engine_once(
     return proc.returncode, report, stderr
 
 
+class _SummaryWriter:
+    """Append JSONL lines to one summary file; safe to share across worker threads."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, obj: dict[str, Any]) -> None:
+        line = json.dumps(obj, sort_keys=True) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def _policy_dict(policy: ClassificationPolicy) -> dict[str, Any]:
+    return {
+        "hard_layers_on_degraded": sorted(policy.hard_layers_on_degraded),
+        "hard_statuses": sorted(policy.hard_statuses),
+        "soft_statuses": sorted(policy.soft_statuses),
+        "treat_missing_report_as": policy.treat_missing_report_as,
+        "treat_missing_layers_as": policy.treat_missing_layers_as,
+    }
+
+
+def run_loop(
+    *,
+    python_exe: str,
+    repo_root: str,
+    ledger_path: str,
+    nas_host: str | None,
+    rating: int | None,
+    iterations: int,
+    interval_seconds: int,
+    max_retries: int,
+    emit_alerts: bool,
+    offline: bool,
+    gated: bool,
+    policy: ClassificationPolicy,
+    policy_path: str | None,
+    out_root: Path,
+    summary: _SummaryWriter,
+    target: str | None = None,
+    ledger_timings: bool = False,
+    archive: RunArchive | None = None,
+    loop_id: str = "",
+) -> list[IterationOutcome]:
+    """Run the sense → gate → act → record loop for a single repo root / ledger.
+
+    With `archive`, run reports and alerts are appended to the pack archive
+    (keyed by loop id, target, iteration, attempt) instead of per-attempt folders.
+    """
+
+    loop_id = loop_id or out_root.name
+
+    out_root.mkdir(parents=True, exist_ok=True)
+
+    # Loop-level evidence in the same ledger
+    ledger = UniversalLedger(ledger_path=ledger_path)
+
+    ledger.append(
+        "meta",
+        "loop_start",
+        {
+            "ts_utc": utc_iso(),
+            "out_root": str(out_root),
+            "iterations": iterations,
+            "interval_seconds": interval_seconds,
+            "max_retries": max_retries,
+            "offline": offline,
+            "gated": gated,
+            "emit_alerts": emit_alerts,
+            "policy_path": str(policy_path) if policy_path else "",
+            "policy": _policy_dict(policy),
+            "repo_root": repo_root,
+            "nas_host": nas_host,
+            "artifacts": "archive" if archive is not None else "dir",
+            **({"archive": str(archive.root), "loop_id": loop_id} if archive is not None else {}),
+            **({"target": target} if target is not None else {}),
+        },
+    )
+
+    outcomes: list[IterationOutcome] = []
+    attempt_timings: list[dict[str, Any]] = []
+
+    for i in range(1, iterations + 1):
+        attempt = 0
+        last_stderr = ""
+
+        while True:
+            attempt += 1
+            report_key: ArchiveKey | None = None
+            iter_dir: Path | str
+            if archive is not None:
+                report_key = ArchiveKey(loop=loop_id, iteration=i, attempt=attempt, target=target or "")
+                iter_dir = report_key.ref()
+            else:
+                iter_dir = out_root / f"iter_{i:04d}" / f"attempt_{attempt:02d}"
+                iter_dir.mkdir(parents=True, exist_ok=True)
+
+            timer = StageTimer()
+            engine_stages: dict[str, Any] = {}
+            try:
+                with timer.span("engine_run"):
+                    rc, report, stderr = run_engine_once(
+                        python_exe=python_exe,
+                        ledger_path=ledger_path,
+                        repo_root=repo_root,
+                        rating=rating,
+                        nas_host=nas_host,
+                        offline=offline,
+                        gated=gated,
+                        out_dir=iter_dir if isinstance(iter_dir, Path) else None,
+                        ledger_timings=ledger_timings,
+                        archive=archive,
+                        archive_key=report_key,
+                    )
+
+                last_stderr = stderr
+
+                failing_layers: list[str] = []
+                stability: int | None = None
+                if report is not None:
+                    failing_layers = _failing_layers_from_report(report)
+                    score = report.get("score")
+                    if isinstance(score, dict):
+                        try:
+                            stability = int(score.get("stability"))
+                        except Exception:
+                            stability = None
+
+                classification, action, reasons = _classify(report, rc, policy)
+
+                # The engine's own stages (prefixed) alongside the loop-side stages.
+                engine_timings = report.get("timings") if report is not None else None
+                if isinstance(engine_timings, dict) and isinstance(engine_timings.get("stages"), dict):
+                    for stage, d in engine_timings["stages"].items():
+                        engine_stages[f"engine.{stage}"] = d
+
+                outcome = IterationOutcome(
+                    iteration=i,
+                    attempt=attempt,
+                    rc=rc,
+                    out_dir=iter_dir,
+                    stability=stability,
+                    failing_layers=failing_layers,
+                    classification=classification,
+                    action=action,
+                    ts_utc=utc_iso(),
+                    target=target,
+                    timings={**timer.stages(), **engine_stages},
+                )
+                outcomes.append(outcome)
+
+                # Append loop summary line
+                with timer.span("summary_write"):
+                    summary.write(outcome.to_dict())
+
+                # Record loop iteration into ledger
+                with timer.span("ledger_append"):
+                    ledger.append(
+                        "meta",
+                        "loop_iteration",
+                        {
+                            "iteration": i,
+                            "attempt": attempt,
+                            "rc": rc,
+                            "out_dir": str(iter_dir),
+                            "stability": stability,
+                            "failing_layers": failing_layers,
+                            "classification": classification,
+                            "action": action,
+                            "reasons": reasons,
+                            "stderr_tail": last_stderr.splitlines()[-5:] if last_stderr else [],
+                        },
+                    )
+
+                if rc == 0:
+                    break
+
+                # Classification-driven bounded action
+                if classification == "HARD_FAIL":
+                    if emit_alerts:
+                        with timer.span("alert_write"):
+                            alert_path = _write_alert(
+                                iter_dir,
+                                archive,
+                                report_key,
+                                {
+                                    "ts_utc": utc_iso(),
+                                    "kind": "HARD_FAIL",
+                                    "iteration": i,
+                                    "attempt": attempt,
+                                    "rc": rc,
+                                    "reasons": reasons,
+                                    "failing_layers": failing_layers,
+                                    "report_present": report is not None,
+                                    **({"target": target} if target is not None else {}),
+                                },
+                            )
+                            ledger.append(
+                                "meta",
+                                "loop_alert",
+                                {
+                                    "kind": "HARD_FAIL",
+                                    "iteration": i,
+                                    "attempt": attempt,
+                                    "alert_path": str(alert_path),
+                                    "reasons": reasons,
+                                    "failing_layers": failing_layers,
+                                },
+                            )
+                    break
+
+                # SOFT_FAIL: retry bounded
+                if attempt > max_retries:
+                    if emit_alerts:
+                        with timer.span("alert_write"):
+                            alert_path = _write_alert(
+                                iter_dir,
+                                archive,
+                                report_key,
+                                {
+                                    "ts_utc": utc_iso(),
+                                    "kind": "SOFT_FAIL_EXHAUSTED",
+                                    "iteration": i,
+                                    "attempt": attempt,
+                                    "rc": rc,
+                                    "reasons": reasons,
+                                    "failing_layers": failing_layers,
+                                    "report_present": report is not None,
+                                    **({"target": target} if target is not None else {}),
+                                },
+                            )
+                            ledger.append(
+                                "meta",
+                                "loop_alert",
+                                {
+                                    "kind": "SOFT_FAIL_EXHAUSTED",
+                                    "iteration": i,
+                                    "attempt": attempt,
+                                    "alert_path": str(alert_path),
+                                    "reasons": reasons,
+                                    "failing_layers": failing_layers,
+                                },
+                            )
+                    break
+
+                with timer.span("retry_wait"):
+                    time.sleep(min(5, max(1, interval_seconds or 1)))
+            finally:
+                attempt_timings.append({"stages": {**timer.stages(), **engine_stages}})
+
+        # Sleep between iterations
+        if i < iterations and interval_seconds > 0:
+            time.sleep(interval_seconds)
+
+    loop_timings = aggregate_timings(attempt_timings)
+    (out_root / "loop_timings.json").write_text(
+        json.dumps({"attempts": len(attempt_timings), "stages": loop_timings}, indent=2),
+        encoding="utf-8",
+    )
+    if ledger_timings:
+        ledger.append("meta", "timings", {"scope": "loop", "out_root": str(out_root), "stages": loop_timings})
+
+    ledger.append("meta", "loop_end", {"ts_utc": utc_iso(), "out_root": str(out_root)})
+
+    return outcomes
+
+
+def _loop_failed(outcomes: list[IterationOutcome]) -> bool:
+    return any(o.rc != 0 and o.attempt >= 1 for o in outcomes)
+
+
+def run_targets(
+    targets: list[LoopTarget],
+    *,
+    max_workers: int,
+    python_exe: str,
+    out_root: Path,
+    summary: _SummaryWriter,
+    **loop_kwargs: Any,
+) -> dict[str, list[IterationOutcome] | None]:
+    """Run one loop per target concurrently in a bounded thread pool.
+
+    Each worker only waits on its engine subprocess, so threads are enough to
+    overlap targets. A target that raises is recorded in the summary as
+    `target_error` and reported as `None`; the others keep running. Targets
+    must have distinct names and ledgers (`LoopTarget.check_unique`).
+    """
+
+    LoopTarget.check_unique(targets)
+    results: dict[str, list[IterationOutcome] | None] = {}
+    base_retries = loop_kwargs.pop("max_retries")
+    base_rating = loop_kwargs.pop("rating")
+
+    def _run_one(t: LoopTarget) -> list[IterationOutcome]:
+        return run_loop(
+            python_exe=python_exe,
+            repo_root=t.repo_root,
+            ledger_path=t.ledger,
+            nas_host=t.nas_host,
+            rating=t.rating if t.rating is not None else base_rating,
+            max_retries=t.max_retries if t.max_retries is not None else base_retries,
+            out_root=out_root / t.name,
+            summary=summary,
+            target=t.name,
+            **loop_kwargs,
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(targets)))) as pool:
+        futures = {pool.submit(_run_one, t): t for t in targets}
+        for fut in as_completed(futures):
+            t = futures[fut]
+            t_end = {"ts_utc": utc_iso(), "target": t.name, "ledger": t.ledger}
+            try:
+                outcomes = fut.result()
+            except Exception as e:
+                results[t.name] = None
+                summary.write({**t_end, "kind": "target_error", "error": f"{type(e).__name__}: {e}"})
+                continue
+            results[t.name] = outcomes
+            summary.write(
+                {
+                    **t_end,
+                    "kind": "target_end",
+                    "attempts": len(outcomes),
+                    "failed": _loop_failed(outcomes),
+                }
+            )
+
+    return results
+
+
 def main(argv: list[str] | None = None) -> int:
     p = argparse.ArgumentParser(description="Unified Sovereign Loop Runner (sense → gate → act → record)")
     p.add_argument("--iterations", type=int, default=1, help="Number of loop iterations")
@@ -265,6 +729,13 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("--nas-host", default="", help="NAS host/ip (optional)")
     p.add_argument("--rating", type=int, default=None, help="Cognitive self-rating 1-5")
 
+    p.add_argument(
+        "--targets",
+        default="",
+        help="JSON file listing targets (repo_root, nas_host, ledger); runs them concurrently",
+    )
+    p.add_argument("--max-workers", type=int, default=4, help="Concurrent targets when --targets is used")
+
     p.add_argument("--offline", action="store_true", help="Skip outbound probes")
     p.add_argument("--gated", action="store_true", help="Fail iteration if any layer is DEGRADED/OVERLOADED/CORRUPTED")
 
@@ -274,6 +745,22 @@ def main(argv: list[str] | None = None) -> int:
         help="Root folder for loop artifacts (default: validation/sovereign_recursion/loop_<stamp>)",
     )
     p.add_argument("--dashboard", action="store_true", help="Generate dashboard after loop")
+    p.add_argument(
+        "--artifacts",
+        choices=["dir", "archive"],
+        default="dir",
+        help="dir: iter_XXXX/attempt_YY folders (default); archive: append reports/alerts to a pack archive",
+    )
+    p.add_argument(
+        "--archive",
+        default=DEFAULT_ARCHIVE_PATH,
+        help=f"Pack archive folder for --artifacts archive (default: {DEFAULT_ARCHIVE_PATH})",
+    )
+    p.add_argument(
+        "--ledger-timings",
+        action="store_true",
+        help="Append per-run and per-loop stage timings to the ledger as meta/timings events",
+    )
 
     args = p.parse_args(argv)
 
@@ -283,202 +770,82 @@ def main(argv: list[str] | None = None) -> int:
         raise SystemExit("--interval-seconds must be >= 0")
     if args.max_retries < 0:
         raise SystemExit("--max-retries must be >= 0")
+    if args.max_workers <= 0:
+        raise SystemExit("--max-workers must be >= 1")
 
-    repo_root = str(Path(args.repo_root).resolve())
-    ledger_path = str(Path(args.ledger))
-    nas_host = (args.nas_host or "").strip() or None
+    targets: list[LoopTarget] = []
+    if (args.targets or "").strip():
+        try:
+            targets = LoopTarget.load_all(args.targets)
+        except (OSError, ValueError) as e:
+            raise SystemExit(f"--targets: {e}")
 
     out_root = Path(args.out_root) if args.out_root else (Path("validation") / "sovereign_recursion" / f"loop_{utc_stamp()}")
     out_root.mkdir(parents=True, exist_ok=True)
 
-    summary_path = out_root / "loop_summary.jsonl"
-
-    # Loop-level evidence in the same ledger
-    ledger = UniversalLedger(ledger_path=ledger_path)
+    summary = _SummaryWriter(out_root / "loop_summary.jsonl")
 
     policy_path = (args.policy or "").strip() or None
     policy = ClassificationPolicy.load(policy_path)
 
-    ledger.append(
-        "meta",
-        "loop_start",
-        {
-            "ts_utc": utc_iso(),
-            "out_root": str(out_root),
-            "iterations": args.iterations,
-            "interval_seconds": args.interval_seconds,
-            "max_retries": args.max_retries,
-            "offline": bool(args.offline),
-            "gated": bool(args.gated),
-            "emit_alerts": bool(args.emit_alerts),
-            "policy_path": str(policy_path) if policy_path else "",
-            "policy": {
-                "hard_layers_on_degraded": sorted(policy.hard_layers_on_degraded),
-                "hard_statuses": sorted(policy.hard_statuses),
-                "soft_statuses": sorted(policy.soft_statuses),
-                "treat_missing_report_as": policy.treat_missing_report_as,
-                "treat_missing_layers_as": policy.treat_missing_layers_as,
-            },
-            "repo_root": repo_root,
-            "nas_host": nas_host,
-        },
-    )
-
     python_exe = sys.executable
-    outcomes: list[IterationOutcome] = []
-
-    for i in range(1, args.iterations + 1):
-        attempt = 0
-        last_rc = 0
-        last_report: dict[str, Any] | None = None
-        last_stderr = ""
-
-        while True:
-            attempt += 1
-            iter_dir = out_root / f"iter_{i:04d}" / f"attempt_{attempt:02d}"
-            iter_dir.mkdir(parents=True, exist_ok=True)
-
-            rc, report, stderr = run_engine_once(
-                python_exe=python_exe,
-                ledger_path=ledger_path,
-                repo_root=repo_root,
-                rating=args.rating,
-                nas_host=nas_host,
-                offline=bool(args.offline),
-                gated=bool(args.gated),
-                out_dir=iter_dir,
-            )
-
-            last_rc, last_report, last_stderr = rc, report, stderr
-
-            failing_layers: list[str] = []
-            stability: int | None = None
-            if report is not None:
-                failing_layers = _failing_layers_from_report(report)
-                score = report.get("score")
-                if isinstance(score, dict):
-                    try:
-                        stability = int(score.get("stability"))
-                    except Exception:
-                        stability = None
-
-            classification, action, reasons = _classify(report, rc, policy)
-
-            outcome = IterationOutcome(
-                iteration=i,
-                attempt=attempt,
-                rc=rc,
-                out_dir=iter_dir,
-                stability=stability,
-                failing_layers=failing_layers,
-                classification=classification,
-                action=action,
-                ts_utc=utc_iso(),
-            )
-            outcomes.append(outcome)
-
-            # Append loop summary line
-            with summary_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(outcome.to_dict(), sort_keys=True) + "\n")
-
-            # Record loop iteration into ledger
-            ledger.append(
-                "meta",
-                "loop_iteration",
-                {
-                    "iteration": i,
-                    "attempt": attempt,
-                    "rc": rc,
-                    "out_dir": str(iter_dir),
-                    "stability": stability,
-                    "failing_layers": failing_layers,
-                    "classification": classification,
-                    "action": action,
-                    "reasons": reasons,
-                    "stderr_tail": last_stderr.splitlines()[-5:] if last_stderr else [],
-                },
-            )
-
-            if rc == 0:
-                break
-
-            # Classification-driven bounded action
-            if classification == "HARD_FAIL":
-                if args.emit_alerts:
-                    alert_path = _write_alert(
-                        iter_dir,
-                        {
-                            "ts_utc": utc_iso(),
-                            "kind": "HARD_FAIL",
-                            "iteration": i,
-                            "attempt": attempt,
-                            "rc": rc,
-                            "reasons": reasons,
-                            "failing_layers": failing_layers,
-                            "report_present": report is not None,
-                        },
-                    )
-                    ledger.append(
-                        "meta",
-                        "loop_alert",
-                        {
-                            "kind": "HARD_FAIL",
-                            "iteration": i,
-                            "attempt": attempt,
-                            "alert_path": str(alert_path),
-                            "reasons": reasons,
-                            "failing_layers": failing_layers,
-                        },
-                    )
-                break
-
-            # SOFT_FAIL: retry bounded
-            if attempt > args.max_retries:
-                if args.emit_alerts:
-                    alert_path = _write_alert(
-                        iter_dir,
-                        {
-                            "ts_utc": utc_iso(),
-                            "kind": "SOFT_FAIL_EXHAUSTED",
-                            "iteration": i,
-                            "attempt": attempt,
-                            "rc": rc,
-                            "reasons": reasons,
-                            "failing_layers": failing_layers,
-                            "report_present": report is not None,
-                        },
-                    )
-                    ledger.append(
-                        "meta",
-                        "loop_alert",
-                        {
-                            "kind": "SOFT_FAIL_EXHAUSTED",
-                            "iteration": i,
-                            "attempt": attempt,
-                            "alert_path": str(alert_path),
-                            "reasons": reasons,
-                            "failing_layers": failing_layers,
-                        },
-                    )
-                break
-
-            time.sleep(min(5, max(1, args.interval_seconds or 1)))
-
-        # Sleep between iterations
-        if i < args.iterations and args.interval_seconds > 0:
-            time.sleep(args.interval_seconds)
-
-    ledger.append("meta", "loop_end", {"ts_utc": utc_iso(), "out_root": str(out_root)})
+    loop_kwargs: dict[str, Any] = {
+        "iterations": args.iterations,
+        "interval_seconds": args.interval_seconds,
+        "max_retries": args.max_retries,
+        "rating": args.rating,
+        "emit_alerts": bool(args.emit_alerts),
+        "offline": bool(args.offline),
+        "gated": bool(args.gated),
+        "policy": policy,
+        "policy_path": policy_path,
+        "ledger_timings": bool(args.ledger_timings),
+        "archive": RunArchive(args.archive) if args.artifacts == "archive" else None,
+        "loop_id": out_root.name,
+    }
+
+    if targets:
+        results = run_targets(
+            targets,
+            max_workers=args.max_workers,
+            python_exe=python_exe,
+            out_root=out_root,
+            summary=summary,
+            **loop_kwargs,
+        )
+        dashboards = [
+            (t.ledger, ["--output", str(out_root / t.name / "sovereignty_dashboard.html")]) for t in targets
+        ]
+        failed = any(r is None or _loop_failed(r) for r in results.values())
+    else:
+        repo_root = str(Path(args.repo_root).resolve())
+        ledger_path = str(Path(args.ledger))
+        nas_host = (args.nas_host or "").strip() or None
+        outcomes = run_loop(
+            python_exe=python_exe,
+            repo_root=repo_root,
+            ledger_path=ledger_path,
+            nas_host=nas_host,
+            out_root=out_root,
+            summary=summary,
+            **loop_kwargs,
+        )
+        dashboards = [(ledger_path, [])]
+        failed = _loop_failed(outcomes)
 
     # Optionally generate dashboard at end
     if args.dashboard:
-        try:
-            subprocess.run([python_exe, "-m", "sovereign_recursion.dashboard", "--ledger", ledger_path], check=False)
-        except Exception:
-            pass
+        for ledger_path, extra in dashboards:
+            try:
+                subprocess.run(
+                    [python_exe, "-m", "sovereign_recursion.dashboard", "--ledger", ledger_path, *extra],
+                    check=False,
+                )
+            except Exception:
+                pass
 
     # Exit code: if gated, fail if any iteration ended non-zero.
-    if args.gated and any(o.rc != 0 and o.attempt >= 1 for o in outcomes):
+    if args.gated and failed:
         return 1
 
     return 0
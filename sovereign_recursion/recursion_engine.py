@@ -13,7 +13,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .archive import ArchiveKey, RunArchive
 from .ledger import UniversalLedger, utc_iso
+from .timing import StageTimer
 
 
 def utc_stamp() -> str:
@@ -265,13 +267,39 @@ def main(argv: list[str] | None = None) -> int:
         default="",
         help="Write a run report JSON here (default: validation/sovereign_recursion/run_<stamp>)",
     )
+    p.add_argument(
+        "--archive",
+        default="",
+        help="Append the run report to this run-artefact archive instead of writing an out-dir",
+    )
+    p.add_argument("--archive-loop", default="", help="Archive key: loop id (default: run_<stamp>)")
+    p.add_argument("--archive-target", default="", help="Archive key: target name")
+    p.add_argument("--archive-iteration", type=int, default=0, help="Archive key: iteration")
+    p.add_argument("--archive-attempt", type=int, default=0, help="Archive key: attempt")
+    p.add_argument(
+        "--ledger-timings",
+        action="store_true",
+        help="Also append the per-stage timing spans to the ledger as a meta/timings event",
+    )
     args = p.parse_args(argv)
 
     repo_root = Path(args.repo_root).resolve()
     nas_host = (args.nas_host or "").strip() or None
 
-    out_dir = Path(args.out_dir) if args.out_dir else (Path("validation") / "sovereign_recursion" / f"run_{utc_stamp()}")
-    out_dir.mkdir(parents=True, exist_ok=True)
+    archive_key: ArchiveKey | None = None
+    if args.archive:
+        archive_key = ArchiveKey(
+            loop=args.archive_loop or f"run_{utc_stamp()}",
+            iteration=args.archive_iteration,
+            attempt=args.archive_attempt,
+            kind="run_report",
+            target=args.archive_target,
+        )
+        out_dir_label = archive_key.ref()
+    else:
+        out_dir = Path(args.out_dir) if args.out_dir else (Path("validation") / "sovereign_recursion" / f"run_{utc_stamp()}")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        out_dir_label = str(out_dir)
 
     ledger = UniversalLedger(ledger_path=args.ledger)
 
@@ -284,45 +312,68 @@ def main(argv: list[str] | None = None) -> int:
         "nas_host": nas_host,
     }
 
+    timer = StageTimer()
+
+    def _append(layer: str, event_type: str, data: dict) -> str:
+        with timer.span("ledger_append"):
+            return ledger.append(layer, event_type, data)
+
     # Record intent
-    ledger.append("meta", "engine_start", {**run_meta, "out_dir": str(out_dir)})
+    _append("meta", "engine_start", {**run_meta, "out_dir": out_dir_label})
 
     results: dict[str, LayerResult] = {}
 
-    results["physical"] = check_physical(offline=bool(args.offline))
-    ledger.append("physical", "check", results["physical"].to_dict())
+    with timer.span("check.physical"):
+        results["physical"] = check_physical(offline=bool(args.offline))
+    _append("physical", "check", results["physical"].to_dict())
 
-    results["digital"] = check_digital(repo_root)
-    ledger.append("digital", "check", results["digital"].to_dict())
+    with timer.span("check.digital"):
+        results["digital"] = check_digital(repo_root)
+    _append("digital", "check", results["digital"].to_dict())
 
-    results["codex"] = check_codex_integrity(repo_root)
-    ledger.append("codex", "check", results["codex"].to_dict())
+    with timer.span("check.codex"):
+        results["codex"] = check_codex_integrity(repo_root)
+    _append("codex", "check", results["codex"].to_dict())
 
-    results["cognitive"] = check_cognitive(args.rating)
-    ledger.append("cognitive", "checkpoint", results["cognitive"].to_dict())
+    with timer.span("check.cognitive"):
+        results["cognitive"] = check_cognitive(args.rating)
+    _append("cognitive", "checkpoint", results["cognitive"].to_dict())
 
-    results["collaborative"] = check_collaborative(nas_host, offline=bool(args.offline))
-    ledger.append("collaborative", "node_check", results["collaborative"].to_dict())
+    with timer.span("check.collaborative"):
+        results["collaborative"] = check_collaborative(nas_host, offline=bool(args.offline))
+    _append("collaborative", "node_check", results["collaborative"].to_dict())
 
-    results["meta"] = check_meta(ledger)
-    ledger.append("meta", "self_check", results["meta"].to_dict())
+    with timer.span("check.meta"):
+        results["meta"] = check_meta(ledger)
+    _append("meta", "self_check", results["meta"].to_dict())
 
     score = compute_sovereign_score(results)
-    ledger.append("meta", "sovereign_score", score)
+    _append("meta", "sovereign_score", score)
 
     run_report = {
         **run_meta,
-        "out_dir": str(out_dir),
+        "out_dir": out_dir_label,
         "layers": {k: v.to_dict() for k, v in results.items()},
         "score": score,
         "ledger_path": str(Path(args.ledger)),
+        # Spans up to (not including) the report write itself.
+        "timings": timer.to_dict(),
     }
 
-    report_path = out_dir / "run_report.json"
-    report_path.write_text(json.dumps(run_report, indent=2), encoding="utf-8")
+    with timer.span("report_write"):
+        if archive_key is not None:
+            RunArchive(args.archive).append(archive_key, run_report)
+            report_ref = archive_key.ref()
+        else:
+            report_path = out_dir / "run_report.json"
+            report_path.write_text(json.dumps(run_report, indent=2), encoding="utf-8")
+            report_ref = str(report_path)
+
+    if args.ledger_timings:
+        ledger.append("meta", "timings", timer.to_dict())
 
     # Final record
-    ledger.append("meta", "engine_end", {"ok": True, "report": str(report_path)})
+    ledger.append("meta", "engine_end", {"ok": True, "report": report_ref})
 
     print(json.dumps(run_report, indent=2))
 
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+
+@dataclass
+class TimingSpan:
+    stage: str
+    start: float
+    end: float
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end - self.start) * 1000.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "stage": self.stage,
+            "start_monotonic": self.start,
+            "end_monotonic": self.end,
+            "duration_ms": round(self.duration_ms, 3),
+        }
+
+
+class StageTimer:
+    """Collects monotonic timing spans per named stage.
+
+    Stages may repeat (e.g. `ledger_append`); each occurrence is a span and the
+    per-stage summary carries the count and total.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[TimingSpan] = []
+
+    @contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.spans.append(TimingSpan(stage=stage, start=start, end=time.monotonic()))
+
+    def stages(self) -> dict[str, dict[str, Any]]:
+        out: dict[str, dict[str, Any]] = {}
+        for s in self.spans:
+            d = out.setdefault(s.stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            d["count"] += 1
+            d["total_ms"] += s.duration_ms
+            d["max_ms"] = max(d["max_ms"], s.duration_ms)
+        for d in out.values():
+            d["total_ms"] = round(d["total_ms"], 3)
+            d["max_ms"] = round(d["max_ms"], 3)
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "clock": "monotonic",
+            "spans": [s.to_dict() for s in self.spans],
+            "stages": self.stages(),
+        }
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (no interpolation); `values` must be non-empty."""
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def aggregate_timings(timings: Iterable[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Aggregate `StageTimer.to_dict()` payloads into p50/p95 per stage.
+
+    Each run contributes one sample per stage: the stage total for that run.
+    """
+
+    samples: dict[str, list[float]] = {}
+    for t in timings:
+        stages = t.get("stages") if isinstance(t, dict) else None
+        if not isinstance(stages, dict):
+            continue
+        for stage, d in stages.items():
+            if isinstance(d, dict) and isinstance(d.get("total_ms"), (int, float)):
+                samples.setdefault(str(stage), []).append(float(d["total_ms"]))
+
+    return {
+        stage: {
+            "runs": len(vals),
+            "p50_ms": round(percentile(vals, 50), 3),
+            "p95_ms": round(percentile(vals, 95), 3),
+            "max_ms": round(max(vals), 3),
+        }
+        for stage, vals in sorted(samples.items())
+    }
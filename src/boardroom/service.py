@@ -1,14 +1,13 @@
 import time, os, sys, json
 sys.path.append(os.getcwd())
 from src.core.config import CONFIG
+from sovereign_os.journal import shared_journal
 from core.vortex_router import simulate_vortex_path, enforce_vortex_constraints  # draft law integration
 
 LOG_PATH = os.path.join("Governance", "Logs", "boardroom_vortex_simulation.jsonl")
 
 def log_event(obj: dict):
-    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
-    with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(obj) + "\n")
+    shared_journal(LOG_PATH).append(json.dumps(obj))
 
 # Placeholder for deriving a path; single-node stub
 DEFAULT_PATH = ["node0:property", "node0:evidence", "node0:ops"]
@@ -3,6 +3,7 @@ import json
 import time
 from pathlib import Path
 from src.core.config import CONFIG
+from sovereign_os.journal import shared_journal
 
 class SovereignRouter:
     def __init__(self, agent_name: str):
@@ -54,9 +55,7 @@ class SovereignRouter:
     def log_event(self, event_type: str, details: dict):
         # Use SOVEREIGN_ROOT if available
         root_prefix = Path(os.environ.get("SOVEREIGN_ROOT", "."))
-        log_dir = root_prefix / "Governance" / "Logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_file = log_dir / "audit_chain.jsonl"
+        log_file = root_prefix / "Governance" / "Logs" / "audit_chain.jsonl"
         
         event = {
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
@@ -67,8 +66,7 @@ class SovereignRouter:
             "hash": "pending" 
         }
         
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event) + "\n")
+        shared_journal(log_file).append(json.dumps(event))
 
     def process(self, filename: str, data: dict, confidence: float = 1.0, estimated_cost: float = 0.0):
         self.save_result(filename, data)
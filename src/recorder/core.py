@@ -4,6 +4,8 @@ from pathlib import Path
 import yaml
 import time
 
+from sovereign_os.journal import JournalWriter
+
 class Recorder:
     def __init__(self, config_path='config/recorder_config.yaml'):
         with open(config_path, 'r', encoding='utf-8') as f:
@@ -12,6 +14,8 @@ class Recorder:
         self.node_id = self.config['node_id']
         self.schema_version = self.config['schema_version']
         self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        # Optional `journal:` section, e.g. {fsync: commit, flush_every: 64, background: true}
+        self.journal = JournalWriter(self.ledger_path, **(self.config.get('journal') or {}))
 
     def log_event(self, event_type, payload):
         event = {
@@ -22,14 +26,17 @@ class Recorder:
             'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
             'payload': payload
         }
-        with open(self.ledger_path, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(event, ensure_ascii=False) + '\n')
+        self.journal.append(json.dumps(event, ensure_ascii=False))
         return event
 
+    def close(self):
+        self.journal.close()
+
 if __name__ == '__main__':
     import sys
     if '--smoke-test' in sys.argv:
         recorder = Recorder()
         for i in range(20):
             recorder.log_event('test', {'index': i})
+        recorder.close()
         print(f"Smoke test complete. Check {recorder.ledger_path}")
@@ -0,0 +1,64 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from sovereign_os.journal import FSYNC_COMMIT, JournalWriter, last_line, shared_journal
+
+
+class TestJournalWriter(unittest.TestCase):
+    def test_group_commit_writes_on_threshold_and_flush(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ledger.jsonl"
+            writer = JournalWriter(path, fsync=FSYNC_COMMIT, flush_every=3, flush_interval=60)
+            writer.append({"n": 0})
+            writer.append({"n": 1})
+            self.assertEqual(path.read_bytes(), b"")
+            writer.append({"n": 2})
+            writer.append('{"n": 3}')
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 3)
+            writer.flush()
+            self.assertEqual(writer.stats()["commits"], 2)
+            self.assertEqual(writer.stats()["fsyncs"], 2)
+            writer.close()
+            self.assertEqual([json.loads(l)["n"] for l in path.read_text(encoding="utf-8").splitlines()], [0, 1, 2, 3])
+            self.assertEqual(last_line(path, block_size=4), '{"n": 3}')
+            with self.assertRaises(ValueError):
+                writer.append({"n": 4})
+
+    def test_rotation_by_size(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ledger.jsonl"
+            with JournalWriter(path, max_bytes=40) as writer:
+                for i in range(10):
+                    writer.append({"n": i})
+            self.assertGreater(writer.rotations, 0)
+            lines = []
+            for f in sorted(Path(tmp).iterdir(), key=lambda p: (p == path, p.name)):
+                lines += [json.loads(l)["n"] for l in f.read_text(encoding="utf-8").splitlines()]
+            self.assertEqual(lines, list(range(10)))
+
+    def test_background_flusher_keeps_order_under_backpressure(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ledger.jsonl"
+            writer = JournalWriter(path, flush_every=16, background=True, queue_size=8)
+            writer.append_many({"n": i} for i in range(500))
+            writer.flush()
+            self.assertEqual(len(path.read_text(encoding="utf-8").splitlines()), 500)
+            self.assertLessEqual(writer.queue_high_water, 8)
+            writer.close()
+            self.assertEqual(json.loads(last_line(path))["n"], 499)
+
+    def test_shared_journal_is_one_writer_per_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "ledger.jsonl"
+            writer = shared_journal(path)
+            self.assertIs(shared_journal(str(path)), writer)
+            writer.close()
+            self.assertIsNot(shared_journal(path), writer)
+            shared_journal(path).close()
+        self.assertIsNone(last_line(Path(tmp) / "missing.jsonl"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,353 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("yaml")
+
+from agi.core import model_runner
+from agi.core.adaptive_router import AdaptiveRouter
+from agi.core.provider_clients import ProviderClients
+from agi.core.response_cache import ResponseCache
+
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        self.server.peers.add(self.client_address)
+        if body["prompt"].startswith("slow"):
+            time.sleep(0.5)
+        if body["prompt"].startswith("fail"):
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        text = f"echo:{body['prompt']}"
+        if body.get("stream"):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            words = text.split(" ")
+            records = [{"response": w if i == 0 else " " + w, "done": False} for i, w in enumerate(words)]
+            records.append({"response": "", "done": True, "prompt_eval_count": 3, "eval_count": len(words)})
+            for record in records:
+                line = (json.dumps(record) + "\n").encode()
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        out = json.dumps({"response": text}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaHandler)
+    server.requests, server.peers = [], set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def runner(ollama_server, monkeypatch, tmp_path):
+    endpoint = f"http://127.0.0.1:{ollama_server.server_address[1]}"
+    stack = {
+        "policy_version": "test",
+        "providers": {"ollama": {"endpoint": endpoint, "max_connections": 2}},
+        "models": {"local_small": {"id": "tiny", "provider": "ollama"}},
+        "routing_rules": {"default": "local_small"},
+        "response_cache": {"enabled": False, "path": str(tmp_path / "cache.sqlite")},
+    }
+    clients = ProviderClients()
+    monkeypatch.setattr(model_runner, "_StackCache", stack)
+    monkeypatch.setattr(model_runner, "CLIENTS", clients)
+    monkeypatch.setattr(model_runner, "_ClientsConfigured", False)
+    monkeypatch.setattr(model_runner, "_ResponseCache", None)
+    monkeypatch.setattr(model_runner, "_Router", None)
+    yield model_runner
+    clients.close()
+    if model_runner._ResponseCache is not None:
+        model_runner._ResponseCache.close()
+
+
+def test_generate_reuses_pooled_connection(runner, ollama_server):
+    first = runner.generate("discussion", "a")
+    second = runner.generate("discussion", "b")
+    assert (first.status, first.raw_output) == ("success", "echo:a")
+    assert first.connection_reused is False
+    assert second.connection_reused is True
+    assert second.connection_stats["requests"] == 2
+    assert second.connection_stats["connections_opened"] == 1
+    assert second.connection_stats["max_connections"] == 2
+    assert len(ollama_server.peers) == 1
+
+
+def test_provider_connection_cap_across_threads(runner, ollama_server):
+    threads = [threading.Thread(target=runner.generate, args=("discussion", str(i))) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = runner.CLIENTS.stats("ollama")
+    assert stats["requests"] == 8
+    assert stats["connections_opened"] <= 2
+    assert len(ollama_server.peers) <= 2
+
+
+def test_provider_errors_count_rejected_responses(runner, ollama_server):
+    failed = runner.generate("discussion", "fail")
+    assert failed.status == "error" and "HTTP 500" in failed.error_msg
+    assert runner.call_ollama("tiny", "ok") == "echo:ok"
+    with pytest.raises(runner.ModelRunnerError):
+        runner.call_ollama("tiny", "fail")
+    stats = runner.CLIENTS.stats("ollama")
+    assert (stats["requests"], stats["errors"]) == (3, 2)
+
+
+def test_response_cache_opt_in_and_bypass(runner, ollama_server):
+    runner._StackCache["response_cache"]["enabled"] = True
+    first = runner.generate("discussion", "q")
+    second = runner.generate("discussion", "q")
+    assert (first.cache_hit, second.cache_hit) == (False, True)
+    assert second.raw_output == "echo:q"
+    assert second.original_latency_ms == first.latency_ms
+    assert len(ollama_server.requests) == 1
+
+    runner.generate("discussion", "q", cache=False)
+    runner.generate("discussion", "q", sensitivity="high")
+    runner.generate("discussion", "q", temperature=0.7)
+    assert len(ollama_server.requests) == 4
+
+    runner._StackCache["policy_version"] = "next"
+    assert runner.generate("discussion", "q").cache_hit is False
+
+
+def test_response_cache_failure_does_not_fail_generate(runner, ollama_server):
+    runner._StackCache["response_cache"]["enabled"] = True
+    runner.response_cache().close()  # every get/put now raises sqlite3.ProgrammingError
+    receipt = runner.generate("discussion", "q")
+    assert (receipt.status, receipt.raw_output, receipt.cache_hit) == ("success", "echo:q", False)
+
+
+def test_response_cache_lru_and_ttl(tmp_path):
+    cache = ResponseCache(tmp_path / "c.sqlite", max_entries=2)
+    cache.put("a", "A", latency_ms=1)
+    cache.put("b", "B", latency_ms=1)
+    assert cache.get("a")["output"] == "A"
+    cache.put("c", "C", latency_ms=1)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+    cache.ttl_seconds = -1
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 1
+    cache.close()
+
+
+def test_generate_stream_yields_chunks_and_timing(runner, ollama_server):
+    stream = runner.generate_stream("discussion", "one two three")
+    chunks = list(stream)
+    assert chunks == ["echo:one", " two", " three"]
+    receipt = stream.receipt
+    assert receipt.status == "success" and receipt.raw_output == "echo:one two three"
+    assert (receipt.input_tokens, receipt.output_tokens) == (3, 3)
+    assert receipt.ttft_ms is not None and receipt.ttft_ms <= receipt.latency_ms
+    assert receipt.tokens_per_sec and receipt.tokens_per_sec > 0
+
+    early = runner.generate_stream("discussion", "a b c")
+    assert next(early) == "echo:a"
+    early.close()
+    assert early.receipt.status == "error" and early.text == "echo:a"
+    assert runner.generate("discussion", "after close").raw_output == "echo:after close"
+
+
+def test_generate_many_keeps_order_and_caps_concurrency(runner, ollama_server):
+    batch = runner.generate_many(
+        [{"task_type": "discussion", "prompt": f"p{i}"} for i in range(6)] + [{"task_type": "discussion", "prompt": "x", "temperature": 0.5}],
+        max_concurrency_per_provider={"ollama": 2},
+    )
+    assert [r.raw_output for r in batch.receipts] == [f"echo:p{i}" for i in range(6)] + ["echo:x"]
+    summary = batch.summary
+    assert (summary["requests"], summary["succeeded"], summary["errors"]) == (7, 7, 0)
+    assert summary["providers"]["ollama"] == {"requests": 7, "errors": 0, "max_concurrency": 2}
+    assert summary["requests_per_sec"] > 0
+    assert len(ollama_server.peers) <= 2
+
+    runner._StackCache["models"] = {}
+    failed = runner.generate_many([{"task_type": "discussion", "prompt": "y"}])
+    assert failed.receipts[0].status == "error" and failed.summary["errors"] == 1
+
+
+def test_generate_many_per_request_timeout(runner, ollama_server):
+    batch = runner.generate_many([
+        {"task_type": "discussion", "prompt": "slow"},
+        {"task_type": "discussion", "prompt": "fast"},
+        {"task_type": "discussion", "prompt": "slow but patient", "timeout": 5.0},
+    ], timeout=0.2)
+    slow, fast, patient = batch.receipts
+    assert slow.status == "error" and "timed out" in slow.error_msg.lower()
+    assert (fast.status, fast.raw_output) == ("success", "echo:fast")
+    assert (patient.status, patient.raw_output) == ("success", "echo:slow but patient")
+    assert batch.summary["providers"]["ollama"]["errors"] == 1
+
+
+def test_generate_many_mixed_providers(runner, ollama_server):
+    runner._StackCache["models"]["remote_tier"] = {"id": "remote", "provider": "cloud-llm"}
+    runner._StackCache["routing_rules"]["by_task_type"] = {"analysis": "remote_tier"}
+    batch = runner.generate_many(
+        [{"task_type": "analysis" if i % 2 else "discussion", "prompt": f"p{i}"} for i in range(6)],
+        max_concurrency_per_provider={"cloud-llm": 1},
+    )
+    outputs = [r.raw_output for r in batch.receipts]
+    assert outputs[0::2] == ["echo:p0", "echo:p2", "echo:p4"]
+    assert outputs[1::2] == ["[REMOTE_STUB:remote] p1", "[REMOTE_STUB:remote] p3", "[REMOTE_STUB:remote] p5"]
+    assert [r.provider for r in batch.receipts] == ["ollama", "cloud-llm"] * 3
+    assert batch.summary["providers"] == {
+        "ollama": {"requests": 3, "errors": 0, "max_concurrency": 2},
+        "cloud-llm": {"requests": 3, "errors": 0, "max_concurrency": 1},
+    }
+    assert len(ollama_server.requests) == 3
+
+
+def test_lazy_globals_are_built_once_across_threads(runner):
+    runner._StackCache["response_cache"]["enabled"] = True
+    runner._StackCache["routing_rules"]["adaptive"] = {"enabled": True}
+    barrier = threading.Barrier(8)
+    seen = []
+
+    def first_use():
+        barrier.wait()
+        seen.append((runner.adaptive_router(), runner.response_cache()))
+
+    threads = [threading.Thread(target=first_use) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len({id(router) for router, _ in seen}) == 1
+    assert len({id(cache) for _, cache in seen}) == 1
+
+
+def test_adaptive_router_ranks_by_expected_latency():
+    router = AdaptiveRouter(min_samples=2, error_penalty_ms=2000)
+    key, decision = router.choose("large", ["large", "small"])
+    assert key == "large" and "fewer than 2" in decision["reason"]
+    for _ in range(2):
+        router.record("large", model_runner.ModelReceipt(0, "m", "ollama", 0, 0, 900, 0.0, "success", ""))
+        router.record("small", model_runner.ModelReceipt(0, "m", "ollama", 0, 0, 100, 0.0, "success", ""))
+    assert router.choose("large", ["large", "small"])[0] == "small"
+    router.begin("small")
+    router.begin("small")
+    router.record("small", model_runner.ModelReceipt(0, "m", "ollama", 0, 0, 100, 0.0, "error", ""))
+    key, decision = router.choose("large", ["large", "small"])
+    assert key == "large"
+    assert decision["candidates"]["small"]["in_flight"] == 2
+    assert decision["candidates"]["small"]["expected_ms"] == round(100 * 3 + 2000 / 3, 1)
+
+
+def test_adaptive_routing_respects_high_sensitivity(runner, ollama_server):
+    stack = runner._StackCache
+    stack["models"].update({
+        "local_large": {"id": "big", "provider": "ollama"},
+        "remote_tier": {"id": "remote", "provider": "cloud-llm"},
+    })
+    stack["routing_rules"] = {
+        "default": "local_large",
+        "overrides": {"high_sensitivity": {"allow_remote": False, "fallback": "local_large"}},
+        "adaptive": {
+            "enabled": True,
+            "min_samples": 2,
+            "alternatives": {"local_large": ["remote_tier", "local_small"]},
+        },
+    }
+    router = runner.adaptive_router()
+    for _ in range(2):
+        router.end("local_large", 5000)
+        router.end("local_small", 50)
+        router.end("remote_tier", 1)
+
+    normal = runner.generate("governance", "n")
+    assert normal.model_key == "remote_tier"
+    assert normal.routing["static_key"] == "local_large"
+    assert normal.routing["reason"].startswith("rerouted to 'remote_tier'")
+
+    high = runner.generate("governance", "h", sensitivity="high")
+    assert (high.model_key, high.model_id, high.raw_output) == ("local_small", "tiny", "echo:h")
+    assert high.routing["excluded"] == {"remote_tier": "remote model not allowed under high sensitivity"}
+    assert runner.adaptive_router().estimate("local_small")["samples"] == 3
+    assert runner.adaptive_router().estimate("local_small")["in_flight"] == 0
+
+
+def test_generate_many_runs_rerouted_calls_in_the_routed_pool(runner, ollama_server):
+    stack = runner._StackCache
+    stack["models"].update({
+        "local_large": {"id": "big", "provider": "ollama"},
+        "remote_tier": {"id": "remote", "provider": "cloud-llm"},
+    })
+    stack["routing_rules"] = {
+        "default": "local_large",
+        "adaptive": {"enabled": True, "min_samples": 1, "alternatives": {"local_large": ["remote_tier"]}},
+    }
+    router = runner.adaptive_router()
+    router.end("local_large", 5000)
+    router.end("remote_tier", 1)
+
+    batch = runner.generate_many([{"task_type": "governance", "prompt": f"p{i}"} for i in range(3)])
+    assert [(r.model_key, r.provider) for r in batch.receipts] == [("remote_tier", "cloud-llm")] * 3
+    assert batch.summary["providers"] == {"cloud-llm": {"requests": 3, "errors": 0, "max_concurrency": 4}}
+    assert ollama_server.requests == []
+
+
+def test_generate_many_counts_routed_requests_as_in_flight(runner, ollama_server):
+    stack = runner._StackCache
+    stack["models"]["local_large"] = {"id": "big", "provider": "ollama"}
+    stack["routing_rules"] = {
+        "default": "local_large",
+        "adaptive": {"enabled": True, "min_samples": 1, "alternatives": {"local_large": ["local_small"]}},
+    }
+    router = runner.adaptive_router()
+    router.end("local_large", 100)
+    router.end("local_small", 150)
+
+    batch = runner.generate_many([{"task_type": "governance", "prompt": f"p{i}"} for i in range(4)])
+    assert [r.model_key for r in batch.receipts] == ["local_large", "local_small", "local_large", "local_large"]
+    assert batch.receipts[1].routing["candidates"]["local_large"]["in_flight"] == 1
+    assert all(r.status == "success" for r in batch.receipts)
+    assert router.estimate("local_large")["in_flight"] == router.estimate("local_small")["in_flight"] == 0
+
+    with pytest.raises(ValueError):
+        runner.generate_many([{"task_type": "governance", "prompt": "p"}], max_concurrency_per_provider=0)
+    assert router.estimate("local_large")["in_flight"] == 0
+
+
+def test_adaptive_in_flight_counts_only_started_streams(runner, ollama_server):
+    runner._StackCache["routing_rules"]["adaptive"] = {"enabled": True}
+    router = runner.adaptive_router()
+    runner.generate_stream("discussion", "dropped")
+    runner.generate_stream("discussion", "closed").close()
+    assert router.estimate("local_small")["in_flight"] == 0
+
+    stream = runner.generate_stream("discussion", "a b")
+    assert next(stream) == "echo:a"
+    assert router.estimate("local_small")["in_flight"] == 1
+    stream.close()
+    assert router.estimate("local_small")["in_flight"] == 0
+    assert ollama_server.requests[-1]["prompt"] == "a b" and len(ollama_server.requests) == 1
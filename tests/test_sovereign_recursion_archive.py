@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from sovereign_recursion.archive import ArchiveKey, RunArchive
+
+
+class TestRunArchive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "archive"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_append_and_read_back_across_segments(self) -> None:
+        archive = RunArchive(self.root, segment_max_bytes=256)
+        for i in range(1, 6):
+            key = ArchiveKey(loop="loop_a", iteration=i, attempt=1)
+            archive.append(key, {"iteration": i, "pad": "x" * 200})
+
+        self.assertGreater(len(list(self.root.glob("pack_*.seg"))), 1)
+
+        reader = RunArchive(self.root)
+        report = reader.get(ArchiveKey(loop="loop_a", iteration=3, attempt=1))
+        self.assertEqual(report["iteration"], 3)
+        self.assertIsNone(reader.get(ArchiveKey(loop="loop_a", iteration=9, attempt=1)))
+        self.assertEqual(len(reader.find(loop="loop_a", kind="run_report")), 5)
+
+    def test_tampered_record_is_rejected(self) -> None:
+        archive = RunArchive(self.root)
+        entry = archive.append(ArchiveKey(loop="l", iteration=1, attempt=1, kind="alert"), {"kind": "HARD_FAIL"})
+
+        seg = self.root / entry.segment
+        seg.write_bytes(seg.read_bytes().replace(b"HARD_FAIL", b"SOFT_FAIL"))
+        with self.assertRaises(ValueError):
+            RunArchive(self.root).read_entry(entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from sovereign_recursion.ledger import UniversalLedger
+from sovereign_recursion.loop_runner import ClassificationPolicy, LoopTarget, _SummaryWriter, run_targets
+
+
+class TestLoopTargets(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.targets_path = Path(self.tmp.name) / "targets.json"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _write(self, obj) -> None:
+        self.targets_path.write_text(json.dumps(obj), encoding="utf-8")
+
+    def test_load_targets(self) -> None:
+        self._write(
+            {
+                "targets": [
+                    {"name": "a", "repo_root": self.tmp.name, "ledger": "a.jsonl", "nas_host": "10.0.0.1"},
+                    {"repo_root": self.tmp.name, "ledger": "b.jsonl", "max_retries": 2},
+                ]
+            }
+        )
+        targets = LoopTarget.load_all(self.targets_path)
+        self.assertEqual([t.name for t in targets], ["a", "target_02"])
+        self.assertEqual(targets[0].nas_host, "10.0.0.1")
+        self.assertIsNone(targets[1].nas_host)
+        self.assertEqual(targets[1].max_retries, 2)
+
+    def test_rejects_missing_ledger_and_duplicates(self) -> None:
+        self._write([{"repo_root": self.tmp.name}])
+        with self.assertRaises(ValueError):
+            LoopTarget.load_all(self.targets_path)
+
+        self._write(
+            [
+                {"name": "x", "repo_root": self.tmp.name, "ledger": "1.jsonl"},
+                {"name": "x", "repo_root": self.tmp.name, "ledger": "2.jsonl"},
+            ]
+        )
+        with self.assertRaises(ValueError):
+            LoopTarget.load_all(self.targets_path)
+
+    def test_rejects_unsafe_names_and_shared_ledgers(self) -> None:
+        for name in ("../x", "a/b", "..", ".hidden", "a\\b"):
+            self._write([{"name": name, "repo_root": self.tmp.name, "ledger": "1.jsonl"}])
+            with self.assertRaises(ValueError, msg=name):
+                LoopTarget.load_all(self.targets_path)
+
+        ledger = str(Path(self.tmp.name) / "shared.jsonl")
+        self._write(
+            [
+                {"name": "a", "repo_root": self.tmp.name, "ledger": ledger},
+                {"name": "b", "repo_root": self.tmp.name, "ledger": str(Path(self.tmp.name) / "x" / ".." / "shared.jsonl")},
+            ]
+        )
+        with self.assertRaises(ValueError):
+            LoopTarget.load_all(self.targets_path)
+
+    def test_run_targets_concurrently(self) -> None:
+        root = Path(self.tmp.name)
+        targets = [
+            LoopTarget(name=f"t{i}", repo_root=self.tmp.name, ledger=str(root / f"ledger_{i}.jsonl"))
+            for i in range(3)
+        ]
+        out_root = root / "out"
+        out_root.mkdir()
+        summary = _SummaryWriter(out_root / "loop_summary.jsonl")
+        results = run_targets(
+            targets,
+            max_workers=3,
+            python_exe=sys.executable,
+            out_root=out_root,
+            summary=summary,
+            iterations=1,
+            interval_seconds=0,
+            max_retries=0,
+            rating=None,
+            emit_alerts=False,
+            offline=True,
+            gated=False,
+            policy=ClassificationPolicy.defaults(),
+            policy_path=None,
+            loop_id="concurrent",
+        )
+
+        self.assertEqual(sorted(results), ["t0", "t1", "t2"])
+        for t in targets:
+            self.assertEqual(len(results[t.name]), 1)
+            self.assertTrue((out_root / t.name / "iter_0001" / "attempt_01").is_dir())
+            report = UniversalLedger(t.ledger).verify()
+            self.assertTrue(report.get("ok"), msg=json.dumps(report, indent=2))
+        lines = [json.loads(line) for line in summary.path.read_text(encoding="utf-8").splitlines()]
+        self.assertEqual(sorted(e["target"] for e in lines if e.get("kind") == "target_end"), ["t0", "t1", "t2"])
+
+        with self.assertRaises(ValueError):
+            run_targets(targets + [LoopTarget(name="t3", repo_root=self.tmp.name, ledger=targets[0].ledger)],
+                        max_workers=2, python_exe=sys.executable, out_root=out_root, summary=summary,
+                        max_retries=0, rating=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
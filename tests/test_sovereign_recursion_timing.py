@@ -0,0 +1,33 @@
+import unittest
+
+from sovereign_recursion.timing import StageTimer, aggregate_timings, percentile
+
+
+class TestStageTiming(unittest.TestCase):
+    def test_spans_and_stage_counts(self) -> None:
+        timer = StageTimer()
+        for _ in range(3):
+            with timer.span("ledger_append"):
+                pass
+        with timer.span("check.meta"):
+            pass
+
+        d = timer.to_dict()
+        self.assertEqual(len(d["spans"]), 4)
+        self.assertEqual(d["stages"]["ledger_append"]["count"], 3)
+        for span in d["spans"]:
+            self.assertGreaterEqual(span["end_monotonic"], span["start_monotonic"])
+
+    def test_percentiles_across_runs(self) -> None:
+        self.assertEqual(percentile([5.0, 1.0, 3.0, 2.0, 4.0], 50), 3.0)
+        self.assertEqual(percentile([5.0, 1.0, 3.0, 2.0, 4.0], 95), 5.0)
+
+        runs = [{"stages": {"engine_run": {"count": 1, "total_ms": float(ms)}}} for ms in range(1, 21)]
+        agg = aggregate_timings(runs)
+        self.assertEqual(agg["engine_run"]["runs"], 20)
+        self.assertEqual(agg["engine_run"]["p50_ms"], 10.0)
+        self.assertEqual(agg["engine_run"]["p95_ms"], 19.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
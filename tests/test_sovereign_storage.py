@@ -0,0 +1,688 @@
+import io
+import json
+import mmap
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sovereign_os.phase1.benchmarks import bench_startup, bench_suite_case, compare_suites
+from sovereign_os.phase1.blob_store import BlobStore
+from sovereign_os.phase1.ingest import ingest_jsonl
+from sovereign_os.phase1.lineage_store import LineageStore
+from sovereign_os.phase1.merkle_index import MerkleIndex, leaf_hash, verify_inclusion
+from sovereign_os.phase1.resource_frames import iter_frames, open_frames, read_frames
+from sovereign_os.phase1.signing import Signer
+from sovereign_os.phase1.sovereign_resource import AccessLevel, SovereignResource, ResourceType, _sha3_stream
+from sovereign_os.phase1.sovereign_storage import (
+    ConstitutionalViolationError,
+    FractalGraph,
+    FractalIntegrityError,
+    SovereignStorage,
+    StoragePolicy,
+    StorageReceipt,
+)
+
+
+def _resource(i: int) -> SovereignResource:
+    return SovereignResource(
+        resource_type=ResourceType.DOCUMENT,
+        data=f"doc-{i}".encode(),
+        metadata={"self_attested": True},
+        governance_template="test",
+        resource_id=f"res-{i}",
+    )
+
+
+def _write_policy(directory: Path) -> tuple:
+    constitution = directory / "baseline.yaml"
+    constitution.write_text("version: '1.2'\nprinciples: []\ngovernance_model: recursive\n", encoding="utf-8")
+    guardrails = directory / "guardrails.yaml"
+    guardrails.write_text("public_write_restrictions:\n  quorum_size: 3\n", encoding="utf-8")
+    return str(constitution), str(guardrails)
+
+
+class TestFractalGraphJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _build(self, graph: FractalGraph, n: int) -> list:
+        ids = [graph.add_resource(_resource(0))]
+        for i in range(1, n):
+            ids.append(graph.add_resource(_resource(i), parent_id=ids[-1]))
+        return ids
+
+    def test_reload_replays_journal(self) -> None:
+        graph = FractalGraph(evidence_path=str(self.path))
+        ids = self._build(graph, 5)
+        graph.close()
+
+        reloaded = FractalGraph(evidence_path=str(self.path))
+        self.assertEqual(reloaded.graph.number_of_nodes(), 5)
+        self.assertEqual(reloaded.graph.nodes[ids[-1]]["lineage_depth"], 4)
+        self.assertEqual(
+            reloaded.graph.nodes[ids[2]]["constitutional_hash"],
+            graph.graph.nodes[ids[2]]["constitutional_hash"],
+        )
+        reloaded.close()
+
+    def test_compaction_and_torn_tail(self) -> None:
+        graph = FractalGraph(evidence_path=str(self.path), snapshot_interval=4)
+        ids = self._build(graph, 5)
+        graph.close()
+        self.assertTrue((self.path / "lineage.json").exists())
+
+        journal = self.path / FractalGraph.JOURNAL_FILE
+        journal.write_bytes(journal.read_bytes() + b'{"op":"node","id":"x')
+
+        reloaded = FractalGraph(evidence_path=str(self.path))
+        self.assertEqual(reloaded.graph.number_of_nodes(), 5)
+        reloaded.add_resource(_resource(99), parent_id=ids[-1])
+        reloaded.close()
+
+        again = FractalGraph(evidence_path=str(self.path))
+        self.assertEqual(again.graph.number_of_nodes(), 6)
+        again.close()
+
+    def test_registry_survives_restart_with_bounded_cache(self) -> None:
+        graph = FractalGraph(evidence_path=str(self.path), registry_cache_size=2)
+        ids = self._build(graph, 5)
+        self.assertLessEqual(graph.resource_registry.stats()["cached"], 2)
+        expected = graph.resource_registry[ids[3]].constitutional_hash
+        graph.close()
+
+        reloaded = FractalGraph(evidence_path=str(self.path), registry_cache_size=2)
+        self.assertEqual(len(reloaded.resource_registry), 5)
+        self.assertEqual(reloaded.resource_registry.stats()["cached"], 0)
+        resource = reloaded.resource_registry.get(ids[3])
+        self.assertEqual(resource.constitutional_hash, expected)
+        self.assertEqual(resource.compute_constitutional_hash(), expected)
+        for rid in ids:
+            reloaded.resource_registry.get(rid)
+        self.assertEqual(reloaded.resource_registry.stats()["cached"], 2)
+        self.assertIsNone(reloaded.resource_registry.get("missing"))
+        reloaded.close()
+
+
+class TestVerifiableSubsetCache(unittest.TestCase):
+    def test_cached_subset_matches_recomputation_and_tracks_reembedding(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            graph = FractalGraph(evidence_path=tmp)
+            ids = [graph.add_resource(_resource(0))]
+            for i in range(1, 6):
+                ids.append(graph.add_resource(_resource(i), parent_id=ids[-1]))
+
+            first = graph.get_verifiable_subset(ids[-1])
+            self.assertEqual(first["merkle_root"], FractalGraph._merkle_root(first["lineage"]))
+            second = graph.get_verifiable_subset(ids[-1])
+            self.assertEqual(second["lineage"], first["lineage"])
+            self.assertEqual(graph.subset_cache_stats()["hits"], 1)
+
+            # The sibling subset reuses the shared ancestors' leaves.
+            leaves = graph.subset_cache_stats()["leaves"]
+            graph.get_verifiable_subset(ids[-2])
+            self.assertEqual(graph.subset_cache_stats()["leaves"], leaves + 1)
+
+            # Re-embedding a node on the path invalidates exactly the subsets containing it.
+            graph.graph.add_node(ids[-2], constitutional_hash="ff" * 32, lineage_depth=4)
+            third = graph.get_verifiable_subset(ids[-1])
+            self.assertNotEqual(third["merkle_root"], first["merkle_root"])
+            self.assertEqual(third["merkle_root"], FractalGraph._merkle_root(third["lineage"]))
+            hits = graph.subset_cache_stats()["hits"]
+            graph.get_verifiable_subset(ids[-4])
+            graph.get_verifiable_subset(ids[-4])
+            self.assertEqual(graph.subset_cache_stats()["hits"], hits + 1)
+            graph.close()
+
+
+class TestLineageStore(unittest.TestCase):
+    def test_snapshot_round_trip_and_single_parent(self) -> None:
+        store = LineageStore()
+        store.add_node("a", constitutional_hash="ab" * 32, lineage_depth=0)
+        store.add_node("b", constitutional_hash="cd" * 32, lineage_depth=1)
+        store.add_edge("a", "b")
+        with self.assertRaises(ValueError):
+            store.add_edge("c", "b")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store.save(tmp)
+            store.save(tmp)
+            loaded = LineageStore.load(tmp)
+            self.assertEqual(sorted(p.name for p in Path(tmp).glob("lineage_*")), ["lineage_000002"])
+
+        self.assertEqual(loaded.nodes["b"], {"constitutional_hash": "cd" * 32, "lineage_depth": 1})
+        self.assertEqual(list(loaded.predecessors("b")), ["a"])
+        self.assertEqual(list(loaded.edges), [("a", "b")])
+
+    def test_legacy_json_snapshot_is_migrated(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            (path / FractalGraph.STATE_FILE).write_text(json.dumps({
+                "nodes": {
+                    "root": {"constitutional_hash": "11" * 32, "lineage_depth": 0},
+                    "leaf": {"constitutional_hash": "22" * 32, "lineage_depth": 1},
+                },
+                "edges": [{"source": "root", "target": "leaf"}],
+            }))
+
+            graph = FractalGraph(evidence_path=tmp)
+            self.assertEqual(graph.graph.parent_id("leaf"), "root")
+            graph.compact()
+            graph.close()
+            self.assertFalse((path / FractalGraph.STATE_FILE).exists())
+
+            reloaded = FractalGraph(evidence_path=tmp)
+            self.assertEqual(reloaded.graph.nodes["leaf"]["constitutional_hash"], "22" * 32)
+            reloaded.close()
+
+
+class TestFractalGraphBulk(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_bulk_matches_single_inserts(self) -> None:
+        single = FractalGraph(evidence_path=str(self.path / "single"))
+        single.add_resource(_resource(0))
+        for i in range(1, 6):
+            single.add_resource(_resource(i), parent_id=f"res-{(i - 1) // 2}")
+        single.close()
+
+        bulk = FractalGraph(evidence_path=str(self.path / "bulk"))
+        parent_map = {f"res-{i}": f"res-{(i - 1) // 2}" for i in range(1, 6)}
+        bulk.add_resources([_resource(i) for i in range(6)], parent_map)
+        bulk.close()
+
+        for i in range(6):
+            self.assertEqual(
+                bulk.graph.nodes[f"res-{i}"], single.graph.nodes[f"res-{i}"]
+            )
+        reloaded = FractalGraph(evidence_path=str(self.path / "bulk"))
+        self.assertEqual(reloaded.graph.number_of_nodes(), 6)
+        reloaded.close()
+
+    def test_jsonl_ingest_hashes_in_workers_and_matches_bulk(self) -> None:
+        records = [dict(_resource(i).to_dict(), parent_id=f"res-{(i - 1) // 2}" if i else None) for i in range(6)]
+        graph = FractalGraph(evidence_path=str(self.path / "ingest"))
+        self.assertEqual(ingest_jsonl(graph, iter(json.dumps(r) for r in records), workers=1, chunk_size=4), 6)
+
+        bulk = FractalGraph(evidence_path=str(self.path / "bulk"))
+        bulk.add_resources([_resource(i) for i in range(6)], {f"res-{i}": f"res-{(i - 1) // 2}" for i in range(1, 6)})
+        for i in range(6):
+            self.assertEqual(graph.graph.nodes[f"res-{i}"], bulk.graph.nodes[f"res-{i}"])
+        forged = dict(_resource(7).to_dict(), constitutional_hash="ab" * 32)
+        with self.assertRaises(ValueError):
+            ingest_jsonl(graph, iter([json.dumps(forged)]))
+        self.assertNotIn("res-7", graph.graph)
+
+        with self.assertRaises(TypeError):  # digests are never taken from the caller
+            bulk.add_resources([_resource(9)], {"res-9": "res-0"}, data_digests={"res-9": "0" * 64})
+        graph.close()
+        bulk.close()
+
+    def test_out_of_order_batch_is_rejected_without_partial_state(self) -> None:
+        graph = FractalGraph(evidence_path=str(self.path))
+        with self.assertRaises(FractalIntegrityError):
+            graph.add_resources([_resource(1), _resource(0)], {"res-1": "res-0"})
+        self.assertEqual(graph.graph.number_of_nodes(), 0)
+        graph.close()
+
+
+class TestBlobStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_blob_backed_hash_matches_inline_and_dedupes(self) -> None:
+        payload = b"evidence" * 10_000
+        store = BlobStore(self.path / "blobs", chunk_size=16 * 1024)
+
+        inline = SovereignResource(
+            resource_type=ResourceType.BLOB,
+            data=payload,
+            metadata={"self_attested": True},
+            governance_template="test",
+            resource_id="same-id",
+        )
+        streamed = SovereignResource.from_stream(
+            store,
+            io.BytesIO(payload),
+            ResourceType.BLOB,
+            {"self_attested": True},
+            "test",
+            resource_id="same-id",
+        )
+        self.assertEqual(streamed.constitutional_hash, inline.constitutional_hash)
+        self.assertIsInstance(streamed.data, memoryview)
+        self.assertEqual(bytes(streamed.data), payload)
+        self.assertTrue(store.verify(streamed.blob_ref))
+
+        chunk_files = list((self.path / "blobs" / "chunks").rglob("*"))
+        store.put_bytes(payload)
+        self.assertEqual(chunk_files, list((self.path / "blobs" / "chunks").rglob("*")))
+
+        restored = SovereignResource.from_dict(streamed.to_dict(), blob_store=store)
+        self.assertNotIn("data_b64", streamed.to_dict())
+        self.assertEqual(restored.compute_constitutional_hash(), inline.constitutional_hash)
+
+    def test_multi_chunk_view_is_mmap_backed(self) -> None:
+        payload = bytes(range(256)) * 200
+        store = BlobStore(self.path / "blobs", chunk_size=16 * 1024)
+        ref = store.put_bytes(payload)
+        self.assertEqual(len(ref.chunks), 4)
+
+        view = store.view(ref)
+        self.assertIsInstance(view.obj, mmap.mmap)
+        self.assertEqual(bytes(view), payload)
+        payload_file = self.path / "blobs" / "payloads" / ref.digest[:2] / ref.digest
+        mtime = payload_file.stat().st_mtime_ns
+        self.assertEqual(bytes(store.view(ref)), payload)
+        self.assertEqual(payload_file.stat().st_mtime_ns, mtime)
+
+    def test_graph_moves_large_payloads_to_store(self) -> None:
+        graph = FractalGraph(evidence_path=str(self.path), blob_threshold=1024)
+        small = graph.add_resource(_resource(0))
+        big = SovereignResource(
+            resource_type=ResourceType.BLOB,
+            data=b"x" * 4096,
+            metadata={"self_attested": True},
+            governance_template="test",
+        )
+        before = big.constitutional_hash
+        graph.add_resource(big, parent_id=small)
+        self.assertIsNone(graph.resource_registry[small].blob_ref)
+        self.assertIsNotNone(big.blob_ref)
+        self.assertEqual(graph.graph.nodes[big.resource_id]["constitutional_hash"], big.constitutional_hash)
+        self.assertNotEqual(before, big.constitutional_hash)  # parent governance embedded
+        self.assertEqual(big.compute_constitutional_hash(), big.constitutional_hash)
+        graph.close()
+
+    def test_data_digest_is_hashed_once_and_streamed_from_files(self) -> None:
+        payload = b"evidence" * 10_000
+        source = self.path / "payload.bin"
+        source.write_bytes(payload)
+
+        with mock.patch("sovereign_os.phase1.sovereign_resource._sha3_stream", wraps=_sha3_stream) as hashed:
+            mapped = SovereignResource.from_file(source, ResourceType.BLOB, {}, "test", resource_id="same-id")
+            mapped.embed_parent_governance("ab" * 32, 1)
+            mapped.embed_parent_governance("cd" * 32, 2)
+            self.assertEqual(hashed.call_count, 1)
+
+            mapped.data = b"other"
+            self.assertFalse(mapped.data_digest_cached)
+            mapped.data_digest()
+            self.assertEqual(hashed.call_count, 2)
+
+        inline = SovereignResource(ResourceType.BLOB, payload, {}, "test", resource_id="same-id")
+        inline.embed_parent_governance("cd" * 32, 2)
+        self.assertEqual(_sha3_stream(memoryview(payload), chunk_size=4096), inline.data_digest())
+        stored = SovereignResource.from_file(source, ResourceType.BLOB, {}, "test", "same-id", BlobStore(self.path / "blobs"))
+        stored.embed_parent_governance("cd" * 32, 2)
+        self.assertEqual(stored.constitutional_hash, inline.constitutional_hash)
+        self.assertFalse(hasattr(inline, "__dict__"))
+        with self.assertRaises(TypeError):  # payload digests are never taken from callers
+            inline.embed_parent_governance("cd" * 32, 2, data_sha3_256="11" * 32)
+
+
+class TestResourceFrames(unittest.TestCase):
+    def test_subgraph_round_trip_preserves_hashes_and_rejects_damage(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            source = FractalGraph(evidence_path=str(path / "source"), blob_threshold=1024)
+            root = source.add_resource(_resource(0))
+            mid = source.add_resource(_resource(1), parent_id=root)
+            big = SovereignResource(ResourceType.BLOB, b"x" * 4096, {"self_attested": True}, "test", resource_id="big")
+            source.add_resource(big, parent_id=mid)
+            source.add_resource(_resource(3), parent_id=mid)
+            source.add_resource(_resource(4), parent_id=root)  # sibling branch, not exported
+
+            export = path / "mid.svrf"
+            self.assertEqual(source.export_subgraph(export, mid), 4)
+            frames = list(open_frames(export))
+            self.assertEqual([f.resource_id for f in frames][:2], [root, mid])
+            self.assertIsInstance(frames[2].data, memoryview)
+
+            target = FractalGraph(evidence_path=str(path / "target"))
+            self.assertEqual(sorted(target.import_subgraph(export)), sorted([root, mid, "big", "res-3"]))
+            for rid in (root, mid, "big", "res-3"):
+                self.assertEqual(target.graph.nodes[rid], source.graph.nodes[rid])
+            self.assertEqual(bytes(target.resource_registry["big"].data), b"x" * 4096)
+            self.assertEqual(target.import_subgraph(export), [])
+
+            damaged = bytearray(export.read_bytes())
+            damaged[-46] ^= 1  # last payload byte, just before the end record
+            with self.assertRaises(ValueError):
+                [f.to_resource() for f in iter_frames(damaged)]
+            with self.assertRaises(ValueError):
+                list(read_frames(io.BytesIO(export.read_bytes()[:-10])))
+            source.close()
+            target.close()
+
+
+class TestGraphMerkleIndex(unittest.TestCase):
+    def test_every_prefix_root_and_proof_verifies(self) -> None:
+        index = MerkleIndex()
+        leaves = []
+        for n in range(1, 34):
+            leaves.append(leaf_hash(f"res-{n}", "ab" * 32, n))
+            index.append(leaves[-1])
+            for i in range(n):
+                proof = index.inclusion_proof(i)
+                self.assertTrue(verify_inclusion(leaves[i], i, n, proof, index.root()))
+                if n > 1:
+                    self.assertFalse(verify_inclusion(leaves[i - 1], i, n, proof, index.root()))
+
+        before = index.root()
+        index.update(7, leaf_hash("res-7", "cd" * 32, 7))
+        self.assertNotEqual(index.root(), before)
+        self.assertTrue(verify_inclusion(index.leaf(7), 7, len(index), index.inclusion_proof(7), index.root()))
+
+    def test_authorization_carries_verifiable_graph_proof(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            storage = SovereignStorage(constitution, guardrails, evidence_path=str(path / "evidence"))
+            ids = [storage.graph.add_resource(_resource(0))]
+            for i in range(1, 12):
+                ids.append(storage.graph.add_resource(_resource(i), parent_id=ids[(i - 1) // 3]))
+
+            package = storage.generate_read_authorization(ids[5], {"surface": "test"}, include_graph_proof=True)
+            inclusion = package["graph_inclusion"]
+            self.assertEqual(inclusion["tree_size"], 13)
+            self.assertLessEqual(len(inclusion["audit_path"]), 4)
+            self.assertTrue(SovereignStorage.verify_graph_inclusion(inclusion, storage.public_key_pem))
+
+            # Incremental maintenance matches a from-scratch rebuild.
+            storage.graph.add_resource(_resource(99), parent_id=ids[-1])
+            rebuilt = FractalGraph(evidence_path=str(path / "evidence"))
+            self.assertEqual(rebuilt.graph_root(), storage.graph.graph_root())
+            rebuilt.close()
+
+            tampered = dict(inclusion, lineage_depth=inclusion["lineage_depth"] + 1)
+            self.assertFalse(SovereignStorage.verify_graph_inclusion(tampered, storage.public_key_pem))
+            storage.close()
+
+
+class TestWarmStart(unittest.TestCase):
+    def test_restart_reuses_key_and_genesis_and_writes_nothing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            evidence = path / "evidence"
+            key = path / "keys" / "storage_root.pem"
+
+            temporary = SovereignStorage(constitution, guardrails, storage_key_path=str(key), evidence_path=str(path / "scratch"))
+            temporary.close()
+            self.assertFalse(key.exists())  # a missing key path means a temporary key unless persist_key
+
+            cold = SovereignStorage(
+                constitution, guardrails, storage_key_path=str(key), evidence_path=str(evidence), persist_key=True,
+            )
+            self.assertEqual(key.stat().st_mode & 0o777, 0o600)
+            child = cold.graph.add_resource(_resource(1), parent_id=cold.genesis_id)
+            cold.close()
+            before = {p.name: p.stat().st_size for p in evidence.iterdir() if p.is_file()}
+
+            warm = SovereignStorage(constitution, guardrails, storage_key_path=str(key), evidence_path=str(evidence))
+            self.assertEqual(warm.genesis_id, cold.genesis_id)
+            self.assertEqual(warm.public_key_pem, cold.public_key_pem)
+            self.assertEqual(warm.graph.graph.number_of_nodes(), 2)
+            self.assertIsNone(warm.policy._guardrails)
+            warm.close()
+            self.assertEqual({p.name: p.stat().st_size for p in evidence.iterdir() if p.is_file()}, before)
+
+            warm = SovereignStorage(constitution, guardrails, storage_key_path=str(key), evidence_path=str(evidence))
+            package = warm.generate_read_authorization(child, {})
+            self.assertEqual(warm.policy.guardrails["public_write_restrictions"]["quorum_size"], 3)
+            self.assertEqual(package["resource_id"], child)
+            warm.close()
+
+            # A different root key cannot adopt the recorded genesis.
+            rekeyed = SovereignStorage(constitution, guardrails, evidence_path=str(evidence))
+            self.assertNotEqual(rekeyed.genesis_id, cold.genesis_id)
+            rekeyed.close()
+
+    def test_warm_start_stays_flat_as_the_graph_grows(self) -> None:
+        small, large = bench_startup(500, rounds=3), bench_startup(20_000, rounds=3)
+        for phase in ("warm_journal_seconds", "warm_snapshot_seconds"):
+            self.assertLess(large[phase], 0.5)
+            self.assertLess(large[phase], small[phase] * 10 + 0.1)
+
+
+class TestSigners(unittest.TestCase):
+    def test_ed25519_batch_authorizations_verify(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            storage = SovereignStorage(constitution, guardrails, evidence_path=str(path / "evidence"), key_type="ed25519")
+            ids = [storage.graph.add_resource(_resource(i)) for i in range(6)]
+
+            packages = storage.generate_read_authorizations([(rid, {"n": i}) for i, rid in enumerate(ids)], workers=2)
+            self.assertEqual([p["resource_id"] for p in packages], ids)
+            self.assertTrue(all(p["key_type"] == "ed25519" for p in packages))
+
+            receipt = storage.verify_read_completion({"verifications": {"self_attestation": True}}, packages[3])
+            self.assertEqual(receipt.key_type, "ed25519")
+
+            forged = dict(packages[0], key_type="ecdsa-p384")
+            with self.assertRaises(ConstitutionalViolationError):
+                storage.verify_read_completion({}, forged)
+            storage.close()
+
+    def test_signer_pool_is_reused_across_batches_and_skipped_for_small_ones(self) -> None:
+        signer = Signer.generate("ed25519")
+        payloads = [f"p{i}".encode() for i in range(8)]
+        signer.sign_many(payloads, workers=2)
+        self.assertIsNone(signer._pool)  # below parallel_min_batch: signed in-process
+
+        signer.parallel_min_batch = 4
+        first = signer.sign_many(payloads, workers=2)
+        pool = signer._pool
+        self.assertIsNotNone(pool)
+        second = signer.sign_many(payloads, workers=2)
+        checks = [(p, sig, "ed25519") for p, sig in zip(payloads, first)]
+        self.assertEqual(signer.verify_many(checks + [(b"x", first[0], None)], workers=2), [True] * 8 + [False])
+        self.assertIs(signer._pool, pool)
+        self.assertTrue(all(signer.verify(p, sig) for p, sig in zip(payloads, second)))
+        signer.close()
+        self.assertIsNone(signer._pool)
+
+
+class TestAuthorizationCache(unittest.TestCase):
+    def test_only_nonce_timestamp_and_signature_are_fresh_on_hit(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            storage = SovereignStorage(constitution, guardrails, evidence_path=str(path / "evidence"), auth_cache_size=1)
+            a = storage.graph.add_resource(_resource(1))
+            b = storage.graph.add_resource(_resource(2), parent_id=a)
+
+            first = storage.generate_read_authorization(b, {})
+            second = storage.generate_read_authorization(b, {})
+            self.assertEqual(storage.auth_cache_stats()["hits"], 1)
+            self.assertNotEqual(first["constraints"]["nonce"], second["constraints"]["nonce"])
+            strip = lambda c: {k: v for k, v in c.items() if k not in ("nonce", "timestamp")}
+            self.assertEqual(strip(first["constraints"]), strip(second["constraints"]))
+            storage.verify_read_completion({"verifications": {"self_attestation": True}}, second)
+
+            storage.generate_read_authorization(a, {})
+            self.assertEqual(storage.auth_cache_stats()["evictions"], 1)
+
+            storage.policy.constitution["version"] = "2.0"
+            third = storage.generate_read_authorization(a, {})
+            self.assertEqual(third["constraints"]["constitutional_version"], "2.0")
+            self.assertEqual(storage.auth_cache_stats()["misses"], 3)
+            storage.close()
+
+
+class TestPolicyCompliance(unittest.TestCase):
+    def test_batch_compliance_matches_single_and_follows_guardrails(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            policy = StoragePolicy(*_write_policy(Path(tmp)))
+            constraints = [
+                policy.generate_constraints(op, ResourceType.DOCUMENT, {"access_level": AccessLevel.PUBLIC, "self_attested": attested})
+                for op in ("read", "write", "create", "delete")
+                for attested in (False, True)
+            ]
+            results = [
+                {"verifications": {"self_attestation": i % 2 == 0}, "approvals": ["a"] * (i % 4), "evidence_logged": i % 3 == 0}
+                for i in range(len(constraints))
+            ]
+            expected = [policy.verify_compliance(r, c) for r, c in zip(results, constraints)]
+            self.assertEqual(policy.verify_compliance_many(results, constraints), expected)
+
+            public_write = ("write", ResourceType.DOCUMENT, {"access_level": AccessLevel.PUBLIC})
+            self.assertEqual(policy.generate_constraints(*public_write)["constraints"][1]["quorum_size"], 3)
+            policy.guardrails = {"public_write_restrictions": {"quorum_size": 5}}
+            self.assertEqual(policy.generate_constraints(*public_write)["constraints"][1]["quorum_size"], 5)
+
+
+class TestBatchVerification(unittest.TestCase):
+    def test_batch_reports_per_item_errors_and_matches_single_path(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            storage = SovereignStorage(constitution, guardrails, evidence_path=str(path / "evidence"))
+            attested = storage.graph.add_resource(_resource(1))
+            unattested = storage.graph.add_resource(SovereignResource(
+                resource_type=ResourceType.DOCUMENT, data=b"x", metadata={}, governance_template="test",
+            ))
+            good = storage.generate_read_authorization(attested, {})
+            needs_proof = storage.generate_read_authorization(unattested, {})
+            ok_result = {"verifications": {"self_attestation": True}}
+
+            completions = [
+                (ok_result, good),
+                ({}, needs_proof),
+                (ok_result, dict(good, resource_id=unattested)),
+                (ok_result, {k: v for k, v in good.items() if k != "signature"}),
+                (ok_result, needs_proof),
+            ] * 3
+            results = storage.verify_read_completions(completions, workers=2)
+
+            self.assertEqual(len(results), 15)
+            for (execution_result, package), outcome in zip(completions, results):
+                try:
+                    expected = storage.verify_read_completion(execution_result, package)
+                except ConstitutionalViolationError as exc:
+                    self.assertIsInstance(outcome, ConstitutionalViolationError)
+                    self.assertEqual(str(outcome), str(exc))
+                else:
+                    self.assertEqual(outcome.resource_id, expected.resource_id)
+                    self.assertTrue(storage.signer.verify(
+                        package["constitutional_hash"].encode(), outcome.storage_root_signature
+                    ))
+
+            log = (path / "evidence" / "storage_operations.jsonl").read_text(encoding="utf-8").splitlines()
+            stamps = {json.loads(line)["timestamp"] for line in log[:6]}
+            self.assertEqual(len(stamps), 1)  # the six batch receipts were logged in one write
+            storage.close()
+
+    def test_malformed_items_fail_only_their_own_slot(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            storage = SovereignStorage(*_write_policy(path), evidence_path=str(path / "evidence"))
+            rid = storage.graph.add_resource(_resource(1))
+            good = storage.generate_read_authorization(rid, {})
+            ok_result = {"verifications": {"self_attestation": True}}
+
+            results = storage.verify_read_completions([
+                (ok_result, good),
+                42,
+                (ok_result, "not a package"),
+                (None, good),
+                (ok_result, good, "extra"),
+                (ok_result, dict(good, signature=123)),
+                (ok_result, good),
+            ])
+            self.assertIsInstance(results[0], StorageReceipt)
+            self.assertIsInstance(results[1], TypeError)
+            self.assertIsInstance(results[2], ValueError)
+            self.assertIsInstance(results[3], AttributeError)
+            self.assertIsInstance(results[4], ValueError)
+            self.assertIsInstance(results[5], ConstitutionalViolationError)
+            self.assertIsInstance(results[6], StorageReceipt)
+            storage.close()
+
+
+class TestBatchedReceipts(unittest.TestCase):
+    def test_batched_receipts_verify_independently_with_one_log_line_per_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            storage = SovereignStorage(
+                constitution, guardrails, evidence_path=str(path / "evidence"),
+                receipt_batch_ops=4, receipt_batch_ms=0,
+            )
+            rid = storage.graph.add_resource(_resource(1))
+            package = storage.generate_read_authorization(rid, {})
+            result = {"verifications": {"self_attestation": True}}
+
+            futures = [storage.submit_read_completion(result, package) for _ in range(5)]
+            self.assertTrue(all(f.done() for f in futures[:4]))
+            self.assertFalse(futures[4].done())
+            self.assertEqual(storage.flush_receipts(), 1)
+
+            receipts = [f.result().to_dict() for f in futures]
+            self.assertEqual([r["batch"]["batch_size"] for r in receipts], [4, 4, 4, 4, 1])
+            for r in receipts:
+                self.assertTrue(SovereignStorage.verify_batched_receipt(r, storage.public_key_pem))
+            self.assertFalse(SovereignStorage.verify_batched_receipt(
+                dict(receipts[1], resource_id="other"), storage.public_key_pem
+            ))
+
+            log = (path / "evidence" / "storage_operations.jsonl").read_text(encoding="utf-8").splitlines()
+            batches = [json.loads(line) for line in log if '"read_verified_batch"' in line]
+            self.assertEqual([b["details"]["count"] for b in batches], [4, 1])
+            storage.close()
+
+    def test_batched_receipt_commits_to_the_authorized_resource_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)
+            constitution, guardrails = _write_policy(path)
+            storage = SovereignStorage(
+                constitution, guardrails, evidence_path=str(path / "evidence"),
+                receipt_batch_ops=2, receipt_batch_ms=0,
+            )
+            rid = storage.graph.add_resource(_resource(1))
+            package = storage.generate_read_authorization(rid, {})
+            result = {"verifications": {"self_attestation": True}}
+
+            futures = [storage.submit_read_completion(result, package) for _ in range(2)]
+            receipt = futures[0].result().to_dict()
+            self.assertEqual(receipt["package_hash"], package["constitutional_hash"])
+            self.assertTrue(SovereignStorage.verify_batched_receipt(receipt, storage.public_key_pem))
+            for tampered in (
+                dict(receipt, package_hash="0" * 64),
+                dict(receipt, package_hash=None),
+                dict(receipt, fractal_depth=receipt["fractal_depth"] + 1),
+            ):
+                self.assertFalse(SovereignStorage.verify_batched_receipt(tampered, storage.public_key_pem))
+            storage.close()
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_suite_case_reports_every_metric_and_compares(self) -> None:
+        result = bench_suite_case("mixed", 200, samples=20)
+        self.assertEqual(result["samples"], 20)
+        for metric in ("add_resource_per_second", "authorization_per_second", "verify_per_second", "startup_seconds"):
+            self.assertGreater(result[metric], 0)
+        with self.assertRaises(ValueError):
+            bench_suite_case("spiral", 10)
+
+        rows = compare_suites({"results": [result]}, {"results": [result]})
+        self.assertEqual(rows[0]["ratio"]["subset_per_second.cold"], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()